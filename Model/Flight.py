@@ -1,71 +1,48 @@
 from Model.Airline import *
 from Service.determine_holidays import exist_holidays
 from Service.determine_tourist_attraction import *
-from Service.stops_estimation import estimate_stops, choose_aircraft
+from Service.settings_service import get_pricing_config
+from Service.stops_estimation import get_route_profile
 from datetime import datetime
 
 from constants.Airline_Specific_Constants.Base_Aircraft_Cost import BASE_AIRCRAFT_COST
 from constants.Airline_Specific_Constants.Base_Seat_Cost import BASE_SEAT_PRICE
 from constants.Airline_Specific_Constants.Seat_Types import SeatTypes
-import os
-import json
-from QtDesigner import *
-
-
-def load_settings():
-    """Simple version assuming QtDesigner is in Python path"""
-    try:
-        # Get the directory of the QtDesigner package
-        import QtDesigner
-        import inspect
-
-        # Get the file path of the QtDesigner __init__.py
-        package_file = inspect.getfile(QtDesigner)
-        package_dir = os.path.dirname(os.path.abspath(package_file))
-
-        # Construct path to settings.json
-        settings_path = os.path.join(package_dir, 'settings.json')
-
-        if os.path.exists(settings_path):
-            with open(settings_path, 'r') as f:
-                settings = json.load(f)
-                print(f"Successfully loaded settings from: {settings_path}")
-                return settings
-        else:
-            print(f"settings.json not found at: {settings_path}")
-
-    except Exception as e:
-        print(f"Error loading settings: {e}")
-
-    return {}
 
 
 class Flight:
-    def __init__(self, date_departure, date_return , from_country, to_country ,airline_name="SkyHigh Airline"):
-        self.distance,self.aircraft = choose_aircraft(from_country, to_country)
+    def __init__(self, date_departure, date_return , from_country, to_country ,airline_name="SkyHigh Airline",
+                 from_airport=None, to_airport=None):
+        # IATA codes, when given, make every distance airport-to-airport instead of centroid-to-centroid
+        self.from_airport = from_airport
+        self.to_airport = to_airport
+        self.route_profile = get_route_profile(from_airport or from_country, to_airport or to_country)
+        self.distance = self.route_profile.distance
+        self.aircraft = self.route_profile.aircraft
         self.airline = Airline(airline_name)
         self.date_departure = self._parse_date(date_departure)
         self.date_return = self._parse_date(date_return) if date_return else None
         self.from_country = from_country
         self.to_country = to_country
         self.sold_seats = 0
+        # seat class -> seats sold, kept by revenue_management.record_booking
+        self.sold_seats_by_class = {}
         self.max_seats = self.aircraft["capacity"]
-        self.settings = load_settings()
-        print(self.settings)
+        self.settings = get_pricing_config()
         # dynamic base seat prices — no hardcoding outside
         self.seat_base_price = {
-            "economic": float(self.settings["base_price"]) * float(self.settings["economy_factor"]) *self.airline.airline_efficiency ,
-            "Premium Economy" : float(self.settings["base_price"] ) * float(self.settings["premium_economy_factor"])  *  self.airline.airline_efficiency,
-            "business":float(self.settings["base_price"])  * float(self.settings["business_factor"]) * self.airline.airline_efficiency,
-            "first": float(self.settings["base_price"])  * float(self.settings["first_class_factor"]) * self.airline.airline_efficiency,
+            "economic": self.settings.base_price * self.settings.seat_factors["economic"] * self.airline.airline_efficiency,
+            "Premium Economy": self.settings.base_price * self.settings.seat_factors["premium_economy"] * self.airline.airline_efficiency,
+            "business": self.settings.base_price * self.settings.seat_factors["business"] * self.airline.airline_efficiency,
+            "first": self.settings.base_price * self.settings.seat_factors["first"] * self.airline.airline_efficiency,
         }
-        self.stops= estimate_stops(self.to_country,self.from_country)
+        self.stops = self.route_profile.stops
     def is_holiday_period(self):
         if exist_holidays(self.to_country, self.date_departure, self.date_return):
             return True
         return False
     def _get_efficiency(self):
-        return self.settings["efficiency"]
+        return self.settings.efficiency
     def _parse_date(self, date):
         if isinstance(date, str):
             return datetime.strptime(date, '%Y-%m-%d')
@@ -83,28 +60,26 @@ class Flight:
                f" and stops_estimated {self.determine_stops()}"
     def determinedemande(self):
         demande=0
-        if (exist_holidays(self.to_country)) :
+        if exist_holidays(self.to_country, self.date_departure, self.date_return) :
             demande+=0.2
-        if (classify_tourism(self.to_country == LOW_TOURIST_DESTINATION)) :
-            demande+=0
-        if(classify_tourism(self.to_country) == MODERATE_TOURIST_DESTINATION) :
+        tourism = classify_tourism(self.to_country)
+        if tourism == MODERATE_TOURIST_DESTINATION :
             demande+=0.1
-        if (classify_tourism(self.to_country) == STRONG_TOURIST_DESTINATION) :
+        elif tourism == STRONG_TOURIST_DESTINATION :
             demande+=0.2
-        if (classify_tourism(self.to_country) == MAJOR_TOURIST_DESTINATION) :
+        elif tourism == MAJOR_TOURIST_DESTINATION :
             demande+=0.3
+        return demande
 
     def destiation_is_tourist_hotspot(self):
-        if(classify_tourism(self.to_country) == MAJOR_TOURIST_DESTINATION or classify_tourism(self.to_country) == STRONG_TOURIST_DESTINATION):
-            return True
-        return False
+        return classify_tourism(self.to_country) in TOURIST_HOTSPOT_CLASSES
 
 
 
     def determine_cost(self):
         return BASE_AIRCRAFT_COST * self.aircraft["cost_factor"]
     def determine_stops(self):
-        return estimate_stops(self.to_country,self.from_country)
+        return get_route_profile(self.from_airport or self.from_country, self.to_airport or self.to_country).stops
     def valid(self):
         if self.from_country==self.to_country :
             print("can't fly within the same country")
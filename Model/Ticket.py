@@ -16,7 +16,9 @@ class Ticket:
         delta_days = (self.flight.date_departure - self.date_reservation).days
         return delta_days > 60
     def determine_price(self):
-        from Service.GurobyResolver import dynamic_ticket_price
-        return dynamic_ticket_price(self)
+        from Service.fare_grid import ticket_fare
+        from Service.quote_cache import quote_price
+        price = ticket_fare(self)
+        return price if price is not None else quote_price(self)
 
 
@@ -10,6 +10,7 @@ from constants.Airline_Specific_Constants.Base_Seat_Cost import BASE_SEAT_PRICE
 from constants.Airline_Specific_Constants.Fuel_Cost import FUEL_COST_Km
 from constants.Airline_Specific_Constants.Luggage_cost import LUGGAGE_COST_PER_KG
 from QtDesigner.PlanFlight import Ui_FlightPlanningWindow as PlanFlightUI
+from Service.settings_service import SETTINGS_PATH, read_settings, save_settings
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -287,7 +288,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # ----------------------------------------------------------
     def load_settings(self):
-        if os.path.exists("settings.json"):
+        if os.path.exists(SETTINGS_PATH):
             self.load_from_file()
         else:
             self.load_default_values()
@@ -331,13 +332,13 @@ class MainWindow(QtWidgets.QMainWindow):
     # ----------------------------------------------------------
     def load_from_file(self):
         try:
-            if not os.path.exists("settings.json"):
+            if not os.path.exists(SETTINGS_PATH):
                 QMessageBox.warning(self, "File Not Found",
                                     "settings.json not found. Loading default values.")
                 self.load_default_values()
                 return
 
-            with open("settings.json", "r") as f:
+            with open(SETTINGS_PATH, "r") as f:
                 data = json.load(f)
 
             self.apply_values_to_form(data)
@@ -448,7 +449,8 @@ class MainWindow(QtWidgets.QMainWindow):
     # ----------------------------------------------------------
     def save_changes(self):
         """Save all form values to JSON file"""
-        data = {}
+        # Settings the form has no field for (e.g. pricing_solver) are kept as they are
+        data = read_settings()
 
         # Collect all regular fields
         for attr_name, field in self.__dict__.items():
@@ -483,10 +485,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         data["special_offers"] = special_offers
 
-        # Save to file
+        # Save to file atomically; pricing picks the new values up through the settings service
         try:
-            with open("settings.json", "w") as f:
-                json.dump(data, f, indent=4, sort_keys=True)
+            save_settings(data)
 
             self.saved = True
             QMessageBox.information(self, "Saved",
@@ -3,8 +3,10 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
 import sys
 import os
+import threading
 
 from QtDesigner.Airline_Settings import MainWindow as Settings
+from Service.prefetch import prefetch_country_data
 
 
 class AirplaneItem(QtWidgets.QLabel):
@@ -126,6 +128,30 @@ class AirplaneItem(QtWidgets.QLabel):
         print("Takeoff animation complete!")
 
 
+class PrefetchThread(QtCore.QThread):
+    """Warms the country data caches in the background so early route selections hit them"""
+    progress = QtCore.pyqtSignal(int, int, str)
+    prefetch_finished = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # created here so stop() works even before run() has started
+        self.stop_event = threading.Event()
+
+    def run(self):
+        if self.stop_event.is_set():
+            return
+        failures = prefetch_country_data(
+            progress=lambda done, total, source, country: self.progress.emit(done, total, f"{source}: {country}"),
+            stop_event=self.stop_event,
+        )
+        self.prefetch_finished.emit(len(failures))
+
+    def stop(self):
+        self.stop_event.set()
+        self.wait(1000)
+
+
 class Ui_MainWindow(object):
 
     def setupUi(self, MainWindow):
@@ -163,6 +189,26 @@ class Ui_MainWindow(object):
         MainWindow.resizeEvent = self.resizeEvent
         self.updatePositions()
 
+        # Start warming country data once the event loop is running, i.e. after the window shows
+        self.prefetch_thread = None
+        QtCore.QTimer.singleShot(0, self.startPrefetch)
+
+    def startPrefetch(self):
+        self.prefetch_thread = PrefetchThread(self.main_window)
+        self.prefetch_thread.progress.connect(self.onPrefetchProgress)
+        self.prefetch_thread.prefetch_finished.connect(self.onPrefetchFinished)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.prefetch_thread.stop)
+        self.prefetch_thread.start()
+
+    def onPrefetchProgress(self, done, total, task):
+        self.main_window.statusBar().showMessage(f"Loading country data {done}/{total} ({task})")
+
+    def onPrefetchFinished(self, failures):
+        message = "Country data ready"
+        if failures:
+            message += f" ({failures} lookups failed, they will be retried on demand)"
+        self.main_window.statusBar().showMessage(message, 5000)
+
     def updatePositions(self):
         cliff_y = self.central.height() - self.cliff.height()
         self.cliff.move(5, cliff_y)
@@ -1,7 +1,4 @@
-import json
-
 from PyQt5 import QtCore, QtGui, QtWidgets
-import os
 import traceback
 from datetime import datetime
 
@@ -11,7 +8,8 @@ from Service.IsoCountry import IsoCountry
 from Service.determine_holidays import exist_holidays
 from Service.determine_tourist_attraction import classify_tourism
 from Service.distance_calculation import distance_between_countries
-from Service.stops_estimation import choose_aircraft, estimate_stops
+from Service.settings_service import read_settings
+from Service.stops_estimation import get_route_profile
 from constants.Airline_Specific_Constants.Fuel_Cost import FUEL_COST_Km
 
 
@@ -20,14 +18,7 @@ def get_isocode(country):
 
 
 def load_settings():
-    if os.path.exists("settings.json"):
-        try:
-            with open("settings.json", "r") as f:
-                settings = json.load(f)
-            return settings
-        except:
-            return {}
-    return {}
+    return read_settings()
 
 
 class FlightCalculationThread(QtCore.QThread):
@@ -49,26 +40,22 @@ class FlightCalculationThread(QtCore.QThread):
             if not self.running:
                 return
 
-            # Calculate distance and aircraft
-            result = choose_aircraft(self.from_country, self.to_country)
+            # Distance, aircraft and stops come from one memoized route profile
+            profile = get_route_profile(self.from_country, self.to_country)
 
-            if result is None:
+            if profile is None:
                 self.calculation_error.emit("No aircraft found for this route.")
                 return
 
-            distance, airplane = result
-
-            if not self.running:
-                return
-
-            # Calculate number of stops
-            stops = estimate_stops(self.from_country, self.to_country)
+            distance = profile.distance
+            airplane = profile.aircraft
+            stops = profile.stops
 
             if not self.running:
                 return
 
             # Calculate fuel cost
-            fuel_cost = distance * self.fuel_cost_per_km * airplane["cost_factor"]
+            fuel_cost = profile.fuel_cost_at(self.fuel_cost_per_km)
 
             if not self.running:
                 return
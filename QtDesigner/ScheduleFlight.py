@@ -1,23 +1,16 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
-import os
-import json
 from datetime import datetime
 
 from Model.Flight import Flight
 from Model.SpecialOffer import SpecialOffer
 from Model.Ticket import Ticket
+from Service.fare_grid import build_fare_grid
+from Service.revenue_management import quote_class, record_booking
+from Service.settings_service import read_settings
 
 
 def load_settings():
-    if os.path.exists("settings.json"):
-        try:
-            with open("settings.json", "r") as f:
-                settings = json.load(f)
-            return settings
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-            return {}
-    return {}
+    return read_settings()
 
 
 Available_Flights = []
@@ -26,6 +19,11 @@ Available_Flights = []
 def addFlight(flight):
     Available_Flights.append(flight)
     print(Available_Flights)
+    # best effort: without a grid ticket_fare prices the ticket itself
+    try:
+        build_fare_grid(flight)
+    except Exception as e:
+        print(f"❌ Could not build the fare grid: {e}")
 
 
 def getOffers():
@@ -1111,6 +1109,23 @@ class Ui_Form(object):
             distance_value_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #1e40af;")
             details_layout.addWidget(distance_value_label, 2, 3)
 
+            # Fare for the selected seat type, booked now - a fare grid lookup
+            fare_label = QtWidgets.QLabel("Fare:")
+            fare_label.setStyleSheet("font-size: 14px; color: #64748b;")
+            details_layout.addWidget(fare_label, 3, 0)
+
+            fare_value = "N/A"
+            try:
+                fare = Ticket(datetime.now(), flight, getattr(self, 'seat_type', "Economy"),
+                              getattr(self, 'has_extra_luggage', False)).determine_price()
+                fare_value = f"${fare:.2f}"
+            except Exception as e:
+                print(f"Could not price flight: {e}")
+
+            fare_value_label = QtWidgets.QLabel(fare_value)
+            fare_value_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #1e40af;")
+            details_layout.addWidget(fare_value_label, 3, 1)
+
             card_layout.addLayout(details_layout)
 
             # Add flight card to results
@@ -1183,6 +1198,19 @@ class Ui_Form(object):
         if not self.selected_flight:
             return
 
+        # Seat inventory control: the class may be closed to protect seats for higher fares
+        try:
+            availability = quote_class(self.selected_flight, self.seat_type)
+        except Exception as e:
+            print(f"❌ Error checking seat availability: {e}")
+            QtWidgets.QMessageBox.warning(None, "Flight Booking",
+                                          f"Seat availability could not be checked: {e}")
+            return
+        if not availability["open"]:
+            QtWidgets.QMessageBox.warning(None, "Flight Booking",
+                                          f"No {self.seat_type} seats are available on this flight.")
+            return
+
         try:
             # Create SpecialOffer objects from selected offers
             special_offers = []
@@ -1264,6 +1292,7 @@ class Ui_Form(object):
             ret = msg.exec_()
 
             if ret == QtWidgets.QMessageBox.Yes:
+                record_booking(self.selected_flight, seat_type=self.seat_type)
                 self.Time_Edit_Error.setText("Flight booked and paid successfully!")
 
                 # Reset selection
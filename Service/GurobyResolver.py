@@ -1,105 +1,79 @@
 from datetime import datetime
-import gurobipy as gp
-from gurobipy import Model, GRB
-from Model.Flight import Flight
-from Model.Ticket import Ticket
-import os
-import json
-
-
-def load_settings():
-    try:
-        import QtDesigner
-        import inspect
-
-        package_file = inspect.getfile(QtDesigner)
-        package_dir = os.path.dirname(os.path.abspath(package_file))
-
-        settings_path = os.path.join(package_dir, 'settings.json')
-
-        if os.path.exists(settings_path):
-            with open(settings_path, 'r') as f:
-                settings = json.load(f)
-                print(f"Successfully loaded settings from: {settings_path}")
-                return settings
-        else:
-            print(f"settings.json not found at: {settings_path}")
-
-    except Exception as e:
-        print(f"Error loading settings: {e}")
-
-    return {}
 
+import numpy as np
 
-def dynamic_ticket_price(ticket: Ticket):
-
-    settings = load_settings()
-
-    # Convert ALL string values to appropriate types
-    FUEL_COST_Km = float(settings["fuel_cost"])
-    advanced_booking_discount = float(settings["advanced_booking_discount"]) / 100  # Convert % to decimal
-    holiday_factor = float(settings["holiday_factor"]) / 100
-    late_booking = float(settings["late_booking"]) / 100
-    luggage_surcharge = float(settings["luggage_surcharge"]) / 100  # Convert % to decimal
-    stop_discount = float(settings["stop_discount"]) / 100
-    weekend_surcharge = float(settings["weekend_surcharge"]) / 100
-    roundtrip_discount = float(settings["roundtrip_discount"]) / 100
-    student_discount = float(settings["student_discount"]) / 100
-    tourist_surcharge = float(settings["tourist_surcharge"]) / 100
-    base_price_value = float(settings["base_price"])
-
-    # FIX: Convert efficiency factor to float
-    efficiency_factor = float(settings["efficiency"])
-
-    # Seat class factors
-    first_class_factor = float(settings["first_class_factor"])
-    business_factor = float(settings["business_factor"])
-    premium_economy_factor = float(settings["premium_economy_factor"])
-    economy_factor = float(settings.get("economy_factor", 1))
-
-    # Cost factors
-    extended_cost_factor = float(settings["extended_cost_factor"])
-    long_cost_factor = float(settings["long_cost_factor"])
-    narrow_cost_factor = float(settings["narrow_cost_factor"])
-    ultra_cost_factor = float(settings["ultra_cost_factor"])
+from Model.Flight import Flight
+from Model.Ticket import Ticket
+from Service.settings_service import PricingConfig, get_pricing_config
+import threading
+import time
+
+
+DEMAND_FACTOR_BOUNDS = (0.5, 3.0)
+# Same absolute tolerance Gurobi applies to constraint violations by default
+FEASIBILITY_TOL = 1e-6
+
+
+class PricingFeatures:
+    """One ticket reduced to the numbers the pricing model depends on"""
+
+    def __init__(self, base_price, is_premium_seat, operating_min, total_demand, load_factor,
+                 discount_factor, surcharge_factor, details=None):
+        self.base_price = base_price
+        self.is_premium_seat = is_premium_seat
+        self.operating_min = operating_min
+        self.total_demand = total_demand
+        self.load_factor = load_factor
+        self.discount_factor = discount_factor
+        self.surcharge_factor = surcharge_factor
+        self.expected_price = base_price * discount_factor * surcharge_factor * total_demand
+        # intermediate values, only used for the printed breakdown
+        self.details = details or {}
+
+    def upper_bounds(self):
+        return (
+            self.expected_price * 1.5,  # upper_bound_market_price
+            self.base_price * (3.0 if self.is_premium_seat else 2.0),  # competitive_pricing
+        )
+
+    def lower_bounds(self):
+        return (
+            0.0,  # price >= 0
+            self.operating_min,  # min_operating_cost
+            self.operating_min * 1.15,  # minimum_profit_margin
+            self.base_price * (1 + (self.total_demand - 1) * 0.5),  # demand_reflection
+        )
+
+
+def flight_load_factor(flight):
+    if hasattr(flight, 'sold_seats') and flight.max_seats > 0:
+        return flight.sold_seats / flight.max_seats
+    return 0.5  # Default 50% load factor
+
+
+def seat_inputs(seat_type, config: PricingConfig):
+    """(seat factor, 1 if premium cabin else 0) of a seat type name"""
+    seat_factor = config.seat_factors.get(seat_type.lower().replace(" ", "_"), config.seat_factors["economy"])
+    seat_type_lower = seat_type.lower()
+    is_premium_seat = any(premium in seat_type_lower for premium in ["first", "business", "premium"])
+    return seat_factor, 1 if is_premium_seat else 0
 
-    # Special offers from JSON
-    special_offers = settings.get("special_offers", [])
 
-    m = Model("dynamic_ticket_pricing")
-    m.Params.LogToConsole = 0  # Silence Gurobi output
+def flight_inputs(flight, config: PricingConfig, load_factor=None):
+    """The flight-level part of ticket_inputs, shared by every ticket of the flight
 
-    flight = ticket.flight
-    airline = flight.airline
+    ``load_factor`` overrides the flight's own (the quote cache prices at bucket edges).
+    """
     aircraft = flight.aircraft
 
-
-    # Main decision variable: Ticket price
-    price = m.addVar(name="ticket_price", lb=0, vtype=GRB.CONTINUOUS)
-
-    # Dynamic demand factor - calculated based on real factors
-    demand_factor = m.addVar(name="demand_factor", lb=0.5, ub=3.0, vtype=GRB.CONTINUOUS)
-
-    seat_factors = {
-        "first": first_class_factor,
-        "business": business_factor,
-        "premium_economy": premium_economy_factor,
-        "economic": economy_factor,
-        "economy": economy_factor  # Add alias for economy
-    }
-
-    seat_factor = seat_factors.get(ticket.seat_type.lower().replace(" ", "_"), economy_factor)
-    base_price = base_price_value * seat_factor
-
     # Aircraft operating cost: fuel + distance factor
     # Determine aircraft type cost factor
     # Check if aircraft is a dictionary or object
+    aircraft_capacity = flight.max_seats
     if isinstance(aircraft, dict):
-        aircraft_capacity = ticket.flight.max_seats
         aircraft_type = aircraft["name"]
     else:
         # It's an object, access attributes directly
-        aircraft_capacity = ticket.flight.max_seats
         aircraft_type = aircraft
         if aircraft_type == 'narrow':
             aircraft_name = getattr(aircraft, 'name', '').lower()
@@ -109,23 +83,11 @@ def dynamic_ticket_price(ticket: Ticket):
                 aircraft_type = 'long_range'
             elif 'ultra' in aircraft_name:
                 aircraft_type = 'ultra_long_range'
-
-    cost_factors = {
-        "narrow": narrow_cost_factor,
-        "wide": extended_cost_factor,
-        "long_range": long_cost_factor,
-        "ultra_long_range": ultra_cost_factor
-    }
-    aircraft_cost_factor = cost_factors.get(aircraft_type, narrow_cost_factor)
-
-    aircraft_cost = aircraft_cost_factor * FUEL_COST_Km * flight.distance
-
+    aircraft_cost_factor = config.cost_factors.get(aircraft_type, config.cost_factors["narrow"])
 
     # 1. Load factor from sold seats
-    if hasattr(flight, 'sold_seats') and aircraft_capacity > 0:
-        load_factor = flight.sold_seats / aircraft_capacity
-    else:
-        load_factor = 0.5  # Default 50% load factor
+    if load_factor is None:
+        load_factor = flight_load_factor(flight)
 
     # 2. Holiday demand boost
     if hasattr(flight, 'is_holiday_period') and callable(flight.is_holiday_period):
@@ -139,18 +101,6 @@ def dynamic_ticket_price(ticket: Ticket):
     else:
         is_tourist_destination = 0
 
-    # 4. Weekend demand boost
-    if hasattr(ticket, 'is_weekend') and callable(ticket.is_weekend):
-        is_weekend = 1 if ticket.is_weekend() else 0
-    else:
-        is_weekend = 0
-
-    # 5. Late booking penalty/reward
-    if hasattr(ticket, 'is_advanced_booking') and callable(ticket.is_advanced_booking):
-        is_late_booking = 1 if not ticket.is_advanced_booking() else 0
-    else:
-        is_late_booking = 0
-
     # 6. Check for stops
     if hasattr(flight, 'stops'):
         flight_stops = flight.stops
@@ -159,6 +109,36 @@ def dynamic_ticket_price(ticket: Ticket):
     else:
         flight_stops = 0
 
+    return {
+        "aircraft_type": aircraft_type,
+        "aircraft_cost_factor": aircraft_cost_factor,
+        "aircraft_capacity": aircraft_capacity,
+        "distance": flight.distance,
+        "load_factor": load_factor,
+        "is_holiday": is_holiday,
+        "is_tourist_destination": is_tourist_destination,
+        "has_stops": 1 if flight_stops > 0 else 0,
+        # Roundtrip discount (assuming roundtrip if return date exists)
+        "is_roundtrip": 1 if hasattr(flight, 'date_return') and flight.date_return else 0,
+    }
+
+
+def ticket_inputs(ticket: Ticket, config: PricingConfig, load_factor=None):
+    """Everything pricing needs to know about one ticket, as plain numbers and 0/1 flags"""
+    seat_factor, is_premium_seat = seat_inputs(ticket.seat_type, config)
+
+    # 4. Weekend demand boost
+    if hasattr(ticket, 'is_weekend') and callable(ticket.is_weekend):
+        is_weekend = 1 if ticket.is_weekend() else 0
+    else:
+        is_weekend = 0
+
+    # 5. Advanced booking discount / late booking penalty
+    if hasattr(ticket, 'is_advanced_booking') and callable(ticket.is_advanced_booking):
+        is_advanced_booking = 1 if ticket.is_advanced_booking() else 0
+        is_late_booking = 1 - is_advanced_booking
+    else:
+        is_advanced_booking = is_late_booking = 0
 
     special_discount_total = 0
 
@@ -166,38 +146,53 @@ def dynamic_ticket_price(ticket: Ticket):
     if hasattr(ticket, 'specialoffers'):
         for offer in ticket.specialoffers:
             # Check if this offer exists in settings.json
-            for json_offer in special_offers:
-                if json_offer["name"].lower() == offer.name.lower():
-                    special_discount_total += float(json_offer["value"]) / 100
+            special_discount_total += config.special_offers.get(offer.name.lower(), 0)
 
     # Apply student discount from settings if applicable
     if hasattr(ticket, 'is_student') and ticket.is_student:
-        special_discount_total += student_discount
+        special_discount_total += config.student_discount
+
+    return {
+        **flight_inputs(ticket.flight, config, load_factor),
+        "seat_factor": seat_factor,
+        "is_premium_seat": is_premium_seat,
+        "is_weekend": is_weekend,
+        "is_advanced_booking": is_advanced_booking,
+        "is_late_booking": is_late_booking,
+        "has_extra_luggage": 1 if hasattr(ticket, 'extra_luggage') and ticket.extra_luggage else 0,
+        "special_discount_total": special_discount_total,
+    }
 
-    # Advanced booking discount
-    adv_discount = advanced_booking_discount if hasattr(ticket, 'is_advanced_booking') and callable(
-        ticket.is_advanced_booking) and ticket.is_advanced_booking() else 0
 
-    # Late booking surcharge
-    late_surcharge = late_booking if is_late_booking else 0
+# ticket_inputs keys that are numeric, i.e. everything price_input_arrays needs
+TICKET_INPUT_COLUMNS = (
+    "seat_factor", "is_premium_seat", "aircraft_cost_factor", "aircraft_capacity", "distance", "load_factor",
+    "is_holiday", "is_tourist_destination", "is_weekend", "is_advanced_booking", "is_late_booking",
+    "has_extra_luggage", "has_stops", "is_roundtrip", "special_discount_total",
+)
 
-    # Weekend surcharge
-    weekend_surcharge_val = weekend_surcharge if is_weekend else 0
 
-    # Holiday factor (if flight is during holiday period)
-    holiday_surcharge = holiday_factor if is_holiday else 0
+def price_components(inputs, config: PricingConfig):
+    """Discounts, surcharges, demand and cost of ``inputs``
 
-    # Luggage surcharge (if extra luggage)
-    luggage_surcharge_val = luggage_surcharge if hasattr(ticket, 'extra_luggage') and ticket.extra_luggage else 0
+    Written with arithmetic only (flags multiply their rate), so the same code prices one
+    ticket from scalars or a whole portfolio from NumPy arrays.
+    """
+    base_price = config.base_price * inputs["seat_factor"]
+    aircraft_cost = inputs["aircraft_cost_factor"] * config.fuel_cost * inputs["distance"]
 
+    adv_discount = config.advanced_booking_discount * inputs["is_advanced_booking"]
+    late_surcharge = config.late_booking * inputs["is_late_booking"]
+    weekend_surcharge_val = config.weekend_surcharge * inputs["is_weekend"]
+    # Holiday factor (if flight is during holiday period)
+    holiday_surcharge = config.holiday_factor * inputs["is_holiday"]
+    # Luggage surcharge (if extra luggage)
+    luggage_surcharge_val = config.luggage_surcharge * inputs["has_extra_luggage"]
     # Stop discount (if flight has stops)
-    stop_discount_val = stop_discount if flight_stops > 0 else 0
-
-    # Roundtrip discount (assuming roundtrip if return date exists)
-    roundtrip_discount_val = roundtrip_discount if hasattr(flight, 'date_return') and flight.date_return else 0
-
+    stop_discount_val = config.stop_discount * inputs["has_stops"]
+    roundtrip_discount_val = config.roundtrip_discount * inputs["is_roundtrip"]
     # Tourist surcharge (if destination is tourist hotspot)
-    tourist_surcharge_val = tourist_surcharge if is_tourist_destination else 0
+    tourist_surcharge_val = config.tourist_surcharge * inputs["is_tourist_destination"]
 
     # Demand factor is influenced by multiple real factors:
     # 1. Base demand: 1.0
@@ -206,120 +201,295 @@ def dynamic_ticket_price(ticket: Ticket):
     # 4. Tourist destination boost: +0.2 for tourist spots
     # 5. Weekend boost: +0.15 on weekends
     # 6. Late booking penalty: -0.1 for late bookings
-
-    base_demand = 1.0
-    load_factor_influence = 0.5 * load_factor  # 0 to 0.5 based on load
-    holiday_boost = 0.3 * is_holiday
-    tourist_boost = 0.2 * is_tourist_destination
-    weekend_boost = 0.15 * is_weekend
-    late_penalty = -0.1 * is_late_booking
-
-    # Calculate total demand factor
     total_demand = (
-            base_demand +
-            load_factor_influence +
-            holiday_boost +
-            tourist_boost +
-            weekend_boost +
-            late_penalty
+            1.0 +
+            0.5 * inputs["load_factor"] +
+            0.3 * inputs["is_holiday"] +
+            0.2 * inputs["is_tourist_destination"] +
+            0.15 * inputs["is_weekend"] +
+            -0.1 * inputs["is_late_booking"]
     )
 
-    # Constraint: Demand factor equals calculated total demand
-    m.addConstr(demand_factor == total_demand, "demand_calculation")
+    return {
+        "base_price": base_price,
+        "aircraft_cost": aircraft_cost,
+        "adv_discount": adv_discount,
+        "special_discount_total": inputs["special_discount_total"],
+        "stop_discount_val": stop_discount_val,
+        "roundtrip_discount_val": roundtrip_discount_val,
+        "weekend_surcharge_val": weekend_surcharge_val,
+        "holiday_surcharge": holiday_surcharge,
+        "late_surcharge": late_surcharge,
+        "luggage_surcharge_val": luggage_surcharge_val,
+        "tourist_surcharge_val": tourist_surcharge_val,
+        "discount_factor": 1 - adv_discount - inputs["special_discount_total"] - stop_discount_val - roundtrip_discount_val,
+        "surcharge_factor": 1 + weekend_surcharge_val + holiday_surcharge + late_surcharge + luggage_surcharge_val + tourist_surcharge_val,
+        "total_demand": total_demand,
+        "operating_min": (aircraft_cost / (inputs["aircraft_capacity"] * config.efficiency)) * 1.1,  # 10% margin
+    }
 
-    # -----------------------------
-    # CONSTRAINTS
-    # -----------------------------
 
-    # Constraint 1: Expected price calculation - FIXED: Store as regular float, not expression
-    expected_price_val = (
-            base_price *
-            (1 - adv_discount - special_discount_total - stop_discount_val - roundtrip_discount_val) *
-            (1 + weekend_surcharge_val + holiday_surcharge + late_surcharge +
-             luggage_surcharge_val + tourist_surcharge_val) *
-            total_demand  # Use total_demand (float) not demand_factor (variable)
+def extract_pricing_features(ticket: Ticket, config: PricingConfig = None, load_factor=None):
+    config = config or get_pricing_config()
+    return features_from_inputs(ticket_inputs(ticket, config, load_factor), config)
+
+
+def features_from_inputs(inputs, config: PricingConfig):
+    """PricingFeatures of one ``ticket_inputs`` dict; lets pricing run where the ticket objects are not"""
+    components = price_components(inputs, config)
+    details = {**inputs, **components, "base_price_value": config.base_price, "efficiency_factor": config.efficiency}
+    return PricingFeatures(
+        components["base_price"],
+        inputs["is_premium_seat"],
+        components["operating_min"],
+        components["total_demand"],
+        inputs["load_factor"],
+        components["discount_factor"],
+        components["surcharge_factor"],
+        details,
     )
 
-    # Constraint 2: Price upper bound based on expected market price
-    m.addConstr(price <= expected_price_val * 1.5, "upper_bound_market_price")
 
-    # Constraint 3: Minimum price to cover operating costs
-    operating_min = (aircraft_cost / (aircraft_capacity * efficiency_factor)) * 1.1  # 10% margin
-    m.addConstr(price >= operating_min, "min_operating_cost")
+def analytic_price(features: PricingFeatures):
+    """Optimum of the pricing LP without a solver, or None when it is infeasible
+
+    demand_factor is pinned to total_demand, so the objective only grows with the price:
+    the optimum is the tightest upper bound whenever it clears every lower bound.
+    """
+    low, high = DEMAND_FACTOR_BOUNDS
+    if not low - FEASIBILITY_TOL <= features.total_demand <= high + FEASIBILITY_TOL:
+        return None
+    upper = min(features.upper_bounds())
+    if max(features.lower_bounds()) > upper + FEASIBILITY_TOL:
+        return None
+    return upper
+
+
+def price_input_arrays(columns, config: PricingConfig):
+    """Vectorized pricing over arrays of ``ticket_inputs`` values (one entry per ticket)
+
+    Returns ``(prices, breakdown)``: rounded prices plus a dict of per-component arrays.
+    """
+    breakdown = price_components(columns, config)
+    base_price = breakdown["base_price"]
+    total_demand = breakdown["total_demand"]
+    operating_min = breakdown["operating_min"]
+    expected_price = base_price * breakdown["discount_factor"] * breakdown["surcharge_factor"] * total_demand
+
+    upper_bound = np.minimum(expected_price * 1.5, base_price * np.where(columns["is_premium_seat"] > 0, 3.0, 2.0))
+    lower_bound = np.maximum.reduce([
+        np.zeros_like(base_price),
+        operating_min,
+        operating_min * 1.15,
+        base_price * (1 + (total_demand - 1) * 0.5),
+    ])
+    low, high = DEMAND_FACTOR_BOUNDS
+    feasible = (
+        (lower_bound <= upper_bound + FEASIBILITY_TOL)
+        & (total_demand >= low - FEASIBILITY_TOL)
+        & (total_demand <= high + FEASIBILITY_TOL)
+    )
 
-    # Constraint 4: Competitive pricing constraint
-    # Price should not exceed 200% of base price for economy, 300% for business/first
-    seat_type_lower = ticket.seat_type.lower()
-    is_premium_seat = any(premium in seat_type_lower for premium in ["first", "business", "premium"])
-    max_price_multiplier = 3.0 if is_premium_seat else 2.0
-    m.addConstr(price <= base_price * max_price_multiplier, "competitive_pricing")
-
-    # Constraint 5: Ensure reasonable profit margin (at least 15% above cost)
-    m.addConstr(price >= operating_min * 1.15, "minimum_profit_margin")
-
-    # Constraint 6: Price should reflect demand (higher demand = higher price)
-    m.addConstr(price >= base_price * (1 + (total_demand - 1) * 0.5), "demand_reflection")
-
-    # -----------------------------
-    # OBJECTIVE FUNCTION
-    # -----------------------------
-    # Maximize profit while considering market competitiveness and load factor
-    # Weighted objective:
-    # 60% maximize price
-    # 20% consider load factor optimization (higher load = higher price)
-    # 20% consider demand factor (higher demand = higher price)
-
-    objective = (
-            0.6 * price +
-            0.2 * (load_factor * 100) +  # Reward higher load factors
-            0.2 * (demand_factor * 50)  # Reward higher demand
+    breakdown.update(
+        load_factor=columns["load_factor"],
+        expected_price=expected_price,
+        upper_bound=upper_bound,
+        lower_bound=lower_bound,
+        feasible=feasible,
     )
-    m.setObjective(objective, GRB.MAXIMIZE)
-
-    m.optimize()
-
-    if m.status == GRB.OPTIMAL:
-        final_price = round(price.X, 2)
-
-        # Print detailed breakdown
-        print("\n" + "=" * 50)
-        print("TICKET PRICE OPTIMIZATION BREAKDOWN")
-        print("=" * 50)
-        print(f"Flight: {flight.from_country} → {flight.to_country}")
-        print(f"Seat type: {ticket.seat_type}")
-        print(f"Base price: ${base_price_value}")
-        print(f"Seat factor: {seat_factor}")
-        print(f"Adjusted base: ${base_price:.2f}")
-        print(f"\nDynamic Factors:")
-        print(f"  Load factor: {load_factor * 100:.1f}%")
-        print(f"  Is holiday: {'Yes' if is_holiday else 'No'}")
-        print(f"  Tourist destination: {'Yes' if is_tourist_destination else 'No'}")
-        print(f"  Is weekend: {'Yes' if is_weekend else 'No'}")
-        print(f"  Is late booking: {'Yes' if is_late_booking else 'No'}")
-        print(f"  Calculated demand factor: {total_demand:.2f}")
-        print(f"\nDiscounts/Surcharges:")
-        print(f"  Advanced booking: -{adv_discount * 100:.1f}%")
-        print(f"  Special offers: -{special_discount_total * 100:.1f}%")
-        print(f"  Stop discount: -{stop_discount_val * 100:.1f}%")
-        print(f"  Roundtrip: -{roundtrip_discount_val * 100:.1f}%")
-        print(f"  Weekend surcharge: +{weekend_surcharge_val * 100:.1f}%")
-        print(f"  Holiday surcharge: +{holiday_surcharge * 100:.1f}%")
-        print(f"  Late booking: +{late_surcharge * 100:.1f}%")
-        print(f"  Luggage surcharge: +{luggage_surcharge_val * 100:.1f}%")
-        print(f"  Tourist surcharge: +{tourist_surcharge_val * 100:.1f}%")
-        print(f"\nCost Analysis:")
-        print(f"  Aircraft cost: ${aircraft_cost:.2f}")
-        print(f"  Efficiency factor: {efficiency_factor}")
-        print(f"  Aircraft capacity: {aircraft_capacity}")
-        print(f"  Aircraft type: {aircraft_type}")
-        print(f"  Aircraft cost factor: {aircraft_cost_factor}")
-        print(f"  Minimum operating cost: ${operating_min:.2f}")
-        print(f"\nOptimized price: ${final_price}")
-        print("=" * 50 + "\n")
-
-        return final_price
-    else:
-        # Fallback: calculate expected price using the float value, not expression
-        fallback_price = round(expected_price_val, 2)
+    # infeasible tickets get the expected price, like dynamic_ticket_price's fallback
+    return np.round(np.where(feasible, upper_bound, expected_price), 2), breakdown
+
+
+def price_tickets(tickets, config: PricingConfig = None):
+    """Price a whole portfolio in one vectorized pass; see price_input_arrays for the result"""
+    config = config or get_pricing_config()
+    rows = [ticket_inputs(ticket, config) for ticket in tickets]
+    columns = {
+        name: np.array([row[name] for row in rows], dtype=float)
+        for name in TICKET_INPUT_COLUMNS
+    }
+    return price_input_arrays(columns, config)
+
+
+_gurobi_env = None
+_gurobi_env_lock = threading.Lock()
+_gurobi_models = threading.local()
+
+
+def new_gurobi_env():
+    # gurobipy is heavy and needs a licence, so only load it when a price is actually solved
+    import gurobipy as gp
+    env = gp.Env(empty=True)
+    env.setParam("OutputFlag", 0)  # Silence Gurobi output, licence banner included
+    env.start()
+    return env
+
+
+def get_gurobi_env():
+    """One silent Gurobi environment per process, so the licence is checked out once"""
+    global _gurobi_env
+    with _gurobi_env_lock:
+        if _gurobi_env is None:
+            _gurobi_env = new_gurobi_env()
+        return _gurobi_env
+
+
+class GurobiPricingModel:
+    """The pricing model built once; each solve only rewrites right-hand sides in place
+
+    Gurobi keeps the previous basis between solves, so repeated solves warm-start from it.
+    """
+
+    def __init__(self, env=None):
+        from gurobipy import GRB, Model
+
+        start = time.perf_counter()
+        self.GRB = GRB
+        m = Model("dynamic_ticket_pricing", env=env or get_gurobi_env())
+
+        # Main decision variable: Ticket price
+        self.price = m.addVar(name="ticket_price", lb=0, vtype=GRB.CONTINUOUS)
+
+        # Dynamic demand factor - calculated based on real factors
+        self.demand_factor = m.addVar(name="demand_factor", lb=DEMAND_FACTOR_BOUNDS[0], ub=DEMAND_FACTOR_BOUNDS[1],
+                                      vtype=GRB.CONTINUOUS)
+
+        # Right-hand sides are placeholders, set per ticket in solve()
+        # Constraint: Demand factor equals calculated total demand
+        self.demand_calculation = m.addConstr(self.demand_factor == 1, "demand_calculation")
+        self.upper_bound_market_price = m.addConstr(self.price <= 0, "upper_bound_market_price")
+        self.min_operating_cost = m.addConstr(self.price >= 0, "min_operating_cost")
+        self.competitive_pricing = m.addConstr(self.price <= 0, "competitive_pricing")
+        self.minimum_profit_margin = m.addConstr(self.price >= 0, "minimum_profit_margin")
+        self.demand_reflection = m.addConstr(self.price >= 0, "demand_reflection")
+
+        # Weighted objective:
+        # 60% maximize price
+        # 20% consider load factor optimization (higher load = higher price), the constant term
+        # 20% consider demand factor (higher demand = higher price)
+        m.setObjective(0.6 * self.price + 0.2 * (self.demand_factor * 50), GRB.MAXIMIZE)
+        m.update()
+
+        self.model = m
+        self.build_seconds = time.perf_counter() - start
+        self.solve_seconds = 0.0
+        self.solves = 0
+
+    def solve(self, features: PricingFeatures):
+        start = time.perf_counter()
+        market_upper, competitive_upper = features.upper_bounds()
+        _, operating_min, profit_min, demand_min = features.lower_bounds()
+        self.demand_calculation.RHS = features.total_demand
+        self.upper_bound_market_price.RHS = market_upper
+        self.min_operating_cost.RHS = operating_min
+        self.competitive_pricing.RHS = competitive_upper
+        self.minimum_profit_margin.RHS = profit_min
+        self.demand_reflection.RHS = demand_min
+        self.model.ObjCon = 0.2 * (features.load_factor * 100)  # Reward higher load factors
+
+        self.model.optimize()
+        price = self.price.X if self.model.Status == self.GRB.OPTIMAL else None
+        self.solve_seconds += time.perf_counter() - start
+        self.solves += 1
+        return price
+
+    def timings(self):
+        return {
+            "build_seconds": self.build_seconds,
+            "solve_seconds": self.solve_seconds,
+            "solves": self.solves,
+            "mean_solve_seconds": self.solve_seconds / self.solves if self.solves else 0.0,
+        }
+
+    def dispose(self):
+        self.model.dispose()
+
+
+def get_gurobi_pricing_model():
+    """This thread's model template (Gurobi models must not be shared between threads)"""
+    model = getattr(_gurobi_models, "model", None)
+    if model is None:
+        model = _gurobi_models.model = GurobiPricingModel()
+    return model
+
+
+def use_gurobi_env(env):
+    """Give this thread its own model template on ``env``; for worker threads solving concurrently,
+    since a Gurobi environment must not be used by two threads at once"""
+    model = getattr(_gurobi_models, "model", None)
+    if model is not None:
+        model.dispose()
+    _gurobi_models.model = GurobiPricingModel(env)
+    return _gurobi_models.model
+
+
+def solve_price_gurobi(features: PricingFeatures):
+    """The pricing LP solved by Gurobi; kept for richer models than the closed form covers"""
+    return get_gurobi_pricing_model().solve(features)
+
+
+def print_price_breakdown(ticket: Ticket, features: PricingFeatures, final_price):
+    d = features.details
+    flight = ticket.flight
+    print("\n" + "=" * 50)
+    print("TICKET PRICE OPTIMIZATION BREAKDOWN")
+    print("=" * 50)
+    print(f"Flight: {flight.from_country} → {flight.to_country}")
+    print(f"Seat type: {ticket.seat_type}")
+    print(f"Base price: ${d['base_price_value']}")
+    print(f"Seat factor: {d['seat_factor']}")
+    print(f"Adjusted base: ${features.base_price:.2f}")
+    print(f"\nDynamic Factors:")
+    print(f"  Load factor: {features.load_factor * 100:.1f}%")
+    print(f"  Is holiday: {'Yes' if d['is_holiday'] else 'No'}")
+    print(f"  Tourist destination: {'Yes' if d['is_tourist_destination'] else 'No'}")
+    print(f"  Is weekend: {'Yes' if d['is_weekend'] else 'No'}")
+    print(f"  Is late booking: {'Yes' if d['is_late_booking'] else 'No'}")
+    print(f"  Calculated demand factor: {features.total_demand:.2f}")
+    print(f"\nDiscounts/Surcharges:")
+    print(f"  Advanced booking: -{d['adv_discount'] * 100:.1f}%")
+    print(f"  Special offers: -{d['special_discount_total'] * 100:.1f}%")
+    print(f"  Stop discount: -{d['stop_discount_val'] * 100:.1f}%")
+    print(f"  Roundtrip: -{d['roundtrip_discount_val'] * 100:.1f}%")
+    print(f"  Weekend surcharge: +{d['weekend_surcharge_val'] * 100:.1f}%")
+    print(f"  Holiday surcharge: +{d['holiday_surcharge'] * 100:.1f}%")
+    print(f"  Late booking: +{d['late_surcharge'] * 100:.1f}%")
+    print(f"  Luggage surcharge: +{d['luggage_surcharge_val'] * 100:.1f}%")
+    print(f"  Tourist surcharge: +{d['tourist_surcharge_val'] * 100:.1f}%")
+    print(f"\nCost Analysis:")
+    print(f"  Aircraft cost: ${d['aircraft_cost']:.2f}")
+    print(f"  Efficiency factor: {d['efficiency_factor']}")
+    print(f"  Aircraft capacity: {d['aircraft_capacity']}")
+    print(f"  Aircraft type: {d['aircraft_type']}")
+    print(f"  Aircraft cost factor: {d['aircraft_cost_factor']}")
+    print(f"  Minimum operating cost: ${features.operating_min:.2f}")
+    print(f"\nOptimized price: ${final_price}")
+    print("=" * 50 + "\n")
+
+
+def price_features(features: PricingFeatures, solver=None):
+    """Optimal price of ``features``, before the fallback and rounding; None when infeasible
+
+    ``solver`` names a backend of Service.solver_backends; the settings' one by default.
+    """
+    # solver_backends imports this module, so it is resolved at call time
+    from Service.solver_backends import get_backend
+    return get_backend(solver).solve_price(features)
+
+
+def dynamic_ticket_price(ticket: Ticket, solver=None, verbose=False, config: PricingConfig = None, load_factor=None):
+    config = config or get_pricing_config()
+    features = extract_pricing_features(ticket, config, load_factor)
+    price = price_features(features, solver or config.solver)
+
+    if price is None:
+        # Fallback: the expected price when the constraints cannot all hold
+        fallback_price = round(features.expected_price, 2)
         print(f"Optimization failed, using fallback price: ${fallback_price}")
-        return fallback_price
\ No newline at end of file
+        return fallback_price
+
+    final_price = round(price, 2)
+    if verbose:
+        print_price_breakdown(ticket, features, final_price)
+    return final_price
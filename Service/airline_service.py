@@ -1,16 +1,16 @@
-from PyQt5 import Qt
-from PyQt5.QtSvg import QSvgRenderer
-from PyQt5.QtGui import QPixmap, QPainter, QIcon, QColor
-from PyQt5.QtCore import QSize
-import requests
+from Service.http_session import get_session
+
 
 def load_svg_icon(url, size=40):
     """
     Load an SVG from a URL and return a QIcon.
     If the download fails, returns an empty icon.
     """
+    from PyQt5.QtSvg import QSvgRenderer
+    from PyQt5.QtGui import QPixmap, QPainter, QIcon, QColor
+
     try:
-        data = requests.get(url).content
+        data = get_session().get(url, timeout=10).content
         svg_renderer = QSvgRenderer(data)
         pixmap = QPixmap(size, size)
         pixmap.fill(QColor(0,0,0,0))
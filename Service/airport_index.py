@@ -0,0 +1,105 @@
+import csv
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from Service.distance_calculation import EARTH_RADIUS_KM
+
+# IATA airports of every country the app knows, extracted from the airportsdata project
+# (MIT; copyright notice and licence in countries/airports.LICENSE)
+AIRPORTS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "countries", "airports.csv")
+
+
+class Airport:
+    def __init__(self, iata, name, city, country, lat, lon):
+        self.iata = iata
+        self.name = name
+        self.city = city
+        self.country = country  # ISO 3166-1 alpha-2
+        self.lat = lat
+        self.lon = lon
+
+    def __repr__(self):
+        return f"Airport({self.iata}, {self.name}, {self.country})"
+
+
+def _unit_vectors(lat, lon):
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+def _chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0.0, 1.0))
+
+
+def _km_to_chord(distance_km):
+    return 2 * np.sin(min(distance_km, np.pi * EARTH_RADIUS_KM) / (2 * EARTH_RADIUS_KM))
+
+
+class AirportIndex:
+    """KD-tree over airport positions on the unit sphere.
+
+    Straight-line (chord) distance between unit vectors is monotonic in great-circle
+    distance, so the tree answers nearest / radius queries exactly; chords are
+    converted back to kilometres on the way out.
+    """
+
+    def __init__(self, airports):
+        from scipy.spatial import cKDTree
+
+        self.airports = list(airports)
+        self.by_iata = {airport.iata: i for i, airport in enumerate(self.airports)}
+        lat = np.array([airport.lat for airport in self.airports], dtype=float)
+        lon = np.array([airport.lon for airport in self.airports], dtype=float)
+        self._points = _unit_vectors(lat, lon)
+        self._tree = cKDTree(self._points)
+
+    def __contains__(self, iata):
+        return iata in self.by_iata
+
+    def get(self, iata):
+        i = self.by_iata.get(iata)
+        return None if i is None else self.airports[i]
+
+    def nearest(self, lat, lon, k=1):
+        """The ``k`` closest airports to a point as (Airport, distance_km) pairs, closest first"""
+        chords, indices = self._tree.query(_unit_vectors([lat], [lon])[0], k=k)
+        chords, indices = np.atleast_1d(chords), np.atleast_1d(indices)
+        return [(self.airports[i], float(d)) for i, d in zip(indices, _chord_to_km(chords)) if i < len(self.airports)]
+
+    def within_radius(self, lat, lon, radius_km):
+        """Airports no further than ``radius_km`` from a point as (Airport, distance_km) pairs, closest first"""
+        point = _unit_vectors([lat], [lon])[0]
+        indices = self._tree.query_ball_point(point, _km_to_chord(radius_km))
+        if not indices:
+            return []
+        distances = _chord_to_km(np.linalg.norm(self._points[indices] - point, axis=1))
+        order = np.argsort(distances)
+        return [(self.airports[indices[k]], float(distances[k])) for k in order]
+
+    def distance_km(self, iata1, iata2):
+        chord = np.linalg.norm(self._points[self.by_iata[iata1]] - self._points[self.by_iata[iata2]])
+        return float(_chord_to_km(chord))
+
+    def latlng(self, iata):
+        airport = self.airports[self.by_iata[iata]]
+        return [airport.lat, airport.lon]
+
+
+def load_airports(path=AIRPORTS_FILE):
+    with open(path, newline="", encoding="utf-8") as f:
+        return [
+            Airport(row["iata"], row["name"], row["city"], row["country"], float(row["lat"]), float(row["lon"]))
+            for row in csv.DictReader(f)
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_airport_index():
+    return AirportIndex(load_airports())
+
+
+def is_airport_code(value):
+    return isinstance(value, str) and len(value) == 3 and value.isupper() and value in get_airport_index()
@@ -1,27 +1,57 @@
-from wsgiref.headers import Headers
+from bisect import bisect_left
+from datetime import date, datetime
 
-import requests
-from datetime import datetime, timedelta
+from Service.feature_store import get_feature_store
+from Service.holiday_providers import ApiNinjasHolidayProvider, CompositeHolidayProvider, compare_providers
 
-from Service.distance_calculation import get_latlng
+# Holidays are computed locally where a rule table exists; the API fills in the other countries
+# and the lunar holidays the tables leave out
+HOLIDAY_PROVIDER = CompositeHolidayProvider()
 
 
-def get_holidays(country, api_key = "47N0J3bFDkwFUaYJTWtYTKjRzAUhIkvs7SF5pCDL") :
-    lat, lon = get_latlng(country)
-    url = f"https://api.api-ninjas.com/v1/holidays?country={country}&type=public_holiday"
-    Headers ={
-        "x-api-key" : api_key }
-    data = requests.get(url, headers= Headers).json()
-    return data
+def set_holiday_provider(provider):
+    global HOLIDAY_PROVIDER
+    HOLIDAY_PROVIDER = provider
 
-def exist_holidays(country, date_departure, date_retour):
-    holidays = get_holidays(country)
 
-    for holiday in holidays:
-        holiday_date = datetime.strptime(holiday['date'], '%Y-%m-%d').date()
-        if  date_departure.date() <= holiday_date <= date_retour.date() :
-            print(holiday_date)
-            return True
-    return False
+def validate_holidays(country, year, reference=None):
+    """Compare the active provider against api-ninjas (or ``reference``) for one country-year"""
+    return compare_providers(reference or ApiNinjasHolidayProvider(), HOLIDAY_PROVIDER, country, year)
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    return value
+
+
+def holiday_ordinals(country, year):
+    """Sorted holiday date ordinals for one country-year, from the snapshot or the active provider"""
+    store = get_feature_store()
+    ordinals = store.holiday_ordinals(country, year) if store is not None else None
+    if ordinals is not None:
+        return ordinals
+    return HOLIDAY_PROVIDER.holiday_ordinals(country, year)
 
 
+def get_holidays(country, year=None) :
+    """Sorted public holiday dates of ``country`` for ``year`` (default: the current year)"""
+    year = year or date.today().year
+    return [date.fromordinal(ordinal) for ordinal in holiday_ordinals(country, year)]
+
+
+def exist_holidays(country, date_departure, date_retour=None):
+    """True when a public holiday of ``country`` falls between departure and return (inclusive)"""
+    start = _as_date(date_departure)
+    end = _as_date(date_retour) or start
+
+    for year in range(start.year, end.year + 1):
+        ordinals = holiday_ordinals(country, year)
+        i = bisect_left(ordinals, start.toordinal())
+        if i < len(ordinals) and ordinals[i] <= end.toordinal():
+            return True
+    return False
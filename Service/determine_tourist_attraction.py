@@ -1,35 +1,114 @@
-import requests
+import threading
+import time
+
+import numpy as np
+
 from Service.IsoCountry import *
+from Service.feature_store import get_feature_store
+from Service.http_session import get_json
+from Service.persistent_cache import PersistentCache
 from constants.tourism_constants import *
 
-def number_arrivals(country) :
+ARRIVALS_TTL_SECONDS = 30 * 24 * 3600
+WORLD_BANK_PAGE_SIZE = 1000
+ALL_ARRIVALS_KEY = "__all__"
+
+ARRIVALS_CACHE = PersistentCache("arrivals", ARRIVALS_TTL_SECONDS)
+
+TOURISM_TTL_SECONDS = 24 * 3600
+
+TOURISM_CACHE = PersistentCache("tourism", TOURISM_TTL_SECONDS)
+_profiles = {}
+# guards _profiles and _fetch_locks only; fetches run under their country's lock
+_profiles_lock = threading.Lock()
+_fetch_locks = {}
+
+
+def _download_arrivals(country):
     isocountrycode= get_isocode(country)
     if isocountrycode is None :
         isocountrycode = country
     url=f"https://api.worldbank.org/v2/country/{isocountrycode}/indicator/ST.INT.ARVL?format=json"
-    data = requests.get(url).json()
+    data = get_json(url)
     indicators = data[1]
-    print(indicators)
     for indicator in indicators :
         if indicator["value"] is not None :
             return indicator["value"]
 
     return 0
 
-def country_rank (country) :
-    countries_dict={}
-    for country in IsoCountry :
-        x = number_arrivals(country)
-        print(x)
-        countries_dict[country] = x
 
-    rank_countries = dict(sorted(countries_dict.items(), key=lambda x: x[1], reverse=True))
+def _download_all_arrivals():
+    """ISO2 code -> most recent non-empty arrivals value, for every economy, page by page"""
+    url = "https://api.worldbank.org/v2/country/all/indicator/ST.INT.ARVL"
+    arrivals = {}
+    page, pages = 1, 1
+    while page <= pages:
+        meta, rows = get_json(url, params={"format": "json", "mrnev": 1, "per_page": WORLD_BANK_PAGE_SIZE, "page": page})
+        pages = int(meta["pages"])
+        for row in rows or []:
+            if row["value"] is not None:
+                arrivals.setdefault(row["country"]["id"], row["value"])
+        page += 1
+    return arrivals
 
-    return rank_countries
 
+class ArrivalsRanking:
+    """Countries sorted by arrivals once, so rank and top-k queries are slices and dict reads"""
 
-def classify_tourism(country):
-    arrivals = number_arrivals(country)
+    def __init__(self, arrivals_by_country):
+        self.ranked = sorted(arrivals_by_country.items(), key=lambda x: x[1], reverse=True)
+        self.positions = {country: position for position, (country, _) in enumerate(self.ranked, start=1)}
+
+    def top(self, k):
+        return self.ranked[:k]
+
+    def rank_of(self, country):
+        return self.positions.get(country)
+
+
+_ranking = None
+
+
+def load_all_arrivals(refresh=False):
+    """Country name -> arrivals for every IsoCountry entry from one bulk, persisted download"""
+    global _ranking
+    by_iso = None if refresh else ARRIVALS_CACHE.get(ALL_ARRIVALS_KEY)
+    if by_iso is None:
+        by_iso = ARRIVALS_CACHE.set(ALL_ARRIVALS_KEY, _download_all_arrivals())
+        _ranking = None
+        reset_tourism_classifier()
+    return {country: by_iso.get(iso, 0) for country, iso in IsoCountry.items()}
+
+
+def get_arrivals_ranking(refresh=False):
+    global _ranking
+    if _ranking is None or refresh:
+        _ranking = ArrivalsRanking(load_all_arrivals(refresh))
+    return _ranking
+
+
+def number_arrivals(country) :
+    store = get_feature_store()
+    arrivals = store.arrivals(country) if store is not None else None
+    if arrivals is not None:
+        return arrivals
+    by_iso = ARRIVALS_CACHE.get(ALL_ARRIVALS_KEY)
+    if by_iso is not None and get_isocode(country) is not None:
+        return by_iso.get(get_isocode(country), 0)
+    return ARRIVALS_CACHE.get_or_fetch(country, lambda: _download_arrivals(country))
+
+
+def country_rank (country=None) :
+    return dict(get_arrivals_ranking().ranked)
+
+
+def top_countries(k):
+    """The ``k`` countries with the most arrivals as (country, arrivals) pairs"""
+    return get_arrivals_ranking().top(k)
+
+
+def _classify_arrivals(arrivals):
     if arrivals is None:
         return NO_DATA
 
@@ -41,3 +120,136 @@ def classify_tourism(country):
         return MODERATE_TOURIST_DESTINATION
     else:
         return LOW_TOURIST_DESTINATION
+
+
+class TourismClassifier:
+    """Percentile bands over every country's arrivals; all countries are classified in one NumPy pass"""
+
+    def __init__(self, arrivals_by_country, percentiles=TOURISM_PERCENTILE_BANDS):
+        self.countries = list(arrivals_by_country)
+        self.index = {country: i for i, country in enumerate(self.countries)}
+        arrivals = np.array([np.nan if v is None else v for v in arrivals_by_country.values()], dtype=float)
+        reported = arrivals[arrivals > 0]
+        self.thresholds = np.percentile(reported, percentiles) if reported.size else np.full(len(percentiles), np.inf)
+        self.labels = np.array(TOURISM_CLASSES + (NO_DATA,), dtype=object)
+        self.classes = self._label(arrivals)
+
+    def _label(self, arrivals):
+        bands = np.searchsorted(self.thresholds, arrivals, side="right")
+        return self.labels[np.where(np.isnan(arrivals), len(TOURISM_CLASSES), bands)]
+
+    def classify(self, country):
+        i = self.index.get(country)
+        return None if i is None else self.classes[i]
+
+    def classify_many(self, countries):
+        """Classes of ``countries`` as an array; None where a country is not in the table"""
+        rows = np.fromiter((self.index.get(country, -1) for country in countries), dtype=np.int64)
+        return np.where(rows >= 0, self.classes[rows], None)
+
+    def classify_arrivals(self, arrivals):
+        return self._label(np.array([np.nan if arrivals is None else arrivals], dtype=float))[0]
+
+
+CLASSIFIER_RETRY_SECONDS = 300
+
+_classifier = None
+_classifier_failed_at = None
+_classifier_lock = threading.Lock()
+
+
+def get_tourism_classifier(refresh=False):
+    """Classifier over the snapshot arrivals, or the World Bank bulk table when there is no snapshot"""
+    global _classifier
+    with _classifier_lock:
+        if _classifier is None or refresh:
+            store = get_feature_store()
+            if store is not None and not refresh:
+                arrivals = {country: store.arrivals(country) for country in store.countries}
+            else:
+                arrivals = load_all_arrivals(refresh)
+            _classifier = TourismClassifier(arrivals)
+        return _classifier
+
+
+def reset_tourism_classifier():
+    global _classifier
+    _classifier = None
+
+
+def _try_classifier():
+    """The classifier, or None (without retrying the download for a while) when it cannot be built"""
+    global _classifier_failed_at
+    if _classifier is None and _classifier_failed_at and time.time() - _classifier_failed_at < CLASSIFIER_RETRY_SECONDS:
+        return None
+    try:
+        return get_tourism_classifier()
+    except Exception as e:
+        _classifier_failed_at = time.time()
+        print(f"Tourism classifier unavailable, using fixed thresholds: {e}")
+        return None
+
+
+class TourismProfile:
+    def __init__(self, country, arrivals, classification, refreshed_at):
+        self.country = country
+        self.arrivals = arrivals
+        self.classification = classification
+        self.refreshed_at = refreshed_at
+
+    def is_hotspot(self):
+        return self.classification in TOURIST_HOTSPOT_CLASSES
+
+    def to_dict(self):
+        return {"arrivals": self.arrivals, "classification": self.classification, "refreshed_at": self.refreshed_at}
+
+    @classmethod
+    def from_dict(cls, country, data):
+        return cls(country, data["arrivals"], data["classification"], data["refreshed_at"])
+
+
+def _build_tourism_profile(country):
+    arrivals = number_arrivals(country)
+    classifier = _try_classifier()
+    classification = classifier.classify_arrivals(arrivals) if classifier else _classify_arrivals(arrivals)
+    return TourismProfile(country, arrivals, classification, time.time()).to_dict()
+
+
+def _fresh_profile(country):
+    with _profiles_lock:
+        profile = _profiles.get(country)
+    if profile is not None and time.time() - profile.refreshed_at < TOURISM_TTL_SECONDS:
+        return profile
+    return None
+
+
+def get_tourism_profile(country, refresh=False):
+    """Arrivals and classification of ``country``, memoized in-process and on disk for TOURISM_TTL_SECONDS"""
+    profile = None if refresh else _fresh_profile(country)
+    if profile is not None:
+        return profile
+
+    with _profiles_lock:
+        fetch_lock = _fetch_locks.setdefault(country, threading.Lock())
+    # one fetch per country at a time; other countries and cached lookups are not held up
+    with fetch_lock:
+        profile = None if refresh else _fresh_profile(country)
+        if profile is not None:
+            return profile
+        store = get_feature_store()
+        if not refresh and store is not None and store.classification(country):
+            profile = TourismProfile(country, store.arrivals(country), store.classification(country), time.time())
+        else:
+            if refresh:
+                TOURISM_CACHE.invalidate(country)
+            data = TOURISM_CACHE.get_or_fetch(country, lambda: _build_tourism_profile(country))
+            profile = TourismProfile.from_dict(country, data)
+        with _profiles_lock:
+            _profiles[country] = profile
+        return profile
+
+
+def classify_tourism(country):
+    classifier = _try_classifier()
+    classification = classifier.classify(country) if classifier else None
+    return classification or get_tourism_profile(country).classification
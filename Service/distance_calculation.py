@@ -1,20 +1,139 @@
-import requests
 import math
+from itertools import repeat
+
+import numpy as np
+
+from Service.IsoCountry import IsoCountry
+from Service.feature_store import get_feature_store
+from Service.http_session import get_json
+from Service.persistent_cache import PersistentCache
+from countries.country_to_iso import COUNTRY_TO_ISO
+from countries.country_centroids import COUNTRY_CENTROIDS, REGION_CENTROIDS
+
+EARTH_RADIUS_KM = 6371
+GEOCODE_TTL_SECONDS = 30 * 24 * 3600
+
+GEOCODE_CACHE = PersistentCache("geocode", GEOCODE_TTL_SECONDS)
 
-def get_latlng(country):
-    url = f"https://restcountries.com/v3.1/name/{country}?fields=latlng"
-    data = requests.get(url).json()
-    return data[0]["latlng"]
 
 def calculate_distance_km(lat1, lon1, lat2, lon2):
-    R = 6371
+    R = EARTH_RADIUS_KM
     d_lat = math.radians(lat2 - lat1)
     d_lon = math.radians(lon2 - lon1)
     a = math.sin(d_lat/2)**2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lon/2)**2
     return 2 * R * math.asin(math.sqrt(a))
 
+
+def calculate_distances_km(lat1, lon1, lat2, lon2):
+    """Vectorized calculate_distance_km: element-wise over equally shaped arrays of degrees"""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _bundled_coordinates():
+    """Country name -> (lat, lng) for every name known to IsoCountry and COUNTRY_TO_ISO"""
+    coordinates = {}
+    for country, iso in list(IsoCountry.items()) + list(COUNTRY_TO_ISO.items()):
+        coordinates[country] = REGION_CENTROIDS.get(country, COUNTRY_CENTROIDS[iso])
+    return coordinates
+
+
+def _startup_coordinates():
+    """Bundled centroids, overridden by the feature store snapshot when one has been built"""
+    coordinates = _bundled_coordinates()
+    store = get_feature_store()
+    if store is not None:
+        coordinates.update(store.coordinates())
+    return coordinates
+
+
+def _haversine_matrix(latlng):
+    """All-pairs great-circle distances (km) for an (n, 2) array of lat/lng degrees"""
+    lat = latlng[:, 0]
+    lon = latlng[:, 1]
+    return calculate_distances_km(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+
+
+def _build_table(coordinates):
+    global COUNTRY_COORDINATES, COUNTRY_INDEX, DISTANCE_MATRIX
+    COUNTRY_COORDINATES = coordinates
+    COUNTRY_INDEX = {country: i for i, country in enumerate(coordinates)}
+    DISTANCE_MATRIX = _haversine_matrix(np.array(list(coordinates.values()), dtype=float).reshape(-1, 2))
+
+
+COUNTRY_COORDINATES = {}
+COUNTRY_INDEX = {}
+DISTANCE_MATRIX = None
+_build_table(_startup_coordinates())
+
+
+def _download_latlng(country):
+    url = f"https://restcountries.com/v3.1/name/{country}?fields=latlng"
+    data = get_json(url)
+    return data[0]["latlng"]
+
+
+def fetch_latlng(country):
+    """Live lookup against restcountries.com, answered from the geocode cache when possible"""
+    return GEOCODE_CACHE.get_or_fetch(country, lambda: _download_latlng(country))
+
+
+def warm_geocode_cache(countries=None):
+    """Fetch every country missing from the geocode cache; returns the cache stats"""
+    for country in countries or IsoCountry:
+        try:
+            fetch_latlng(country)
+        except Exception as e:
+            print(f"Could not geocode {country}: {e}")
+    return GEOCODE_CACHE.stats()
+
+
+def refresh_centroids(countries=None):
+    """Re-download centroids from the live API and rebuild the distance matrix.
+
+    Countries the API cannot resolve keep their bundled coordinates.
+    """
+    coordinates = dict(COUNTRY_COORDINATES)
+    for country in countries or list(coordinates):
+        try:
+            lat, lng = GEOCODE_CACHE.set(country, _download_latlng(country))
+            coordinates[country] = (float(lat), float(lng))
+        except Exception as e:
+            print(f"Could not refresh centroid for {country}: {e}")
+    _build_table(coordinates)
+    return COUNTRY_COORDINATES
+
+
+def get_latlng(country):
+    if country in COUNTRY_COORDINATES:
+        return list(COUNTRY_COORDINATES[country])
+    return fetch_latlng(country)
+
+
 def distance_between_countries(country1, country2):
+    i = COUNTRY_INDEX.get(country1)
+    j = COUNTRY_INDEX.get(country2)
+    if i is not None and j is not None:
+        return float(DISTANCE_MATRIX[i, j])
     lat1, lon1 = get_latlng(country1)
     lat2, lon2 = get_latlng(country2)
     return calculate_distance_km(lat1, lon1, lat2, lon2)
 
+
+def distances_between_countries(pairs):
+    """Distances (km) for a sequence of (country1, country2) pairs as a NumPy array"""
+    pairs = list(pairs)
+    if not pairs:
+        return np.empty(0)
+    origins, destinations = zip(*pairs)
+    i = np.fromiter(map(COUNTRY_INDEX.get, origins, repeat(-1)), dtype=np.intp, count=len(pairs))
+    j = np.fromiter(map(COUNTRY_INDEX.get, destinations, repeat(-1)), dtype=np.intp, count=len(pairs))
+    distances = DISTANCE_MATRIX[i, j]
+
+    unknown = np.flatnonzero((i < 0) | (j < 0))
+    if unknown.size:
+        latlng1 = np.array([get_latlng(origins[k]) for k in unknown], dtype=float)
+        latlng2 = np.array([get_latlng(destinations[k]) for k in unknown], dtype=float)
+        distances[unknown] = calculate_distances_km(latlng1[:, 0], latlng1[:, 1], latlng2[:, 0], latlng2[:, 1])
+    return distances
@@ -0,0 +1,106 @@
+import threading
+
+import numpy as np
+
+from Service import settings_service
+from Service.GurobyResolver import TICKET_INPUT_COLUMNS, flight_inputs, price_input_arrays, seat_inputs
+from Service.quote_cache import bucket_load_factor, load_factor_bucket
+from constants.Airline_Specific_Constants.Seat_Types import SeatTypes
+
+# The pricing model only tells advance bookings (more than 60 days out) from the rest,
+# so "normal" and "late" bookings share one window
+ADVANCE_WINDOW, LATE_WINDOW = 0, 1
+BOOKING_WINDOWS = ("advance", "late")
+
+
+def _seat_key(seat_type):
+    return seat_type.lower().replace(" ", "_")
+
+
+class FareGrid:
+    """Prices of one flight for every seat class x booking window x weekend x luggage x offer set
+
+    ``prices[seat, window, weekend, luggage, offers]`` where ``offers`` is a bitmask over
+    ``offer_names``. Priced at the midpoint of the flight's load factor bucket, like the quote cache.
+    """
+
+    def __init__(self, flight, config, bucket):
+        self.config_version = config.version
+        self.bucket = bucket
+        self.seat_types = list(SeatTypes)
+        self.seat_index = {_seat_key(seat_type): i for i, seat_type in enumerate(self.seat_types)}
+        self.offer_names = list(config.special_offers)
+        self.offer_index = {name: i for i, name in enumerate(self.offer_names)}
+
+        shape = (len(self.seat_types), len(BOOKING_WINDOWS), 2, 2, 2 ** len(self.offer_names))
+        seat, window, weekend, luggage, offers = (axis.ravel() for axis in np.indices(shape))
+        offer_bits = (offers[:, None] >> np.arange(len(self.offer_names))) & 1
+        seats = np.array([seat_inputs(seat_type, config) for seat_type in self.seat_types], dtype=float)
+
+        flight_columns = flight_inputs(flight, config, bucket_load_factor(bucket))
+        columns = {
+            name: np.full(seat.size, float(flight_columns[name]))
+            for name in TICKET_INPUT_COLUMNS if name in flight_columns
+        }
+        columns.update(
+            seat_factor=seats[seat, 0],
+            is_premium_seat=seats[seat, 1],
+            is_advanced_booking=(window == ADVANCE_WINDOW).astype(float),
+            is_late_booking=(window == LATE_WINDOW).astype(float),
+            is_weekend=weekend.astype(float),
+            has_extra_luggage=luggage.astype(float),
+            special_discount_total=offer_bits @ np.array(list(config.special_offers.values()), dtype=float),
+        )
+        prices, _ = price_input_arrays(columns, config)
+        self.prices = prices.reshape(shape)
+
+    def price(self, seat_type, is_advanced_booking, is_weekend, extra_luggage, offer_names=()):
+        """The grid price, or None when the seat type or an offer is not in the grid"""
+        seat = self.seat_index.get(_seat_key(seat_type))
+        if seat is None:
+            return None
+        mask = 0
+        for name in offer_names:
+            bit = self.offer_index.get(name.lower())
+            if bit is None or mask & (1 << bit):
+                return None
+            mask |= 1 << bit
+        window = ADVANCE_WINDOW if is_advanced_booking else LATE_WINDOW
+        return float(self.prices[seat, window, int(bool(is_weekend)), int(bool(extra_luggage)), mask])
+
+
+_grids = {}
+_grids_lock = threading.Lock()
+
+
+def build_fare_grid(flight):
+    config = settings_service.get_pricing_config()
+    grid = FareGrid(flight, config, load_factor_bucket(flight))
+    with _grids_lock:
+        _grids[flight] = grid
+    return grid
+
+
+def get_fare_grid(flight):
+    """The flight's grid, rebuilt first if the settings or its load factor bucket moved; None if not registered"""
+    grid = _grids.get(flight)
+    if grid is None:
+        return None
+    if grid.config_version != settings_service.get_pricing_config().version or grid.bucket != load_factor_bucket(flight):
+        grid = build_fare_grid(flight)
+    return grid
+
+
+def drop_fare_grid(flight):
+    with _grids_lock:
+        _grids.pop(flight, None)
+
+
+def ticket_fare(ticket):
+    """Price of ``ticket`` from its flight's grid, or None when the grid cannot answer"""
+    grid = get_fare_grid(ticket.flight)
+    if grid is None or getattr(ticket, "is_student", False):
+        return None
+    offers = [offer.name for offer in getattr(ticket, "specialoffers", [])]
+    return grid.price(ticket.seat_type, ticket.is_advanced_booking(), ticket.is_weekend(),
+                      getattr(ticket, "extra_luggage", False), offers)
@@ -0,0 +1,193 @@
+"""Country feature store: one local snapshot of every per-country input the app uses.
+
+Build it offline (network allowed) with:
+    python -m Service.feature_store build [--years 2026 2027] [--output PATH]
+
+At runtime the Service modules read from the snapshot first and only fall back to
+their own caches / providers / APIs for what it does not contain.
+"""
+import argparse
+import os
+import threading
+import time
+from datetime import date
+
+import numpy as np
+
+from Service.persistent_cache import CACHE_DIR
+
+SNAPSHOT_FILE = os.environ.get("RO_FEATURE_SNAPSHOT", os.path.join(CACHE_DIR, "country_features.npz"))
+SNAPSHOT_VERSION = 2
+
+
+class CountryFeatures:
+    """Read-only view over a loaded snapshot; every lookup is a dict read plus an array index"""
+
+    def __init__(self, arrays):
+        self.countries = [str(country) for country in arrays["countries"]]
+        self.index = {country: i for i, country in enumerate(self.countries)}
+        self.iso = arrays["iso"]
+        self.latlng_array = arrays["latlng"]
+        self.holiday_years = [int(year) for year in arrays["holiday_years"]]
+        self.holiday_offsets = arrays["holiday_offsets"]
+        self.holiday_ordinals_array = arrays["holiday_ordinals"]
+        self.arrivals_array = arrays["arrivals"]
+        self.classification_array = arrays["classification"]
+        self.built_at = float(arrays["built_at"])
+
+    def __contains__(self, country):
+        return country in self.index
+
+    def coordinates(self):
+        return {country: tuple(float(v) for v in self.latlng_array[i]) for i, country in enumerate(self.countries)}
+
+    def latlng(self, country):
+        i = self.index.get(country)
+        return None if i is None else [float(v) for v in self.latlng_array[i]]
+
+    def isocode(self, country):
+        i = self.index.get(country)
+        return None if i is None else str(self.iso[i])
+
+    def holiday_ordinals(self, country, year):
+        """Sorted holiday ordinals, or None when the country or year is not in the snapshot"""
+        i = self.index.get(country)
+        if i is None or year not in self.holiday_years:
+            return None
+        cell = i * len(self.holiday_years) + self.holiday_years.index(year)
+        start, end = self.holiday_offsets[cell], self.holiday_offsets[cell + 1]
+        return self.holiday_ordinals_array[start:end].tolist()
+
+    def arrivals(self, country):
+        i = self.index.get(country)
+        if i is None or np.isnan(self.arrivals_array[i]):
+            return None
+        return float(self.arrivals_array[i])
+
+    def classification(self, country):
+        i = self.index.get(country)
+        return None if i is None else str(self.classification_array[i])
+
+
+_store = None
+_store_loaded = False
+_store_lock = threading.Lock()
+
+
+def load_feature_store(path=SNAPSHOT_FILE):
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as arrays:
+            if int(arrays["version"]) != SNAPSHOT_VERSION:
+                print(f"Ignoring feature snapshot {path}: version {int(arrays['version'])} != {SNAPSHOT_VERSION}")
+                return None
+            return CountryFeatures({key: arrays[key] for key in arrays.files})
+    except Exception as e:
+        print(f"Could not load feature snapshot {path}: {e}")
+        return None
+
+
+def get_feature_store():
+    """The snapshot at SNAPSHOT_FILE, loaded on first use; None when there is none"""
+    global _store, _store_loaded
+    if not _store_loaded:
+        with _store_lock:
+            if not _store_loaded:
+                _store = load_feature_store()
+                _store_loaded = True
+    return _store
+
+
+def reload_feature_store():
+    global _store_loaded
+    _store_loaded = False
+    return get_feature_store()
+
+
+def build_snapshot(path=SNAPSHOT_FILE, years=None):
+    """Gather every per-country input into ``path``; meant to run offline with network access"""
+    from Service import determine_holidays, determine_tourist_attraction
+    from Service.distance_calculation import COUNTRY_COORDINATES
+    from Service.IsoCountry import IsoCountry
+    from countries.country_to_iso import COUNTRY_TO_ISO
+
+    global _store, _store_loaded
+    years = sorted(years or (date.today().year, date.today().year + 1))
+    countries = list(COUNTRY_COORDINATES)
+    iso_codes = {**COUNTRY_TO_ISO, **IsoCountry}
+
+    # gather from the sources themselves, not from the snapshot being replaced
+    with _store_lock:
+        _store, _store_loaded = None, True
+
+    holiday_ordinals, holiday_offsets = [], [0]
+    for country in countries:
+        for year in years:
+            try:
+                holiday_ordinals.extend(determine_holidays.holiday_ordinals(country, year))
+            except Exception as e:
+                print(f"No holidays for {country} {year}: {e}")
+            holiday_offsets.append(len(holiday_ordinals))
+
+    try:
+        determine_tourist_attraction.load_all_arrivals(refresh=True)
+    except Exception as e:
+        print(f"Bulk arrivals download failed ({e}), falling back to per-country lookups")
+    arrivals = np.full(len(countries), np.nan)
+    classification = []
+    for i, country in enumerate(countries):
+        try:
+            profile = determine_tourist_attraction.get_tourism_profile(country, refresh=True)
+            arrivals[i] = profile.arrivals
+            classification.append(profile.classification)
+        except Exception as e:
+            print(f"No arrivals for {country}: {e}")
+            classification.append("")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp.npz"
+    np.savez(
+        tmp_path,
+        version=np.int64(SNAPSHOT_VERSION),
+        built_at=np.float64(time.time()),
+        countries=np.array(countries),
+        iso=np.array([iso_codes.get(country, "") for country in countries]),
+        latlng=np.array([COUNTRY_COORDINATES[country] for country in countries], dtype=float),
+        holiday_years=np.array(years, dtype=np.int64),
+        holiday_offsets=np.array(holiday_offsets, dtype=np.int64),
+        holiday_ordinals=np.array(holiday_ordinals, dtype=np.int64),
+        arrivals=arrivals,
+        classification=np.array(classification),
+    )
+    os.replace(tmp_path, path)
+    reload_feature_store()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Country feature store snapshot")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    build = subcommands.add_parser("build", help="gather every per-country input into one snapshot file")
+    build.add_argument("--output", default=SNAPSHOT_FILE)
+    build.add_argument("--years", type=int, nargs="+")
+    subcommands.add_parser("info", help="describe the current snapshot")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        start = time.perf_counter()
+        path = build_snapshot(args.output, args.years)
+        print(f"Snapshot written to {path} in {time.perf_counter() - start:.1f}s")
+    else:
+        start = time.perf_counter()
+        store = load_feature_store()
+        elapsed = (time.perf_counter() - start) * 1000
+        if store is None:
+            print(f"No snapshot at {SNAPSHOT_FILE}")
+        else:
+            print(f"{SNAPSHOT_FILE}: {len(store.countries)} countries, holiday years {store.holiday_years}, "
+                  f"built {time.ctime(store.built_at)}, loaded in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from Service.IsoCountry import IsoCountry
+from Service.determine_holidays import holiday_ordinals
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _day_ordinals(values):
+    """Date-like values (date, datetime, 'YYYY-MM-DD', datetime64) -> int64 array of proleptic ordinals"""
+    days = np.asarray(values, dtype="datetime64[D]").astype(np.int64)
+    return days + _EPOCH_ORDINAL
+
+
+class HolidayMatrix:
+    """Country x day boolean holiday calendar with a running count per country.
+
+    ``overlap`` answers "how many holidays fall in [departure, return]" for whole arrays of
+    flights with two gathers from the cumulative counts. Days outside the years the matrix was
+    built for count as non-holidays.
+    """
+
+    def __init__(self, first_year, last_year, countries=None, calendar=holiday_ordinals):
+        self.countries = list(countries or IsoCountry)
+        self.index = {country: i for i, country in enumerate(self.countries)}
+        self.first_ordinal = date(first_year, 1, 1).toordinal()
+        self.n_days = date(last_year, 12, 31).toordinal() - self.first_ordinal + 1
+
+        self.is_holiday = np.zeros((len(self.countries), self.n_days), dtype=bool)
+        for row, country in enumerate(self.countries):
+            for year in range(first_year, last_year + 1):
+                try:
+                    ordinals = np.asarray(calendar(country, year), dtype=np.int64)
+                except Exception as e:
+                    print(f"No holiday calendar for {country} {year}: {e}")
+                    continue
+                self.is_holiday[row, ordinals - self.first_ordinal] = True
+
+        self._cumulative = np.zeros((len(self.countries), self.n_days + 1), dtype=np.int32)
+        np.cumsum(self.is_holiday, axis=1, out=self._cumulative[:, 1:])
+
+    def holiday_counts(self, destinations, departures, returns):
+        """Holiday days of each destination within each [departure, return] interval"""
+        rows = np.fromiter((self.index.get(country, -1) for country in destinations), dtype=np.intp)
+        start = np.clip(_day_ordinals(departures) - self.first_ordinal, 0, self.n_days)
+        end = np.clip(_day_ordinals(returns) - self.first_ordinal + 1, 0, self.n_days)
+        end = np.maximum(end, start)
+
+        known = rows >= 0
+        counts = np.zeros(len(rows), dtype=np.int32)
+        counts[known] = self._cumulative[rows[known], end[known]] - self._cumulative[rows[known], start[known]]
+        return counts
+
+    def overlap(self, destinations, departures, returns):
+        """(overlap flags, holiday-day counts) for arrays of (destination, departure, return)"""
+        counts = self.holiday_counts(destinations, departures, returns)
+        return counts > 0, counts
+
+
+@lru_cache(maxsize=4)
+def get_holiday_matrix(first_year=None, last_year=None):
+    first_year = first_year or date.today().year
+    return HolidayMatrix(first_year, last_year or first_year + 1)
+
+
+def bulk_holiday_overlap(destinations, departures, returns):
+    """Vectorized exist_holidays over whole schedules: returns (overlap flags, holiday-day counts)"""
+    departures = np.asarray(departures, dtype="datetime64[D]")
+    returns = np.asarray(returns, dtype="datetime64[D]")
+    # one-way flights (no return date) cover their departure day only, like exist_holidays
+    returns = np.where(np.isnat(returns), departures, returns)
+    if departures.size == 0:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=np.int32)
+    first_year = departures.min().astype(object).year
+    last_year = returns.max().astype(object).year
+    return get_holiday_matrix(first_year, last_year).overlap(destinations, departures, returns)
@@ -0,0 +1,114 @@
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from Service import holiday_rules
+from Service.http_session import get_json
+from Service.persistent_cache import PersistentCache
+
+HOLIDAY_TTL_SECONDS = 30 * 24 * 3600
+# after a failed fallback lookup, lunar countries use their rule table alone for this long
+FALLBACK_RETRY_SECONDS = 300
+API_NINJAS_KEY = "47N0J3bFDkwFUaYJTWtYTKjRzAUhIkvs7SF5pCDL"
+
+
+class HolidayProvider(ABC):
+    """Source of public holidays; returns sorted date ordinals for one country-year"""
+    name = "base"
+
+    @abstractmethod
+    def holiday_ordinals(self, country, year):
+        """Sorted holiday date ordinals of ``country`` in ``year``"""
+
+
+class RuleHolidayProvider(HolidayProvider):
+    """Computes holidays locally from constants.holiday_rules, no network involved"""
+    name = "rules"
+
+    def holiday_ordinals(self, country, year):
+        return holiday_rules.holiday_ordinals(country, year)
+
+
+class ApiNinjasHolidayProvider(HolidayProvider):
+    """api-ninjas.com holidays, fetched once per country-year and persisted"""
+    name = "api-ninjas"
+
+    def __init__(self, api_key=API_NINJAS_KEY, cache=None):
+        self.api_key = api_key
+        # "<country>:<year>" -> sorted list of holiday date ordinals
+        self.cache = cache or PersistentCache("holiday_calendar", HOLIDAY_TTL_SECONDS)
+
+    def _download(self, country, year):
+        url = "https://api.api-ninjas.com/v1/holidays"
+        Headers ={
+            "x-api-key" : self.api_key }
+        params = {"country": country, "year": year, "type": "public_holiday"}
+        holidays = get_json(url, headers=Headers, params=params)
+        return sorted({datetime.strptime(holiday['date'], '%Y-%m-%d').toordinal() for holiday in holidays})
+
+    def holiday_ordinals(self, country, year):
+        return self.cache.get_or_fetch(f"{country}:{year}", lambda: self._download(country, year))
+
+    def refresh(self, country, year):
+        return self.cache.set(f"{country}:{year}", self._download(country, year))
+
+
+class CompositeHolidayProvider(HolidayProvider):
+    """Rules where constants.holiday_rules has a table, the fallback (api-ninjas, persisted) otherwise
+
+    Tables of LUNAR_HOLIDAY_COUNTRIES miss their lunar holidays, so those get both sources merged;
+    when the fallback cannot answer they keep the rule dates alone. After a failure the fallback
+    is not asked again for a while: for that country-year, or for every country when it could
+    not be reached at all.
+    """
+    name = "composite"
+
+    def __init__(self, rules=None, fallback=None):
+        self.rules = rules or RuleHolidayProvider()
+        self.fallback = fallback or ApiNinjasHolidayProvider()
+        # (country, year) -> time of the last failed fallback lookup
+        self._failed_at = {}
+        self._unreachable_at = 0.0
+
+    def _fallback_ordinals(self, country, year):
+        """The fallback's ordinals; None while it is backing off after a failure"""
+        now = time.time()
+        if now - max(self._unreachable_at, self._failed_at.get((country, year), 0.0)) < FALLBACK_RETRY_SECONDS:
+            return None
+        try:
+            return self.fallback.holiday_ordinals(country, year)
+        except Exception as e:
+            # an error without an HTTP response (DNS, refused, timeout) means nothing can be fetched
+            if isinstance(e, OSError) and getattr(e, "response", None) is None:
+                self._unreachable_at = now
+            else:
+                self._failed_at[(country, year)] = now
+            raise
+
+    def holiday_ordinals(self, country, year):
+        if not holiday_rules.has_rules(country):
+            ordinals = self._fallback_ordinals(country, year)
+            if ordinals is None:
+                raise LookupError(f"No holiday rules for {country} and {self.fallback.name} failed recently")
+            return ordinals
+        ordinals = self.rules.holiday_ordinals(country, year)
+        if not holiday_rules.has_lunar_holidays(country):
+            return ordinals
+        try:
+            lunar = self._fallback_ordinals(country, year)
+        except Exception as e:
+            print(f"No {self.fallback.name} holidays for {country} {year}, using the rule table only: {e}")
+            return ordinals
+        if lunar is None:
+            return ordinals
+        return sorted(set(ordinals) | set(lunar))
+
+
+def compare_providers(reference, candidate, country, year):
+    """Dates ``candidate`` misses or adds compared to ``reference`` for one country-year"""
+    expected = set(reference.holiday_ordinals(country, year))
+    actual = set(candidate.holiday_ordinals(country, year))
+    return {
+        "missing": sorted(datetime.fromordinal(o).date() for o in expected - actual),
+        "extra": sorted(datetime.fromordinal(o).date() for o in actual - expected),
+    }
@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+from functools import lru_cache
+
+from constants.holiday_rules import HOLIDAY_RULE_ALIASES, HOLIDAY_RULES, LUNAR_HOLIDAY_COUNTRIES
+
+
+def easter_sunday(year):
+    """Western (Gregorian) Easter Sunday, anonymous Gregorian computus"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def orthodox_easter(year):
+    """Orthodox Easter Sunday as a Gregorian date (Meeus' Julian computus)"""
+    a = year % 4
+    b = year % 7
+    c = year % 19
+    d = (19 * c + 15) % 30
+    e = (2 * a + 4 * b - d + 34) % 7
+    month, day = divmod(d + e + 114, 31)
+    julian_to_gregorian = year // 100 - year // 400 - 2
+    return date(year, month, day + 1) + timedelta(days=julian_to_gregorian)
+
+
+def nth_weekday(year, month, weekday, n):
+    """n-th ``weekday`` (Monday = 0) of the month; n = -1 is the last one"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7 + 7 * (-n - 1))
+
+
+def weekday_on_or_before(year, month, day, weekday):
+    anchor = date(year, month, day)
+    return anchor - timedelta(days=(anchor.weekday() - weekday) % 7)
+
+
+def rule_date(rule, year):
+    kind, args = rule[1], rule[2:]
+    if kind == "fixed":
+        return date(year, *args)
+    if kind == "easter":
+        return easter_sunday(year) + timedelta(days=args[0])
+    if kind == "orthodox_easter":
+        return orthodox_easter(year) + timedelta(days=args[0])
+    if kind == "nth_weekday":
+        return nth_weekday(year, *args)
+    if kind == "weekday_before":
+        return weekday_on_or_before(year, *args)
+    raise ValueError(f"Unknown holiday rule kind: {kind}")
+
+
+def country_rules(country):
+    """The rule table of ``country``, or None when it has none"""
+    return HOLIDAY_RULES.get(HOLIDAY_RULE_ALIASES.get(country, country))
+
+
+def has_rules(country):
+    return country_rules(country) is not None
+
+
+def has_lunar_holidays(country):
+    """True when the country's table leaves out holidays on lunar or astronomical calendars"""
+    return HOLIDAY_RULE_ALIASES.get(country, country) in LUNAR_HOLIDAY_COUNTRIES
+
+
+@lru_cache(maxsize=4096)
+def holiday_calendar(country, year):
+    """Sorted tuple of (date, name) public holidays of ``country`` in ``year``"""
+    rules = country_rules(country)
+    if rules is None:
+        raise LookupError(f"No holiday rules for {country}")
+    holidays = {}
+    for rule in rules:
+        holidays.setdefault(rule_date(rule, year), rule[0])
+    return tuple(sorted(holidays.items()))
+
+
+def holiday_ordinals(country, year):
+    return [day.toordinal() for day, _ in holiday_calendar(country, year)]
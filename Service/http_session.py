@@ -0,0 +1,31 @@
+import threading
+
+DEFAULT_TIMEOUT = 10  # seconds
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Process-wide keep-alive session shared by every external API call"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # requests is only imported once something actually goes to the network
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def get_json(url, headers=None, params=None, timeout=DEFAULT_TIMEOUT):
+    response = get_session().get(url, headers=headers, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
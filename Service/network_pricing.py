@@ -0,0 +1,226 @@
+"""Prices for every flight at once: one LP with shared capacity and market demand constraints.
+
+Each flight x seat class may sell at a few price points between the lowest price the pricing
+constraints allow and its per-ticket price. Variables are seats sold per point; demand grows as
+the price drops. Rows:
+
+* one per flight x class: the sales over its price points use at most all of the class demand
+* one per flight: seats sold stay within the remaining seats (the duals are the bid prices)
+* one per market (destination country): the flights into it share one pool of travellers
+
+The model is assembled as scipy.sparse matrices and handed to Gurobi through the matrix API
+(``addMVar`` / ``addMConstr``), so the build cost scales with the number of non-zeros rather
+than with Python calls per variable.
+"""
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from Service.GurobyResolver import TICKET_INPUT_COLUMNS, flight_inputs, get_gurobi_env, price_input_arrays, seat_inputs
+from Service.settings_service import get_pricing_config
+from constants.Airline_Specific_Constants.Demand_Forecast import (
+    BASE_DEMAND_TO_CAPACITY,
+    CLASS_DEMAND_SHARE,
+    MARKET_DEMAND_OVERLAP,
+    NETWORK_PRICE_POINTS,
+    PRICE_ELASTICITY,
+)
+from constants.Airline_Specific_Constants.Seat_Types import SeatTypes
+
+
+class NetworkPricingProblem:
+    """Arrays of the network LP; ``(n_flights, n_classes)`` unless noted"""
+
+    def __init__(self, low_price, high_price, mean_demand, capacity, market, market_demand=None,
+                 price_points=NETWORK_PRICE_POINTS):
+        self.low_price = np.asarray(low_price, dtype=float)
+        self.high_price = np.asarray(high_price, dtype=float)
+        self.mean_demand = np.asarray(mean_demand, dtype=float)
+        # (n_flights,) remaining seats and market index of each flight
+        self.capacity = np.asarray(capacity, dtype=float)
+        self.market = np.asarray(market, dtype=np.int64)
+        # (n_markets,) travellers shared by the flights of each market
+        if market_demand is None:
+            market_demand = MARKET_DEMAND_OVERLAP * np.bincount(self.market, weights=self.mean_demand.sum(axis=1))
+        self.market_demand = np.asarray(market_demand, dtype=float)
+        self.price_points = np.asarray(price_points, dtype=float)
+
+    @property
+    def shape(self):
+        return self.low_price.shape + (self.price_points.size,)
+
+    def point_prices(self):
+        """``(n_flights, n_classes, n_points)`` price at each point"""
+        return self.low_price[..., None] + (self.high_price - self.low_price)[..., None] * self.price_points
+
+    def point_demand(self):
+        """Class demand at each price point; the mean at the per-ticket price, more below it"""
+        high = np.where(self.high_price > 0, self.high_price, 1.0)
+        discount = 1 - self.point_prices() / high[..., None]
+        return self.mean_demand[..., None] * (1 + PRICE_ELASTICITY * np.clip(discount, 0, None))
+
+
+def network_problem(flights, config=None, seat_types=None):
+    """The network LP of ``flights`` (e.g. ``Available_Flights``), priced with ``config``
+
+    Prices are full fares (late booking, weekday, no luggage, no offers), like the inventory plan.
+    """
+    config = config or get_pricing_config()
+    seat_types = list(seat_types or SeatTypes)
+    n_flights, n_classes = len(flights), len(seat_types)
+
+    rows = [flight_inputs(flight, config) for flight in flights]
+    columns = {
+        name: np.repeat(np.array([row[name] for row in rows], dtype=float), n_classes)
+        for name in TICKET_INPUT_COLUMNS if name in rows[0]
+    } if rows else {name: np.zeros(0) for name in TICKET_INPUT_COLUMNS}
+    seats = np.array([seat_inputs(seat_type, config) for seat_type in seat_types], dtype=float)
+    size = n_flights * n_classes
+    columns.update(
+        seat_factor=np.tile(seats[:, 0], n_flights),
+        is_premium_seat=np.tile(seats[:, 1], n_flights),
+        is_advanced_booking=np.zeros(size),
+        is_late_booking=np.ones(size),
+        is_weekend=np.zeros(size),
+        has_extra_luggage=np.zeros(size),
+        special_discount_total=np.zeros(size),
+    )
+    prices, breakdown = price_input_arrays(columns, config)
+    # the network may discount down to the lowest price the constraints allow; never for infeasible ones
+    low = np.where(breakdown["feasible"], np.minimum(breakdown["lower_bound"], prices), prices)
+
+    max_seats = np.array([flight.max_seats for flight in flights], dtype=float)
+    capacity = np.maximum(max_seats - np.array([flight.sold_seats for flight in flights], dtype=float), 0)
+    adjustment = np.array([flight.determinedemande() if hasattr(flight, "determinedemande") else 0 for flight in flights],
+                          dtype=float)
+    total_mean = capacity * BASE_DEMAND_TO_CAPACITY * (1 + adjustment)
+    share = np.array([CLASS_DEMAND_SHARE.get(seat_type, 0) for seat_type in seat_types])
+
+    markets, market = np.unique([str(flight.to_country) for flight in flights], return_inverse=True)
+    problem = NetworkPricingProblem(
+        low.reshape(n_flights, n_classes),
+        prices.reshape(n_flights, n_classes),
+        total_mean[:, None] * share,
+        capacity,
+        market.reshape(-1),
+    )
+    problem.seat_types = seat_types
+    problem.markets = list(markets)
+    return problem
+
+
+def constraint_matrix(problem):
+    """``(A, rhs, lb, ub, obj)`` of ``max obj @ x  s.t.  A @ x <= rhs,  lb <= x <= ub``
+
+    Variable ``x[(f * n_classes + c) * n_points + k]``: seats of flight f, class c sold at point k.
+    Rows: flight x class demand, then flight capacity, then market demand.
+    """
+    n_flights, n_classes, n_points = problem.shape
+    n_cells = n_flights * n_classes
+    n_vars = n_cells * n_points
+    demand = problem.point_demand().ravel()
+    columns = np.arange(n_vars)
+
+    # sum_k x / demand_k <= 1: a mix of price points using at most the whole class demand
+    cell_rows = columns // n_points
+    cell_coefficients = np.divide(1.0, demand, out=np.zeros_like(demand), where=demand > 0)
+    flight_rows = n_cells + columns // (n_classes * n_points)
+    market_rows = n_cells + n_flights + np.repeat(problem.market, n_classes * n_points)
+
+    A = sp.csr_matrix(
+        (
+            np.concatenate([cell_coefficients, np.ones(n_vars), np.ones(n_vars)]),
+            (np.concatenate([cell_rows, flight_rows, market_rows]), np.tile(columns, 3)),
+        ),
+        shape=(n_cells + n_flights + problem.market_demand.size, n_vars),
+    )
+    rhs = np.concatenate([np.ones(n_cells), problem.capacity, problem.market_demand])
+    return A, rhs, np.zeros(n_vars), demand, problem.point_prices().ravel()
+
+
+class NetworkPricingResult:
+    def __init__(self, problem, seats, capacity_duals, market_duals, revenue, build_seconds, solve_seconds):
+        n_flights, n_classes, n_points = problem.shape
+        seats = seats.reshape(n_flights, n_classes, n_points)
+        sold = seats.sum(axis=2)
+        point_prices = problem.point_prices()
+        # (n_flights, n_classes, n_points) seats sold at each price point
+        self.seats = seats
+        # realised average price of each flight x class; the per-ticket price where nothing sells
+        self.prices = np.round(np.where(
+            sold > 1e-9,
+            (seats * point_prices).sum(axis=2) / np.where(sold > 1e-9, sold, 1),
+            problem.high_price,
+        ), 2)
+        # value of one more seat on each flight, and of one more traveller in each market
+        self.bid_prices = np.abs(capacity_duals)
+        self.market_duals = np.abs(market_duals)
+        self.revenue = revenue
+        self.build_seconds = build_seconds
+        self.solve_seconds = solve_seconds
+
+    def timings(self):
+        return {"build_seconds": self.build_seconds, "solve_seconds": self.solve_seconds}
+
+
+def build_network_model(problem, env=None):
+    """``(model, x, constraints, build_seconds)``: the LP assembled through the matrix API"""
+    from gurobipy import GRB, Model
+
+    start = time.perf_counter()
+    A, rhs, lb, ub, obj = constraint_matrix(problem)
+    model = Model("network_pricing", env=env or get_gurobi_env())
+    try:
+        x = model.addMVar(A.shape[1], lb=lb, ub=ub, obj=obj, name="seats")
+        constraints = model.addMConstr(A, x, GRB.LESS_EQUAL, rhs, name="network")
+        model.ModelSense = GRB.MAXIMIZE
+        model.update()
+    except BaseException:
+        model.dispose()
+        raise
+    return model, x, constraints, time.perf_counter() - start
+
+
+def solve_network_pricing(problem, env=None):
+    """Build and solve the network LP with Gurobi; None when it is not solved to optimality"""
+    from gurobipy import GRB
+
+    model, x, constraints, build_seconds = build_network_model(problem, env)
+    try:
+        start = time.perf_counter()
+        model.optimize()
+        solve_seconds = time.perf_counter() - start
+        if model.Status != GRB.OPTIMAL:
+            print(f"Network pricing failed with Gurobi status {model.Status}")
+            return None
+        n_flights, n_classes, _ = problem.shape
+        duals = constraints.Pi
+        first_market = n_flights * n_classes + n_flights
+        return NetworkPricingResult(
+            problem, x.X, duals[n_flights * n_classes:first_market], duals[first_market:],
+            model.ObjVal, build_seconds, solve_seconds,
+        )
+    finally:
+        model.dispose()
+
+
+def price_network(flights, config=None, solver=None):
+    """Network prices as ``[{seat_type: price}]`` in the order of ``flights``, plus the full result
+
+    ``solver`` names a backend of Service.solver_backends; the settings' one by default.
+    """
+    # solver_backends imports this module, so it is resolved at call time
+    from Service.solver_backends import get_backend
+
+    config = config or get_pricing_config()
+    problem = network_problem(flights, config)
+    if not len(flights):
+        # nothing to solve (e.g. no flights scheduled yet); solvers reject an empty model
+        empty = np.zeros(0)
+        return [], NetworkPricingResult(problem, empty, empty, empty, 0.0, 0.0, 0.0)
+    result = get_backend(solver or config.solver).solve_network(problem)
+    if result is None:
+        return None, None
+    prices = [dict(zip(problem.seat_types, row)) for row in result.prices.tolist()]
+    return prices, result
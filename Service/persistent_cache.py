@@ -0,0 +1,112 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_DIR = os.environ.get("RO_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "ro_airline"))
+CACHE_FILE = os.path.join(CACHE_DIR, "cache.sqlite3")
+
+_MISSING = object()
+
+
+class PersistentCache:
+    """Key/value cache kept in memory and persisted to a local SQLite file.
+
+    Entries expire ``ttl_seconds`` after they were stored. Values must be JSON
+    serialisable. Several caches can share one file; each uses its own namespace.
+    """
+
+    def __init__(self, namespace, ttl_seconds, path=None):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.path = path or CACHE_FILE
+        self.hits = 0
+        self.misses = 0
+        self._memory = {}
+        self._lock = threading.RLock()
+        self._connection = None
+
+    def _db(self):
+        if self._connection is None:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                    "expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+                )
+                connection.commit()
+                self._connection = connection
+            except sqlite3.Error as e:
+                print(f"Persistent cache unavailable at {self.path}, using memory only: {e}")
+                self._connection = False
+        return self._connection or None
+
+    def get(self, key, default=None):
+        key = str(key)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                db = self._db()
+                if db is not None:
+                    row = db.execute(
+                        "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                        (self.namespace, key),
+                    ).fetchone()
+                    if row is not None:
+                        entry = (json.loads(row[0]), row[1])
+                        self._memory[key] = entry
+            if entry is not None and entry[1] > now:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        key = str(key)
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._memory[key] = (value, expires_at)
+            db = self._db()
+            if db is not None:
+                db.execute(
+                    "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (self.namespace, key, json.dumps(value), expires_at),
+                )
+                db.commit()
+        return value
+
+    def get_or_fetch(self, key, fetch):
+        """Return the cached value for ``key``, calling ``fetch()`` and storing its result on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.set(key, fetch())
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one key, or the whole namespace when ``key`` is None"""
+        with self._lock:
+            db = self._db()
+            if key is None:
+                self._memory.clear()
+                if db is not None:
+                    db.execute("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+            else:
+                self._memory.pop(str(key), None)
+                if db is not None:
+                    db.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, str(key)))
+            if db is not None:
+                db.commit()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._memory),
+        }
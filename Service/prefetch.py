@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from Service import distance_calculation
+from Service.IsoCountry import IsoCountry
+from Service.determine_holidays import get_holidays
+from Service.determine_tourist_attraction import get_tourism_classifier
+from Service.holiday_rules import has_lunar_holidays, has_rules
+
+PREFETCH_WORKERS = 8
+# the country reported for a task that covers every country at once
+ALL_COUNTRIES = "all countries"
+
+
+def _needs_geocode(country):
+    # get_latlng answers the bundled (or snapshot) centroids without a request
+    return country not in distance_calculation.COUNTRY_COORDINATES
+
+
+def _needs_holidays(country):
+    # rule-table countries are computed locally, unless their lunar holidays come from the API
+    return not has_rules(country) or has_lunar_holidays(country)
+
+
+# source -> (fetch one country, whether that country needs a request at all)
+PREFETCH_SOURCES = {
+    "geocode": (distance_calculation.fetch_latlng, _needs_geocode),
+    "holidays": (get_holidays, _needs_holidays),
+}
+
+# source -> one call warming every country (arrivals come from a single World Bank download)
+BULK_PREFETCH_SOURCES = {
+    "arrivals": get_tourism_classifier,
+}
+
+
+def prefetch_country_data(countries=None, max_workers=PREFETCH_WORKERS, progress=None, stop_event=None):
+    """Warm the geocode, holiday and arrivals caches for every country.
+
+    Only countries the local tables cannot answer are requested. Runs at most ``max_workers``
+    requests at a time. ``progress(done, total, source, country)`` is called after every task;
+    setting ``stop_event`` skips the tasks not yet started.
+    Returns a list of (source, country, error) for the tasks that failed.
+    """
+    countries = list(countries or IsoCountry)
+    tasks = [(source, ALL_COUNTRIES) for source in BULK_PREFETCH_SOURCES]
+    tasks += [(source, country) for country in countries
+              for source, (_, needed) in PREFETCH_SOURCES.items() if needed(country)]
+    failures = []
+
+    def run(source, country):
+        if stop_event is not None and stop_event.is_set():
+            return
+        if country == ALL_COUNTRIES:
+            BULK_PREFETCH_SOURCES[source]()
+        else:
+            PREFETCH_SOURCES[source][0](country)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch") as pool:
+        futures = {pool.submit(run, source, country): (source, country) for source, country in tasks}
+        for done, future in enumerate(as_completed(futures), start=1):
+            source, country = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failures.append((source, country, str(e)))
+            if progress is not None:
+                progress(done, len(tasks), source, country)
+    return failures
+
+
+def start_background_prefetch(countries=None, max_workers=PREFETCH_WORKERS, progress=None):
+    """Run prefetch_country_data on a daemon thread; returns (thread, stop_event)"""
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=prefetch_country_data,
+        args=(countries, max_workers, progress, stop_event),
+        name="country-prefetch",
+        daemon=True,
+    )
+    thread.start()
+    return thread, stop_event
@@ -0,0 +1,150 @@
+"""Parallel repricing of large ticket batches on a thread or process pool.
+
+The calling thread reduces each ticket to its ``ticket_inputs`` numbers (ticket and flight objects
+stay where they are) and cuts them into chunks. Workers turn a chunk into prices with their own
+settings snapshot and solver:
+
+* ``process`` workers each start their own interpreter, Gurobi environment and model template
+* ``thread`` workers each get their own Gurobi environment and model template; Gurobi releases
+  the GIL while it optimizes, the closed form and HiGHS mostly do not
+
+Results come back in ticket order. Cancelling a job drops the chunks no worker has started.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from Service.GurobyResolver import (
+    TICKET_INPUT_COLUMNS,
+    features_from_inputs,
+    new_gurobi_env,
+    price_input_arrays,
+    ticket_inputs,
+    use_gurobi_env,
+)
+from Service.settings_service import PricingConfig, compile_settings, get_pricing_config
+from Service.solver_backends import BACKENDS, get_backend
+
+EXECUTOR_KINDS = ("thread", "process")
+CHUNK_SIZE = 256
+
+# per worker thread (or process): the solver backend and the last settings snapshot compiled
+_worker = threading.local()
+
+
+def _init_worker(solver):
+    _worker.backend = BACKENDS[solver]
+    _worker.config = None
+    if solver == "gurobi":
+        use_gurobi_env(new_gurobi_env())
+
+
+def _worker_config(snapshot):
+    """The job's settings; a process worker compiles each settings version it is sent once"""
+    if isinstance(snapshot, PricingConfig):
+        return snapshot
+    settings, version, mtime_ns = snapshot
+    config = _worker.config
+    if config is None or config.version != version:
+        config = _worker.config = compile_settings(settings, version, mtime_ns)
+    return config
+
+
+def _price_chunk(snapshot, inputs):
+    """Prices of one chunk of ``TICKET_INPUT_COLUMNS`` rows, fallback and rounding included"""
+    config = _worker_config(snapshot)
+    backend = _worker.backend
+    if backend.name == "analytic":
+        prices, _ = price_input_arrays(dict(zip(TICKET_INPUT_COLUMNS, inputs.T)), config)
+        return prices
+    prices = np.empty(len(inputs))
+    for i, row in enumerate(inputs.tolist()):
+        features = features_from_inputs(dict(zip(TICKET_INPUT_COLUMNS, row)), config)
+        price = backend.solve_price(features)
+        prices[i] = round(features.expected_price if price is None else price, 2)
+    return prices
+
+
+class PricingJob:
+    """Prices of one submitted batch, chunk by chunk, in ticket order"""
+
+    def __init__(self, futures):
+        self.futures = futures
+
+    def cancel(self):
+        """Drop every chunk not yet started; returns how many were dropped"""
+        return sum(future.cancel() for future in self.futures)
+
+    def cancelled(self):
+        return any(future.cancelled() for future in self.futures)
+
+    def done(self):
+        return all(future.done() for future in self.futures)
+
+    def chunks(self, timeout=None):
+        """Each chunk's prices as soon as it and every chunk before it are done
+
+        Raises CancelledError on the first dropped chunk and TimeoutError after ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in self.futures:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            yield future.result(remaining)
+
+    def result(self, timeout=None):
+        chunks = list(self.chunks(timeout))
+        return np.concatenate(chunks) if chunks else np.zeros(0)
+
+
+class PricingExecutor:
+    """Pool of pricing workers; reuse one for many jobs, worker start-up is not free
+
+    ``solver`` is resolved once, when the pool starts (the settings' one by default).
+    """
+
+    def __init__(self, kind="process", workers=None, chunk_size=CHUNK_SIZE, solver=None, mp_context="spawn"):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind {kind!r}, expected one of {', '.join(EXECUTOR_KINDS)}")
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # falls back to HiGHS here, once, when Gurobi cannot start
+        self.solver = get_backend(solver).name
+        if kind == "thread":
+            self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="pricing",
+                                           initializer=_init_worker, initargs=(self.solver,))
+        else:
+            # spawn: a forked worker would inherit this process' Gurobi environment
+            self.pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context(mp_context),
+                                            initializer=_init_worker, initargs=(self.solver,))
+
+    def submit(self, tickets, config: PricingConfig = None):
+        """Start pricing ``tickets`` with ``config`` (the current settings by default)"""
+        config = config or get_pricing_config()
+        tickets = list(tickets)
+        # threads share the immutable config; processes get the settings to compile their own copy
+        snapshot = config if self.kind == "thread" else (dict(config.raw), config.version, config.mtime_ns)
+        futures = []
+        # each chunk is handed out as soon as it is extracted, so workers start while the rest is
+        for start in range(0, len(tickets), self.chunk_size):
+            rows = [ticket_inputs(ticket, config) for ticket in tickets[start:start + self.chunk_size]]
+            inputs = np.array([[row[name] for name in TICKET_INPUT_COLUMNS] for row in rows], dtype=float)
+            futures.append(self.pool.submit(_price_chunk, snapshot, inputs))
+        return PricingJob(futures)
+
+    def price(self, tickets, config: PricingConfig = None, timeout=None):
+        return self.submit(tickets, config).result(timeout)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # cancel what is left when the block is left by an exception
+        self.shutdown(cancel_futures=exc_type is not None)
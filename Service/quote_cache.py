@@ -0,0 +1,126 @@
+import threading
+from collections import OrderedDict
+
+from Service import settings_service
+from Service.GurobyResolver import dynamic_ticket_price, flight_load_factor
+
+QUOTE_CACHE_SIZE = 50_000
+# Load factor is quantized to 1 / LOAD_FACTOR_BUCKETS; quotes are priced at the bucket's midpoint
+LOAD_FACTOR_BUCKETS = 20
+
+
+def load_factor_bucket(flight, buckets=LOAD_FACTOR_BUCKETS):
+    return min(int(flight_load_factor(flight) * buckets), buckets)
+
+
+def bucket_load_factor(bucket, buckets=LOAD_FACTOR_BUCKETS):
+    """Load factor a bucket is priced at: its midpoint, so quotes are neither high nor low on average"""
+    return min((bucket + 0.5) / buckets, 1.0)
+
+
+def ticket_key(ticket):
+    """The ticket-level inputs of a quote; everything else comes from the flight"""
+    return (
+        ticket.seat_type.lower().replace(" ", "_"),
+        bool(ticket.is_weekend()),
+        bool(ticket.is_advanced_booking()),
+        bool(getattr(ticket, "extra_luggage", False)),
+        # every offer is discounted once per occurrence, so repeats are part of the key
+        tuple(sorted(offer.name.lower() for offer in getattr(ticket, "specialoffers", []))),
+        bool(getattr(ticket, "is_student", False)),
+    )
+
+
+class QuoteCache:
+    """Bounded LRU of ticket prices keyed on (flight, load factor bucket, settings version, ticket key)
+
+    A flight's quotes are dropped as soon as its load factor moves to another bucket, and
+    everything is dropped when the settings change.
+    """
+
+    def __init__(self, maxsize=QUOTE_CACHE_SIZE, buckets=LOAD_FACTOR_BUCKETS):
+        self.maxsize = maxsize
+        self.buckets = buckets
+        self.entries = OrderedDict()
+        # flight -> (bucket its quotes were priced at, keys of those quotes)
+        self.flights = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.lock = threading.RLock()
+
+    def _flight_keys(self, flight, bucket):
+        tracked = self.flights.get(flight)
+        if tracked is not None and tracked[0] != bucket:
+            self.invalidate_flight(flight)
+            tracked = None
+        if tracked is None:
+            tracked = self.flights[flight] = (bucket, set())
+        return tracked[1]
+
+    def quote(self, ticket, solver=None):
+        config = settings_service.get_pricing_config()
+        flight = ticket.flight
+        bucket = load_factor_bucket(flight, self.buckets)
+        key = (flight, bucket, config.version, ticket_key(ticket))
+        with self.lock:
+            price = self.entries.get(key)
+            if price is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return price
+            self.misses += 1
+
+        price = dynamic_ticket_price(ticket, solver, config=config, load_factor=bucket_load_factor(bucket, self.buckets))
+
+        with self.lock:
+            self._flight_keys(flight, bucket).add(key)
+            self.entries[key] = price
+            while len(self.entries) > self.maxsize:
+                old_key, _ = self.entries.popitem(last=False)
+                self.evictions += 1
+                tracked = self.flights.get(old_key[0])
+                if tracked is not None:
+                    tracked[1].discard(old_key)
+                    if not tracked[1]:
+                        del self.flights[old_key[0]]
+        return price
+
+    def invalidate_flight(self, flight):
+        with self.lock:
+            _, keys = self.flights.pop(flight, (None, ()))
+            for key in keys:
+                self.entries.pop(key, None)
+            self.invalidations += len(keys)
+
+    def clear(self, config=None):
+        with self.lock:
+            self.invalidations += len(self.entries)
+            self.entries.clear()
+            self.flights.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.entries),
+                "flights": len(self.flights),
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+QUOTE_CACHE = QuoteCache()
+settings_service.subscribe(QUOTE_CACHE.clear)
+
+
+def quote_price(ticket, solver=None):
+    return QUOTE_CACHE.quote(ticket, solver)
+
+
+def quote_cache_stats():
+    return QUOTE_CACHE.stats()
@@ -0,0 +1,163 @@
+"""Flight-level seat inventory control (EMSR-b) across all seat classes.
+
+One solve per flight gives nested protection levels, booking limits per class and a bid price
+for every remaining-seat count; quotes between solves are array lookups. Demand still to come
+is each class's forecast less the seats that class has already sold.
+"""
+import math
+import threading
+from statistics import NormalDist
+
+import numpy as np
+
+from Service import settings_service
+from Service.fare_grid import LATE_WINDOW, FareGrid, get_fare_grid
+from Service.quote_cache import load_factor_bucket
+from constants.Airline_Specific_Constants.Demand_Forecast import (
+    BASE_DEMAND_TO_CAPACITY,
+    CLASS_DEMAND_SHARE,
+    DEMAND_COEFFICIENT_OF_VARIATION,
+    RESOLVE_SEAT_FRACTION,
+)
+
+
+def _tail_probability(mean, sigma, x):
+    """P(D >= x) for normally distributed demand; degenerate demand when sigma is 0"""
+    if sigma <= 0:
+        return (mean >= x).astype(float)
+    return np.array([1 - NormalDist(mean, sigma).cdf(v) for v in x])
+
+
+def class_bookings(flight):
+    """Seats sold per class (lower-case name); sales recorded without a class are spread by CLASS_DEMAND_SHARE"""
+    booked = {seat_type.lower(): seats for seat_type, seats in getattr(flight, "sold_seats_by_class", {}).items()}
+    unattributed = flight.sold_seats - sum(booked.values())
+    if unattributed > 0:
+        for seat_type, share in CLASS_DEMAND_SHARE.items():
+            booked[seat_type.lower()] = booked.get(seat_type.lower(), 0) + unattributed * share
+    return booked
+
+
+class InventoryPlan:
+    """EMSR-b protection levels, booking limits and bid prices of one flight"""
+
+    def __init__(self, flight, config):
+        grid = get_fare_grid(flight) or FareGrid(flight, config, load_factor_bucket(flight))
+        # full fare of each class: late booking, weekday, no luggage, no offers
+        fares = {seat_type: float(grid.prices[i, LATE_WINDOW, 0, 0, 0]) for i, seat_type in enumerate(grid.seat_types)}
+
+        self.config_version = config.version
+        self.sold_seats = flight.sold_seats
+        self.capacity = max(flight.max_seats - flight.sold_seats, 0)
+        self.resolve_threshold = max(1, math.ceil(flight.max_seats * RESOLVE_SEAT_FRACTION))
+
+        demand_adjustment = flight.determinedemande() if hasattr(flight, "determinedemande") else 0
+        total_mean = flight.max_seats * BASE_DEMAND_TO_CAPACITY * (1 + demand_adjustment)
+        booked = class_bookings(flight)
+
+        # highest fare first, as EMSR-b nests the classes
+        self.classes = sorted(fares, key=fares.get, reverse=True)
+        self.class_index = {seat_type.lower(): i for i, seat_type in enumerate(self.classes)}
+        self.fares = [fares[seat_type] for seat_type in self.classes]
+        # demand still to come: independent of the seats left, so lower classes close once they reach their limit
+        self.means = [max(total_mean * CLASS_DEMAND_SHARE.get(seat_type, 0) - booked.get(seat_type.lower(), 0), 0)
+                      for seat_type in self.classes]
+        self.sigmas = [mean * DEMAND_COEFFICIENT_OF_VARIATION for mean in self.means]
+
+        # aggregated demand and weighted fare of classes 0..j
+        self.aggregates = []
+        for j in range(len(self.classes)):
+            mean = sum(self.means[:j + 1])
+            sigma = math.sqrt(sum(s * s for s in self.sigmas[:j + 1]))
+            fare = sum(f * m for f, m in zip(self.fares[:j + 1], self.means[:j + 1])) / mean if mean > 0 else self.fares[j]
+            self.aggregates.append((mean, sigma, fare))
+
+        # protection_levels[j]: seats held back for classes 0..j against class j + 1
+        self.protection_levels = []
+        protected = 0.0
+        for j in range(len(self.classes) - 1):
+            mean, sigma, fare = self.aggregates[j]
+            ratio = self.fares[j + 1] / fare if fare > 0 else 1.0
+            if ratio >= 1 or mean <= 0:
+                level = 0.0
+            elif ratio <= 0:
+                # the next class earns nothing: the limit of inv_cdf(1 - ratio), every seat protected
+                level = self.capacity
+            elif sigma <= 0:
+                level = mean
+            else:
+                level = NormalDist(mean, sigma).inv_cdf(1 - ratio)
+            protected = min(max(protected, level), self.capacity)
+            self.protection_levels.append(protected)
+
+        self.booking_limits = [self.capacity] + [
+            max(int(math.floor(self.capacity - level)), 0) for level in self.protection_levels
+        ]
+
+        # bid_prices[r]: expected revenue of the last of r remaining seats; infinite when sold out
+        seats = np.arange(self.capacity + 1, dtype=float)
+        values = np.zeros(self.capacity + 1)
+        for mean, sigma, fare in self.aggregates:
+            values = np.maximum(values, fare * _tail_probability(mean, sigma, seats))
+        values[0] = math.inf
+        self.bid_prices = values
+
+    def needs_resolve(self, flight, config):
+        return config.version != self.config_version or abs(flight.sold_seats - self.sold_seats) >= self.resolve_threshold
+
+    def quote(self, seat_type, remaining):
+        """O(1) availability, bid price and booking limit of a class at ``remaining`` seats"""
+        i = self.class_index.get(seat_type.lower())
+        remaining = min(max(remaining, 0), self.capacity)
+        bid_price = float(self.bid_prices[remaining])
+        if i is None:
+            return {"open": False, "fare": None, "bid_price": bid_price, "booking_limit": 0}
+        protected = self.protection_levels[i - 1] if i > 0 else 0.0
+        return {
+            "open": remaining > protected,
+            "fare": self.fares[i],
+            "bid_price": bid_price,
+            "booking_limit": self.booking_limits[i],
+        }
+
+    def to_dict(self):
+        return {
+            "classes": self.classes,
+            "fares": self.fares,
+            "mean_demand": self.means,
+            "protection_levels": self.protection_levels,
+            "booking_limits": self.booking_limits,
+            "bid_price": float(self.bid_prices[self.capacity]) if self.capacity else math.inf,
+        }
+
+
+_plans = {}
+_plans_lock = threading.Lock()
+
+
+def solve_inventory(flight):
+    plan = InventoryPlan(flight, settings_service.get_pricing_config())
+    with _plans_lock:
+        _plans[flight] = plan
+    return plan
+
+
+def get_inventory_plan(flight):
+    """The flight's plan, re-solved only when settings changed or inventory moved past the threshold"""
+    plan = _plans.get(flight)
+    if plan is None or plan.needs_resolve(flight, settings_service.get_pricing_config()):
+        plan = solve_inventory(flight)
+    return plan
+
+
+def quote_class(flight, seat_type):
+    return get_inventory_plan(flight).quote(seat_type, flight.max_seats - flight.sold_seats)
+
+
+def record_booking(flight, seats=1, seat_type=None):
+    flight.sold_seats += seats
+    if seat_type is not None:
+        by_class = getattr(flight, "sold_seats_by_class", None)
+        if by_class is None:
+            by_class = flight.sold_seats_by_class = {}
+        by_class[seat_type] = by_class.get(seat_type, 0) + seats
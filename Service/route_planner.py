@@ -0,0 +1,89 @@
+from functools import lru_cache
+
+import numpy as np
+
+from Service import distance_calculation
+from constants.Airline_Specific_Constants.AIRCRAFT_TYPES import AIRCRAFT_TYPES
+
+MAX_GREAT_CIRCLE_KM = 20038  # half the Earth's circumference
+
+
+def _floyd_warshall(weights):
+    """All-pairs shortest paths on a dense weight matrix (np.inf = no edge).
+
+    Returns the cost matrix and a successor matrix for path reconstruction:
+    ``successor[i, j]`` is the node after ``i`` on the best path to ``j``, -1 when unreachable.
+    """
+    cost = weights.copy()
+    n = len(cost)
+    successor = np.where(np.isfinite(cost), np.arange(n)[None, :], -1)
+    for k in range(n):
+        through_k = cost[:, k, None] + cost[None, k, :]
+        better = through_k < cost
+        cost = np.where(better, through_k, cost)
+        successor = np.where(better, successor[:, k, None], successor)
+    return cost, successor
+
+
+class RouteNetwork:
+    """Hub graph of every known country where an edge exists if the aircraft can fly it non-stop.
+
+    Both all-pairs solutions are computed once at construction, so every query is an array lookup:
+    - minimum stops (ties broken by total distance)
+    - minimum distance
+    """
+
+    def __init__(self, aircraft_key):
+        self.aircraft_key = aircraft_key
+        self.range = AIRCRAFT_TYPES[aircraft_key]["range"]
+        self.countries = list(distance_calculation.COUNTRY_INDEX)
+        self.index = dict(distance_calculation.COUNTRY_INDEX)
+
+        distances = distance_calculation.DISTANCE_MATRIX
+        n = len(distances)
+        reachable = distances <= self.range
+
+        # One unit per leg plus a distance tie-breaker that can never add up to a whole leg
+        leg_weights = np.where(reachable, 1 + distances / (n * MAX_GREAT_CIRCLE_KM), np.inf)
+        np.fill_diagonal(leg_weights, 0)
+        stop_cost, self._stops_successor = _floyd_warshall(leg_weights)
+        self.legs = np.where(np.isfinite(stop_cost), np.floor(stop_cost), np.inf)
+
+        distance_weights = np.where(reachable, distances, np.inf)
+        np.fill_diagonal(distance_weights, 0)
+        self.shortest_distance, self._distance_successor = _floyd_warshall(distance_weights)
+
+    def min_stops(self, origin, destination):
+        """Fewest intermediate stops, or None when the destination is unreachable"""
+        legs = self.legs[self.index[origin], self.index[destination]]
+        return None if np.isinf(legs) else max(0, int(legs) - 1)
+
+    def min_distance(self, origin, destination):
+        distance = self.shortest_distance[self.index[origin], self.index[destination]]
+        return None if np.isinf(distance) else float(distance)
+
+    def path(self, origin, destination, metric="stops"):
+        """Countries visited from origin to destination (both included), or None when unreachable"""
+        successor = self._stops_successor if metric == "stops" else self._distance_successor
+        i, j = self.index[origin], self.index[destination]
+        if successor[i, j] < 0:
+            return None if i != j else [origin]
+        path = [origin]
+        while i != j:
+            i = successor[i, j]
+            path.append(self.countries[i])
+        return path
+
+    def stopovers(self, origin, destination, metric="stops"):
+        path = self.path(origin, destination, metric)
+        return None if path is None else path[1:-1]
+
+
+@lru_cache(maxsize=None)
+def get_route_network(aircraft_key):
+    return RouteNetwork(aircraft_key)
+
+
+def clear_route_networks():
+    """Drop the precomputed networks, e.g. after refresh_centroids rebuilt the distance matrix"""
+    get_route_network.cache_clear()
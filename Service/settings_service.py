@@ -0,0 +1,187 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+from types import MappingProxyType
+from typing import NamedTuple
+
+SETTINGS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "QtDesigner", "settings.json")
+# Pricing backend when settings.json has no "pricing_solver"; the RO_PRICING_SOLVER variable overrides the file.
+# "analytic" evaluates the pricing LP in closed form, "gurobi" and "highs" solve it (see solver_backends)
+PRICING_SOLVER = "analytic"
+
+
+def _percent(value):
+    """settings.json stores percentages as strings, sometimes with a trailing '%'"""
+    return float(str(value).strip().rstrip("%")) / 100
+
+
+class PricingConfig(NamedTuple):
+    """settings.json compiled once into typed values; immutable, so every caller can share it"""
+    version: int
+    mtime_ns: int
+    base_price: float
+    fuel_cost: float
+    efficiency: float
+    advanced_booking_discount: float
+    holiday_factor: float
+    late_booking: float
+    luggage_surcharge: float
+    stop_discount: float
+    weekend_surcharge: float
+    roundtrip_discount: float
+    student_discount: float
+    tourist_surcharge: float
+    # name of the pricing backend, see Service.solver_backends
+    solver: str
+    # "first", "business", "premium_economy", "economic"/"economy" -> factor
+    seat_factors: MappingProxyType
+    # "narrow", "wide", "long_range", "ultra_long_range" -> factor
+    cost_factors: MappingProxyType
+    # lowercase offer name -> discount as a fraction
+    special_offers: MappingProxyType
+    # the parsed JSON as written, for display code
+    raw: MappingProxyType
+
+
+def compile_settings(settings, version=0, mtime_ns=0):
+    economy_factor = float(settings.get("economy_factor", 1))
+    return PricingConfig(
+        version=version,
+        mtime_ns=mtime_ns,
+        base_price=float(settings["base_price"]),
+        fuel_cost=float(settings["fuel_cost"]),
+        efficiency=float(settings["efficiency"]),
+        advanced_booking_discount=_percent(settings["advanced_booking_discount"]),
+        holiday_factor=_percent(settings["holiday_factor"]),
+        late_booking=_percent(settings["late_booking"]),
+        luggage_surcharge=_percent(settings["luggage_surcharge"]),
+        stop_discount=_percent(settings["stop_discount"]),
+        weekend_surcharge=_percent(settings["weekend_surcharge"]),
+        roundtrip_discount=_percent(settings["roundtrip_discount"]),
+        student_discount=_percent(settings["student_discount"]),
+        tourist_surcharge=_percent(settings["tourist_surcharge"]),
+        solver=(os.environ.get("RO_PRICING_SOLVER") or str(settings.get("pricing_solver", PRICING_SOLVER))).lower(),
+        seat_factors=MappingProxyType({
+            "first": float(settings["first_class_factor"]),
+            "business": float(settings["business_factor"]),
+            "premium_economy": float(settings["premium_economy_factor"]),
+            "economic": economy_factor,
+            "economy": economy_factor,
+        }),
+        cost_factors=MappingProxyType({
+            "narrow": float(settings["narrow_cost_factor"]),
+            "wide": float(settings["extended_cost_factor"]),
+            "long_range": float(settings["long_cost_factor"]),
+            "ultra_long_range": float(settings["ultra_cost_factor"]),
+        }),
+        special_offers=MappingProxyType({
+            offer["name"].lower(): _percent(offer["value"]) for offer in settings.get("special_offers", [])
+        }),
+        raw=MappingProxyType(settings),
+    )
+
+
+class SettingsService:
+    """Hands out the compiled PricingConfig, recompiling only when the file's mtime changes"""
+
+    def __init__(self, path=SETTINGS_PATH):
+        self.path = path
+        self.config = None
+        self.version = 0
+        # mtime of the last load attempt, so a broken file is not re-parsed on every call
+        self.seen_mtime_ns = None
+        self.subscribers = []
+        self.lock = threading.RLock()
+
+    def _mtime_ns(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self):
+        mtime_ns = self._mtime_ns()
+        config = self.config
+        if config is not None and mtime_ns == self.seen_mtime_ns:
+            return config
+        with self.lock:
+            if self.config is None or mtime_ns != self.seen_mtime_ns:
+                self._reload(mtime_ns)
+            return self.config
+
+    def _reload(self, mtime_ns):
+        self.seen_mtime_ns = mtime_ns
+        try:
+            with open(self.path, "r") as f:
+                settings = json.load(f)
+            config = compile_settings(settings, self.version + 1, mtime_ns)
+        except Exception as e:
+            if self.config is None:
+                raise
+            print(f"Error loading settings from {self.path}, keeping the previous ones: {e}")
+            return
+        self.version = config.version
+        self.config = config
+        for callback in list(self.subscribers):
+            callback(config)
+
+    def read(self):
+        """The raw settings dict, or {} when the file is missing or invalid"""
+        try:
+            return copy.deepcopy(dict(self.get().raw))
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+            return {}
+
+    def save(self, settings):
+        """Write ``settings`` atomically (temp file + rename), then notify subscribers"""
+        with self.lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(prefix=".settings.", suffix=".json", dir=directory)
+            try:
+                os.chmod(tmp_path, 0o644)
+                with os.fdopen(fd, "w") as f:
+                    json.dump(settings, f, indent=4, sort_keys=True)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._reload(self._mtime_ns())
+            return self.config
+
+    def subscribe(self, callback):
+        """Call ``callback(config)`` whenever a new config is compiled"""
+        with self.lock:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            if callback in self.subscribers:
+                self.subscribers.remove(callback)
+
+
+SETTINGS = SettingsService()
+
+
+def get_pricing_config():
+    return SETTINGS.get()
+
+
+def read_settings():
+    return SETTINGS.read()
+
+
+def save_settings(settings):
+    return SETTINGS.save(settings)
+
+
+def subscribe(callback):
+    SETTINGS.subscribe(callback)
+
+
+def unsubscribe(callback):
+    SETTINGS.unsubscribe(callback)
@@ -0,0 +1,162 @@
+"""Interchangeable solvers for the pricing models, selected by the ``solver`` setting.
+
+* ``analytic``: the per-ticket LP in closed form; the network LP is solved with HiGHS
+* ``gurobi``: both models solved by Gurobi (needs gurobipy and a licence)
+* ``highs``: both models solved by scipy's HiGHS, no licence needed
+
+Every backend returns the same prices on the current models. When Gurobi is selected but
+cannot start, pricing falls back to HiGHS instead of failing.
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from Service.GurobyResolver import DEMAND_FACTOR_BOUNDS, PricingFeatures, analytic_price, get_gurobi_env, solve_price_gurobi
+from Service.network_pricing import NetworkPricingResult, constraint_matrix, solve_network_pricing
+from Service.settings_service import PRICING_SOLVER, get_pricing_config
+
+# GRB.Error.SIZE_LIMIT_EXCEEDED: the model is larger than a restricted licence allows
+SIZE_LIMITED_LICENSE = 10010
+
+
+def solve_price_highs(features: PricingFeatures):
+    """The same LP as solve_price_gurobi, solved by scipy's HiGHS"""
+    from scipy.optimize import linprog
+
+    market_upper, competitive_upper = features.upper_bounds()
+    _, operating_min, profit_min, demand_min = features.lower_bounds()
+    # variables: price, demand_factor; maximize 0.6 * price (+ 10 * demand_factor, pinned)
+    result = linprog(
+        c=[-0.6, -10.0],
+        A_ub=[[1, 0], [1, 0], [-1, 0], [-1, 0], [-1, 0]],
+        b_ub=[market_upper, competitive_upper, -operating_min, -profit_min, -demand_min],
+        A_eq=[[0, 1]],
+        b_eq=[features.total_demand],
+        bounds=[(0, None), DEMAND_FACTOR_BOUNDS],
+        method="highs",
+    )
+    return result.x[0] if result.status == 0 else None
+
+
+def solve_network_pricing_highs(problem):
+    """The network LP of solve_network_pricing, solved by scipy's HiGHS"""
+    from scipy.optimize import linprog
+
+    start = time.perf_counter()
+    A, rhs, lb, ub, obj = constraint_matrix(problem)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = linprog(-obj, A_ub=A, b_ub=rhs, bounds=np.column_stack([lb, ub]), method="highs")
+    solve_seconds = time.perf_counter() - start
+    if result.status != 0:
+        print(f"Network pricing failed with HiGHS status {result.status}: {result.message}")
+        return None
+    n_flights, n_classes, _ = problem.shape
+    duals = result.ineqlin.marginals
+    first_market = n_flights * n_classes + n_flights
+    return NetworkPricingResult(
+        problem, result.x, duals[n_flights * n_classes:first_market], duals[first_market:],
+        -result.fun, build_seconds, solve_seconds,
+    )
+
+
+class SolverBackend(ABC):
+    name = None
+
+    def available(self):
+        return True
+
+    @abstractmethod
+    def solve_price(self, features: PricingFeatures):
+        """Optimal price of one ticket; None when its constraints cannot all hold"""
+
+    @abstractmethod
+    def solve_network(self, problem):
+        """NetworkPricingResult of a NetworkPricingProblem; None when not solved to optimality"""
+
+
+class HighsBackend(SolverBackend):
+    name = "highs"
+
+    def available(self):
+        try:
+            import scipy.optimize  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def solve_price(self, features):
+        return solve_price_highs(features)
+
+    def solve_network(self, problem):
+        return solve_network_pricing_highs(problem)
+
+
+class AnalyticBackend(HighsBackend):
+    name = "analytic"
+
+    def available(self):
+        return True
+
+    def solve_price(self, features):
+        return analytic_price(features)
+
+
+class GurobiBackend(SolverBackend):
+    name = "gurobi"
+
+    def __init__(self):
+        self._available = None
+
+    def available(self):
+        if self._available is None:
+            try:
+                get_gurobi_env()
+                self._available = True
+            except Exception as e:
+                print(f"Gurobi is not available ({e}), pricing with HiGHS instead")
+                self._available = False
+        return self._available
+
+    def solve_price(self, features):
+        return solve_price_gurobi(features)
+
+    def solve_network(self, problem):
+        from gurobipy import GurobiError
+
+        try:
+            return solve_network_pricing(problem)
+        except GurobiError as e:
+            if e.errno != SIZE_LIMITED_LICENSE:
+                raise
+            print(f"Gurobi licence is too small for this network ({e}), solving it with HiGHS instead")
+            return solve_network_pricing_highs(problem)
+
+
+BACKENDS = {backend.name: backend for backend in (AnalyticBackend(), GurobiBackend(), HighsBackend())}
+FALLBACK_BACKEND = "highs"
+_resolved = {}
+_resolved_lock = threading.Lock()
+
+
+def get_backend(name=None):
+    """The backend called ``name`` (the settings' ``solver`` by default), or HiGHS if it cannot run
+
+    An unknown name prices with the default backend rather than failing every quote.
+    """
+    name = (name or get_pricing_config().solver).lower()
+    backend = _resolved.get(name)
+    if backend is not None:
+        return backend
+    with _resolved_lock:
+        backend = BACKENDS.get(name)
+        if backend is None:
+            print(f"Unknown pricing solver {name!r} (expected one of {', '.join(BACKENDS)}), using {PRICING_SOLVER}")
+            backend = BACKENDS[PRICING_SOLVER]
+        if not backend.available():
+            backend = BACKENDS[FALLBACK_BACKEND]
+        _resolved[name] = backend
+        return backend
@@ -1,29 +1,103 @@
 import math
+from functools import lru_cache
 
-from Service.distance_calculation import distance_between_countries
+from Service.airport_index import get_airport_index, is_airport_code
+from Service.distance_calculation import calculate_distance_km, distance_between_countries, get_latlng
+from Service.route_planner import get_route_network
 from Model.Aircraft_types import AIRCRAFT_TYPES
+from constants.Airline_Specific_Constants.Fuel_Cost import FUEL_COST_Km
 
+ROUTE_PROFILE_CACHE_SIZE = 4096
 
 
-def choose_aircraft (country1, country2) :
-    distance = distance_between_countries(country1, country2)
+class RouteProfile:
+    """Everything derived from the distance of a route, shared by both directions"""
+
+    def __init__(self, distance, aircraft, stops, fuel_cost, aircraft_key=None, stopovers=None, origin=None):
+        self.distance = distance
+        self.aircraft = aircraft
+        self.stops = stops
+        self.fuel_cost = fuel_cost
+        self.aircraft_key = aircraft_key
+        self.stopovers = stopovers or []
+        self.origin = origin
+
+    def stopovers_from(self, country):
+        """Stopovers in flying order when departing from ``country``"""
+        if self.origin is not None and country != self.origin:
+            return list(reversed(self.stopovers))
+        return list(self.stopovers)
+
+    def fuel_cost_at(self, fuel_cost_per_km):
+        return self.distance * fuel_cost_per_km * self.aircraft["cost_factor"]
+
+
+def aircraft_key_for_distance(distance):
     if distance <= 2500:
-        aircraft = AIRCRAFT_TYPES["narrow"]
+        return "narrow"
     elif distance <= 5000:
-        aircraft = AIRCRAFT_TYPES["extended"]
+        return "extended"
     elif distance <= 10000:
-        aircraft = AIRCRAFT_TYPES["long"]
+        return "long"
+    return "ultra"
+
+
+def _plan_stopovers(country_a, country_b, distance, aircraft_key):
+    """Intermediate hubs on the fewest-stop path, or None when the hub graph can't route it"""
+    if distance <= AIRCRAFT_TYPES[aircraft_key]["range"]:
+        return []
+    network = get_route_network(aircraft_key)
+    if country_a not in network.index or country_b not in network.index:
+        return None
+    return network.stopovers(country_a, country_b)
+
+
+def _endpoint_distance(endpoint_a, endpoint_b):
+    """Distance between two endpoints, each a country name or an IATA airport code"""
+    airport_a = is_airport_code(endpoint_a)
+    airport_b = is_airport_code(endpoint_b)
+    if not airport_a and not airport_b:
+        return distance_between_countries(endpoint_a, endpoint_b)
+    airports = get_airport_index()
+    if airport_a and airport_b:
+        return airports.distance_km(endpoint_a, endpoint_b)
+    lat1, lon1 = airports.latlng(endpoint_a) if airport_a else get_latlng(endpoint_a)
+    lat2, lon2 = airports.latlng(endpoint_b) if airport_b else get_latlng(endpoint_b)
+    return calculate_distance_km(lat1, lon1, lat2, lon2)
+
+
+@lru_cache(maxsize=ROUTE_PROFILE_CACHE_SIZE)
+def _route_profile(country_a, country_b):
+    distance = _endpoint_distance(country_a, country_b)
+    aircraft_key = aircraft_key_for_distance(distance)
+    aircraft = AIRCRAFT_TYPES[aircraft_key]
+    stopovers = _plan_stopovers(country_a, country_b, distance, aircraft_key)
+    if stopovers is None:
+        stops = max(0, math.ceil(distance / aircraft["range"]) - 1)
     else:
-        aircraft = AIRCRAFT_TYPES["ultra"]
+        stops = len(stopovers)
+    profile = RouteProfile(distance, aircraft, stops, 0, aircraft_key, stopovers, country_a)
+    profile.fuel_cost = profile.fuel_cost_at(FUEL_COST_Km)
+    return profile
 
-    return distance, aircraft
 
+def get_route_profile(country1, country2):
+    """Memoized RouteProfile, computed once per unordered pair.
 
-def estimate_stops(country1, country2) :
-    distance, aircraft = choose_aircraft(country1, country2)
-    range_ = aircraft["range"]
+    Either side may be a country name or an IATA airport code for airport-level distances.
+    """
+    return _route_profile(*sorted((country1, country2)))
+
+
+def clear_route_profiles():
+    """Forget memoized profiles, e.g. after refresh_centroids moved a country"""
+    _route_profile.cache_clear()
 
-    segments = math.ceil(distance / range_)
-    return max(0, segments - 1)
 
-print(choose_aircraft("Brazil", "Japan"))
\ No newline at end of file
+def choose_aircraft (country1, country2) :
+    profile = get_route_profile(country1, country2)
+    return profile.distance, profile.aircraft
+
+
+def estimate_stops(country1, country2) :
+    return get_route_profile(country1, country2).stops
@@ -0,0 +1,52 @@
+"""Batch haversine vs. the scalar per-pair loop.
+
+Run from the repository root:
+    python -m benchmarks.bench_distance
+"""
+import random
+import time
+
+import numpy as np
+
+from Service.distance_calculation import (
+    COUNTRY_INDEX,
+    calculate_distance_km,
+    calculate_distances_km,
+    distance_between_countries,
+    distances_between_countries,
+)
+
+N_PAIRS = 100_000
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(42)
+    lat1, lat2 = rng.uniform(-90, 90, (2, N_PAIRS))
+    lon1, lon2 = rng.uniform(-180, 180, (2, N_PAIRS))
+
+    loop, loop_time = _timed(lambda: np.array([
+        calculate_distance_km(lat1[k], lon1[k], lat2[k], lon2[k]) for k in range(N_PAIRS)
+    ]))
+    batch, batch_time = _timed(lambda: calculate_distances_km(lat1, lon1, lat2, lon2))
+    assert np.allclose(loop, batch, rtol=1e-12, atol=1e-9)
+    print(f"coordinates  {N_PAIRS} pairs: loop {loop_time * 1000:8.1f} ms | "
+          f"batch {batch_time * 1000:8.1f} ms | x{loop_time / batch_time:.0f}")
+
+    random.seed(42)
+    countries = list(COUNTRY_INDEX)
+    pairs = [(random.choice(countries), random.choice(countries)) for _ in range(N_PAIRS)]
+    loop, loop_time = _timed(lambda: np.array([distance_between_countries(a, b) for a, b in pairs]))
+    batch, batch_time = _timed(lambda: distances_between_countries(pairs))
+    assert np.allclose(loop, batch)
+    print(f"country pairs {N_PAIRS} pairs: loop {loop_time * 1000:8.1f} ms | "
+          f"batch {batch_time * 1000:8.1f} ms | x{loop_time / batch_time:.0f}")
+
+
+if __name__ == "__main__":
+    main()
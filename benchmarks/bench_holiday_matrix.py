@@ -0,0 +1,54 @@
+"""Vectorized holiday overlap vs. exist_holidays per flight, one-way flights included.
+
+Run from the repository root:
+    python -m benchmarks.bench_holiday_matrix
+"""
+import random
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from Service.determine_holidays import exist_holidays
+from Service.holiday_matrix import bulk_holiday_overlap
+
+N_FLIGHTS = 20_000
+COUNTRIES = ["France", "Germany", "Italy", "Spain", "Tunisia", "Japan", "Brazil", "Canada"]
+
+
+def main():
+    # one-way and round-trip flights mixed, as the schedule screens hold them
+    flags, counts = bulk_holiday_overlap(["France", "France"], ["2025-12-20", "2025-07-01"], ["2025-12-30", None])
+    assert flags.tolist() == [True, False] and counts.tolist() == [1, 0], (flags, counts)
+
+    rng = random.Random(3)
+    destinations, departures, returns = [], [], []
+    for _ in range(N_FLIGHTS):
+        departure = date(2025, 1, 1) + timedelta(days=rng.randrange(700))
+        destinations.append(rng.choice(COUNTRIES))
+        departures.append(departure)
+        returns.append(None if rng.random() < 0.4 else departure + timedelta(days=rng.randrange(30)))
+
+    start = time.perf_counter()
+    loop = np.array([exist_holidays(*flight) for flight in zip(destinations, departures, returns)])
+    loop_time = time.perf_counter() - start
+
+    # numpy converts date objects one by one, so that is timed apart from the overlap itself
+    start = time.perf_counter()
+    departure_days = np.asarray(departures, dtype="datetime64[D]")
+    return_days = np.asarray(returns, dtype="datetime64[D]")
+    convert_time = time.perf_counter() - start
+
+    bulk_holiday_overlap(destinations, departure_days, return_days)  # build the matrix outside the timing
+    start = time.perf_counter()
+    flags, _ = bulk_holiday_overlap(destinations, departure_days, return_days)
+    batch_time = time.perf_counter() - start
+
+    assert np.array_equal(loop, flags), f"{(loop != flags).sum()} flights disagree with exist_holidays"
+    print(f"{N_FLIGHTS} flights ({returns.count(None)} one-way): loop {loop_time * 1000:8.1f} ms | "
+          f"batch {batch_time * 1000:8.1f} ms | x{loop_time / batch_time:.0f} "
+          f"(+ {convert_time * 1000:.1f} ms converting date objects)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Import-time budget for the model layer.
+
+Imports Model.Flight (and the pricing service) in fresh interpreters with sockets
+disabled, fails if anything touches the network or drags in a heavyweight dependency,
+and exits non-zero when the best of several runs exceeds the budget.
+
+Run from the repository root:
+    python -m benchmarks.bench_import
+"""
+import os
+import subprocess
+import sys
+
+IMPORT_BUDGET_SECONDS = 0.5
+RUNS = 5
+MODULES = ("Model.Flight", "Model.Ticket", "Service.GurobyResolver")
+DEFERRED = ("requests", "gurobipy", "PyQt5", "scipy")
+
+PROBE = """
+import socket, sys, time
+
+def _no_network(*args, **kwargs):
+    raise RuntimeError("network I/O during import")
+
+socket.socket.connect = _no_network
+socket.create_connection = _no_network
+socket.getaddrinfo = _no_network
+
+start = time.perf_counter()
+for module in {modules!r}:
+    __import__(module)
+elapsed = time.perf_counter() - start
+loaded = [name for name in {deferred!r} if name in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def _probe():
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(modules=MODULES, deferred=DEFERRED)],
+        cwd=repo_root, capture_output=True, text=True, check=True,
+    ).stdout.strip().splitlines()[-1]
+    elapsed, _, loaded = output.partition(" ")
+    return float(elapsed), [name for name in loaded.split(",") if name]
+
+
+def main():
+    results = [_probe() for _ in range(RUNS)]
+    best = min(elapsed for elapsed, _ in results)
+    loaded = results[0][1]
+    print(f"import {', '.join(MODULES)}: best {best * 1000:.1f} ms of {RUNS} "
+          f"(budget {IMPORT_BUDGET_SECONDS * 1000:.0f} ms)")
+
+    ok = True
+    if loaded:
+        print(f"FAIL: heavyweight modules imported eagerly: {', '.join(loaded)}")
+        ok = False
+    if best > IMPORT_BUDGET_SECONDS:
+        print("FAIL: import budget exceeded")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
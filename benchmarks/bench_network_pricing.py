@@ -0,0 +1,83 @@
+"""Network pricing LP: model build vs. solve time at 1k, 10k and 100k flights.
+
+The model is built through Gurobi's matrix API from scipy.sparse matrices; at 1k flights the
+same model is also built with a scalar addVar/addConstr loop for comparison. Where the installed
+Gurobi licence is size-limited the solve is reported as refused, and scipy's HiGHS solves the
+identical matrices instead, so there is still a solve time per size.
+
+Run from the repository root:
+    python -m benchmarks.bench_network_pricing [n_flights ...]
+"""
+import sys
+import time
+
+import numpy as np
+
+from Service.GurobyResolver import get_gurobi_env
+from Service.network_pricing import NetworkPricingProblem, build_network_model, constraint_matrix, solve_network_pricing
+from Service.solver_backends import solve_network_pricing_highs
+
+SIZES = (1_000, 10_000, 100_000)
+N_CLASSES = 4
+# one market per ~20 flights, like a schedule with a few flights a day to each destination
+FLIGHTS_PER_MARKET = 20
+LOOP_BUILD_FLIGHTS = 1_000
+
+
+def random_problem(n_flights, seed=0):
+    rng = np.random.default_rng(seed)
+    class_factor = np.array([1.0, 1.5, 2.5, 3.5])
+    high = rng.uniform(150, 900, (n_flights, 1)) * class_factor
+    low = high * rng.uniform(0.6, 1.0, (n_flights, N_CLASSES))
+    capacity = rng.choice([150, 180, 300, 350], n_flights) - rng.integers(0, 150, n_flights)
+    mean = capacity[:, None] * 1.1 * np.array([0.70, 0.15, 0.10, 0.05]) * rng.uniform(0.5, 1.5, (n_flights, 1))
+    market = rng.integers(0, max(n_flights // FLIGHTS_PER_MARKET, 1), n_flights)
+    return NetworkPricingProblem(low, high, mean, capacity, market)
+
+
+def build_with_loop(problem, env):
+    """The same model built one addVar / addConstr call at a time"""
+    from gurobipy import GRB, LinExpr, Model
+
+    start = time.perf_counter()
+    A, rhs, lb, ub, obj = constraint_matrix(problem)
+    model = Model("network_pricing_loop", env=env)
+    x = [model.addVar(lb=lb[j], ub=ub[j], obj=obj[j]) for j in range(A.shape[1])]
+    for i in range(A.shape[0]):
+        row = A.getrow(i)
+        model.addConstr(LinExpr(row.data.tolist(), [x[j] for j in row.indices]) <= rhs[i])
+    model.ModelSense = GRB.MAXIMIZE
+    model.update()
+    seconds = time.perf_counter() - start
+    model.dispose()
+    return seconds
+
+
+def main(sizes=SIZES):
+    from gurobipy import GurobiError
+
+    env = get_gurobi_env()
+    for n_flights in sizes:
+        problem = random_problem(n_flights)
+        A, *_ = constraint_matrix(problem)
+        print(f"{n_flights:>7} flights: {A.shape[1]:>9} variables, {A.shape[0]:>8} rows, {A.nnz:>9} non-zeros")
+
+        if n_flights == LOOP_BUILD_FLIGHTS:
+            print(f"    gurobi scalar loop build {build_with_loop(problem, env) * 1000:9.1f} ms")
+
+        model, _, _, build_seconds = build_network_model(problem, env)
+        model.dispose()
+        print(f"    gurobi matrix API  build {build_seconds * 1000:9.1f} ms")
+        try:
+            result = solve_network_pricing(problem, env)
+            if result is not None:
+                print(f"    gurobi             solve {result.solve_seconds * 1000:9.1f} ms | revenue {result.revenue:,.0f}")
+        except GurobiError as e:
+            print(f"    gurobi             solve refused: {e}")
+
+        result = solve_network_pricing_highs(problem)
+        print(f"    highs              solve {result.solve_seconds * 1000:9.1f} ms | revenue {result.revenue:,.0f}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(n) for n in sys.argv[1:]) or SIZES)
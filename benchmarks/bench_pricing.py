@@ -0,0 +1,125 @@
+"""Closed-form ticket pricing vs. solving the LP, on a randomized ticket population.
+
+Checks that the closed form, the batch API and the solver give the same price for
+every ticket, then compares latency. The reference solver is Gurobi when gurobipy
+is installed, scipy's HiGHS otherwise.
+
+Run from the repository root:
+    python -m benchmarks.bench_pricing
+"""
+import random
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from Service.GurobyResolver import (
+    GurobiPricingModel,
+    get_gurobi_env,
+    analytic_price,
+    extract_pricing_features,
+    price_tickets,
+)
+from Service.settings_service import get_pricing_config
+from Service.solver_backends import get_backend
+
+N_TICKETS = 20_000
+N_SOLVED = 2_000
+SEAT_TYPES = ["Economy", "economic", "Premium Economy", "Business", "First Class", "first"]
+AIRCRAFT_NAMES = ["Narrow Body", "Extended Narrow", "Long Range", "Ultra Long Range", "narrow", "wide"]
+
+
+def random_ticket(rng, config):
+    """A ticket-shaped object exercising every branch of the feature extraction"""
+    capacity = rng.choice([150, 180, 300, 350])
+    departure = datetime(2026, 1, 1) + timedelta(days=rng.randrange(365))
+    flight = SimpleNamespace(
+        aircraft={"name": rng.choice(AIRCRAFT_NAMES)},
+        max_seats=capacity,
+        sold_seats=rng.randint(0, capacity),
+        distance=rng.uniform(200, 17_000),
+        stops=rng.choice([0, 0, 1, 2]),
+        date_departure=departure,
+        date_return=rng.choice([None, departure + timedelta(days=7)]),
+        from_country="A",
+        to_country="B",
+    )
+    holiday, hotspot = rng.random() < 0.3, rng.random() < 0.4
+    flight.is_holiday_period = lambda: holiday
+    flight.destiation_is_tourist_hotspot = lambda: hotspot
+    reservation = departure - timedelta(days=rng.randrange(200))
+    offers = [SimpleNamespace(name=offer["name"]) for offer in config.raw.get("special_offers", []) if rng.random() < 0.3]
+    ticket = SimpleNamespace(flight=flight, seat_type=rng.choice(SEAT_TYPES), extra_luggage=rng.random() < 0.3,
+                             specialoffers=offers, date_reservation=reservation, is_student=rng.random() < 0.1)
+    ticket.is_weekend = lambda: reservation.isoweekday() > 5
+    ticket.is_advanced_booking = lambda: (departure - reservation).days > 60
+    return ticket
+
+
+def reference_solver():
+    backend = get_backend("gurobi")
+    return backend.name, backend.solve_price
+
+
+def compare_gurobi_reuse(population):
+    """Model rebuilt per ticket vs. one template with in-place updates, build and solve timed apart"""
+    env = get_gurobi_env()
+    fresh_build = fresh_solve = 0.0
+    fresh = []
+    for features in population:
+        model = GurobiPricingModel(env)
+        fresh.append(model.solve(features))
+        fresh_build += model.build_seconds
+        fresh_solve += model.solve_seconds
+        model.dispose()
+
+    template = GurobiPricingModel(env)
+    reused = [template.solve(features) for features in population]
+    assert all((a is None) == (b is None) and (a is None or abs(a - b) < 1e-6) for a, b in zip(fresh, reused))
+
+    n = len(population)
+    timings = template.timings()
+    print(f"gurobi fresh model    build {fresh_build / n * 1e6:7.1f} us | solve {fresh_solve / n * 1e6:7.1f} us per ticket")
+    print(f"gurobi reused model   build {timings['build_seconds'] * 1e6:7.1f} us once | "
+          f"solve {timings['mean_solve_seconds'] * 1e6:7.1f} us per ticket")
+
+
+def _final(price, features):
+    return round(features.expected_price, 2) if price is None else round(price, 2)
+
+
+def main():
+    rng = random.Random(42)
+    config = get_pricing_config()
+    tickets = [random_ticket(rng, config) for _ in range(N_TICKETS)]
+    population = [extract_pricing_features(ticket, config) for ticket in tickets]
+    name, solve = reference_solver()
+
+    start = time.perf_counter()
+    analytic = [_final(analytic_price(features), features) for features in population]
+    analytic_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    solved = [_final(solve(features), features) for features in population[:N_SOLVED]]
+    solver_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch, _ = price_tickets(tickets, config)
+    batch_time = time.perf_counter() - start
+
+    mismatches = [(a, b) for a, b in zip(analytic, batch) if abs(a - b) > 0.011]
+    assert not mismatches, f"{len(mismatches)} batch prices differ, e.g. {mismatches[:5]}"
+    mismatches = [(a, s) for a, s in zip(analytic, solved) if abs(a - s) > 0.011]
+    assert not mismatches, f"{len(mismatches)} prices differ from {name}, e.g. {mismatches[:5]}"
+    infeasible = sum(analytic_price(features) is None for features in population)
+
+    analytic_us = analytic_time / N_TICKETS * 1e6
+    solver_us = solver_time / N_SOLVED * 1e6
+    print(f"parity: {N_SOLVED} tickets identical to {name} ({infeasible}/{N_TICKETS} use the fallback price)")
+    print(f"analytic {analytic_us:8.2f} us/ticket | {name} {solver_us:8.1f} us/ticket | x{solver_us / analytic_us:.0f}")
+    print(f"batch    {N_TICKETS} tickets (feature extraction included) in {batch_time * 1000:.1f} ms")
+    if name == "gurobi":
+        compare_gurobi_reuse(population[:N_SOLVED])
+
+
+if __name__ == "__main__":
+    main()
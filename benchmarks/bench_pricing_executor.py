@@ -0,0 +1,83 @@
+"""Pricing executor throughput on 10k tickets: thread and process pools against one core.
+
+Every run must return the serial prices (to the cent), in order. Throughput can only scale up to the
+number of cores this machine has (printed first); the input extraction in the calling
+thread is serial and bounds the speed-up (Amdahl).
+
+Run from the repository root:
+    python -m benchmarks.bench_pricing_executor [solver ...]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.bench_pricing import random_ticket
+from Service.GurobyResolver import dynamic_ticket_price
+from Service.pricing_executor import EXECUTOR_KINDS, PricingExecutor
+from Service.settings_service import get_pricing_config
+
+N_TICKETS = 10_000
+SOLVERS = ("analytic", "gurobi", "highs")
+# HiGHS pays ~2 ms of linprog overhead per ticket, so it is timed on fewer tickets
+HIGHS_TICKETS = 1_000
+# best of, as the pools are timed warm
+REPEATS = 3
+
+
+def worker_counts():
+    cores = os.cpu_count() or 1
+    counts, n = [], 1
+    while n < cores:
+        counts.append(n)
+        n *= 2
+    return counts + [cores]
+
+
+def serial_prices(tickets, solver, config):
+    # dynamic_ticket_price reports every fallback price; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        return np.array([dynamic_ticket_price(ticket, solver, config=config) for ticket in tickets])
+
+
+def main(solvers=SOLVERS):
+    rng = random.Random(11)
+    config = get_pricing_config()
+    population = [random_ticket(rng, config) for _ in range(N_TICKETS)]
+    print(f"{os.cpu_count()} cores")
+
+    for solver in solvers:
+        tickets = population[:HIGHS_TICKETS] if solver == "highs" else population
+        serial = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            expected = serial_prices(tickets, solver, config)
+            serial = min(serial, time.perf_counter() - start)
+        print(f"{solver}: {len(tickets)} tickets, serial {serial * 1000:9.1f} ms")
+
+        for kind in EXECUTOR_KINDS:
+            for workers in worker_counts():
+                with PricingExecutor(kind, workers, solver=solver) as executor:
+                    executor.price(tickets[:executor.chunk_size * workers], config)  # start every worker
+                    seconds = float("inf")
+                    for _ in range(REPEATS):
+                        start = time.perf_counter()
+                        prices = executor.price(tickets, config)
+                        seconds = min(seconds, time.perf_counter() - start)
+                # the closed form runs vectorized per chunk, which may round a half cent the other way
+                assert np.abs(prices - expected).max() <= 0.011, f"{kind} x{workers} prices differ from the serial ones"
+                print(f"    {kind:>7} x{workers:<3} {seconds * 1000:9.1f} ms | "
+                      f"{len(tickets) / seconds:9.0f} tickets/s | x{serial / seconds:.2f} vs serial")
+
+    with PricingExecutor("thread", 1, chunk_size=64, solver="gurobi") as executor:
+        job = executor.submit(population, config)
+        dropped = job.cancel()
+        print(f"cancel: {dropped} of {len(job.futures)} chunks dropped before they started")
+
+
+if __name__ == "__main__":
+    main(tuple(sys.argv[1:]) or SOLVERS)
@@ -0,0 +1,67 @@
+"""Solver backends side by side: identical prices, different cost.
+
+Prices a randomized ticket population with every backend and checks the prices agree to the
+cent, then solves one network pricing LP with each LP backend and compares the optimum.
+
+Run from the repository root:
+    python -m benchmarks.bench_solver_backends
+"""
+import random
+import time
+
+from benchmarks.bench_network_pricing import random_problem
+from benchmarks.bench_pricing import random_ticket
+from Service.GurobyResolver import extract_pricing_features
+from Service.settings_service import get_pricing_config
+from Service.solver_backends import BACKENDS, get_backend
+
+N_TICKETS = 2_000
+# small enough for a size-limited Gurobi licence
+NETWORK_FLIGHTS = 150
+
+
+def _final(price, features):
+    return round(features.expected_price, 2) if price is None else round(price, 2)
+
+
+def main():
+    rng = random.Random(7)
+    config = get_pricing_config()
+    population = [extract_pricing_features(random_ticket(rng, config), config) for _ in range(N_TICKETS)]
+
+    prices = {}
+    for name in BACKENDS:
+        backend = get_backend(name)
+        if backend.name != name:
+            print(f"{name:>8}: not available, skipped")
+            continue
+        start = time.perf_counter()
+        prices[name] = [_final(backend.solve_price(features), features) for features in population]
+        seconds = time.perf_counter() - start
+        print(f"{name:>8}: {N_TICKETS} tickets in {seconds * 1000:8.1f} ms | {seconds / N_TICKETS * 1e6:8.1f} us/ticket")
+
+    reference = prices.pop("analytic")
+    for name, solved in prices.items():
+        mismatches = [(a, b) for a, b in zip(reference, solved) if abs(a - b) > 0.011]
+        assert not mismatches, f"{len(mismatches)} {name} prices differ, e.g. {mismatches[:5]}"
+        print(f"parity: {name} prices identical to analytic on {N_TICKETS} tickets")
+
+    problem = random_problem(NETWORK_FLIGHTS)
+    results = {}
+    for name in ("gurobi", "highs"):
+        backend = get_backend(name)
+        if backend.name != name:
+            continue
+        result = results[name] = backend.solve_network(problem)
+        print(f"network {name:>6}: {NETWORK_FLIGHTS} flights | build {result.build_seconds * 1000:6.1f} ms | "
+              f"solve {result.solve_seconds * 1000:6.1f} ms | revenue {result.revenue:,.2f}")
+    if len(results) == 2:
+        gurobi, highs = results["gurobi"], results["highs"]
+        assert abs(gurobi.revenue - highs.revenue) <= 1e-6 * abs(gurobi.revenue), "network optima differ"
+        same = (abs(gurobi.prices - highs.prices) <= 0.011).mean()
+        print(f"parity: network optimum identical; {same:.1%} of class prices equal "
+              f"(the rest are alternative optima with the same revenue)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# Share of a flight's expected demand falling in each seat class
+CLASS_DEMAND_SHARE = {
+    "Economy": 0.70,
+    "Premium Economy": 0.15,
+    "Business": 0.10,
+    "First Class": 0.05,
+}
+
+# Expected demand relative to capacity before the flight's own demand adjustment (holidays, tourism)
+BASE_DEMAND_TO_CAPACITY = 1.1
+
+# Standard deviation of a class's demand as a fraction of its mean
+DEMAND_COEFFICIENT_OF_VARIATION = 0.35
+
+# Re-solve a flight's seat inventory once this fraction of its capacity has been sold since the last solve
+RESOLVE_SEAT_FRACTION = 0.05
+
+# Network pricing: demand grows by this fraction of the class mean as the price drops from
+# the per-ticket optimum to the lowest price the pricing constraints allow
+PRICE_ELASTICITY = 1.5
+
+# Network pricing: price points between a class's lowest allowed price (0) and its per-ticket optimum (1)
+NETWORK_PRICE_POINTS = (0.0, 0.5, 1.0)
+
+# Network pricing: flights into the same destination compete for one pool of travellers,
+# this fraction of their combined mean demand
+MARKET_DEMAND_OVERLAP = 0.8
@@ -0,0 +1,374 @@
+# Public holiday rules per country, keyed like IsoCountry.
+#
+# Each rule is (name, kind, *args):
+#   ("fixed", month, day)                  same calendar date every year
+#   ("easter", offset)                     days from Western Easter Sunday
+#   ("orthodox_easter", offset)            days from Orthodox Easter Sunday
+#   ("nth_weekday", month, weekday, n)     n-th weekday of the month (Monday = 0, n = -1 for the last)
+#   ("weekday_before", month, day, weekday) last given weekday on or before month/day
+#
+# Holidays that follow lunar or astronomical calendars (Islamic, Hebrew, Chinese New Year,
+# equinoxes...) and "observed" substitutions are not covered. Countries without a table, and the
+# lunar holidays of LUNAR_HOLIDAY_COUNTRIES, come from the holiday API instead.
+
+NEW_YEAR = ("New Year's Day", "fixed", 1, 1)
+MAUNDY_THURSDAY = ("Maundy Thursday", "easter", -3)
+GOOD_FRIDAY = ("Good Friday", "easter", -2)
+HOLY_SATURDAY = ("Holy Saturday", "easter", -1)
+EASTER_SUNDAY = ("Easter Sunday", "easter", 0)
+EASTER_MONDAY = ("Easter Monday", "easter", 1)
+ASCENSION = ("Ascension Day", "easter", 39)
+WHIT_SUNDAY = ("Whit Sunday", "easter", 49)
+WHIT_MONDAY = ("Whit Monday", "easter", 50)
+CORPUS_CHRISTI = ("Corpus Christi", "easter", 60)
+CARNIVAL_MONDAY = ("Carnival Monday", "easter", -48)
+CARNIVAL_TUESDAY = ("Carnival Tuesday", "easter", -47)
+ORTHODOX_GOOD_FRIDAY = ("Orthodox Good Friday", "orthodox_easter", -2)
+ORTHODOX_EASTER_SUNDAY = ("Orthodox Easter Sunday", "orthodox_easter", 0)
+ORTHODOX_EASTER_MONDAY = ("Orthodox Easter Monday", "orthodox_easter", 1)
+LABOUR_DAY = ("Labour Day", "fixed", 5, 1)
+ASSUMPTION = ("Assumption Day", "fixed", 8, 15)
+ALL_SAINTS = ("All Saints' Day", "fixed", 11, 1)
+IMMACULATE_CONCEPTION = ("Immaculate Conception", "fixed", 12, 8)
+CHRISTMAS_EVE = ("Christmas Eve", "fixed", 12, 24)
+CHRISTMAS = ("Christmas Day", "fixed", 12, 25)
+BOXING_DAY = ("Boxing Day", "fixed", 12, 26)
+
+HOLIDAY_RULES = {
+    "Argentina": [
+        NEW_YEAR, CARNIVAL_MONDAY, CARNIVAL_TUESDAY,
+        ("Day of Remembrance", "fixed", 3, 24), ("Malvinas Day", "fixed", 4, 2),
+        GOOD_FRIDAY, LABOUR_DAY, ("May Revolution", "fixed", 5, 25), ("Flag Day", "fixed", 6, 20),
+        ("Independence Day", "fixed", 7, 9), IMMACULATE_CONCEPTION, CHRISTMAS,
+    ],
+    "Australia": [
+        NEW_YEAR, ("Australia Day", "fixed", 1, 26), GOOD_FRIDAY, HOLY_SATURDAY, EASTER_MONDAY,
+        ("Anzac Day", "fixed", 4, 25), ("King's Birthday", "nth_weekday", 6, 0, 2), CHRISTMAS, BOXING_DAY,
+    ],
+    "Austria": [
+        NEW_YEAR, ("Epiphany", "fixed", 1, 6), EASTER_MONDAY, LABOUR_DAY, ASCENSION, WHIT_MONDAY,
+        CORPUS_CHRISTI, ASSUMPTION, ("National Day", "fixed", 10, 26), ALL_SAINTS, IMMACULATE_CONCEPTION,
+        CHRISTMAS, ("St. Stephen's Day", "fixed", 12, 26),
+    ],
+    "Belgium": [
+        NEW_YEAR, EASTER_MONDAY, LABOUR_DAY, ASCENSION, WHIT_MONDAY, ("National Day", "fixed", 7, 21),
+        ASSUMPTION, ALL_SAINTS, ("Armistice Day", "fixed", 11, 11), CHRISTMAS,
+    ],
+    "Brazil": [
+        NEW_YEAR, CARNIVAL_MONDAY, CARNIVAL_TUESDAY, GOOD_FRIDAY, ("Tiradentes", "fixed", 4, 21), LABOUR_DAY,
+        CORPUS_CHRISTI, ("Independence Day", "fixed", 9, 7), ("Our Lady of Aparecida", "fixed", 10, 12),
+        ("All Souls' Day", "fixed", 11, 2), ("Republic Day", "fixed", 11, 15),
+        ("Black Consciousness Day", "fixed", 11, 20), CHRISTMAS,
+    ],
+    "Bulgaria": [
+        NEW_YEAR, ("Liberation Day", "fixed", 3, 3), ORTHODOX_GOOD_FRIDAY, ORTHODOX_EASTER_SUNDAY,
+        ORTHODOX_EASTER_MONDAY, LABOUR_DAY, ("St. George's Day", "fixed", 5, 6),
+        ("Culture and Literacy Day", "fixed", 5, 24), ("Unification Day", "fixed", 9, 6),
+        ("Independence Day", "fixed", 9, 22), CHRISTMAS_EVE, CHRISTMAS, BOXING_DAY,
+    ],
+    "Canada": [
+        NEW_YEAR, GOOD_FRIDAY, ("Victoria Day", "weekday_before", 5, 24, 0), ("Canada Day", "fixed", 7, 1),
+        ("Labour Day", "nth_weekday", 9, 0, 1), ("Thanksgiving", "nth_weekday", 10, 0, 2),
+        ("Remembrance Day", "fixed", 11, 11), CHRISTMAS, BOXING_DAY,
+    ],
+    "Chile": [
+        NEW_YEAR, GOOD_FRIDAY, HOLY_SATURDAY, LABOUR_DAY, ("Navy Day", "fixed", 5, 21),
+        ("Our Lady of Mount Carmel", "fixed", 7, 16), ASSUMPTION, ("Independence Day", "fixed", 9, 18),
+        ("Army Day", "fixed", 9, 19), ALL_SAINTS, IMMACULATE_CONCEPTION, CHRISTMAS,
+    ],
+    "China": [
+        NEW_YEAR, LABOUR_DAY, ("National Day", "fixed", 10, 1), ("National Day Holiday", "fixed", 10, 2),
+        ("National Day Holiday", "fixed", 10, 3),
+    ],
+    "Colombia": [
+        NEW_YEAR, MAUNDY_THURSDAY, GOOD_FRIDAY, LABOUR_DAY, ("Independence Day", "fixed", 7, 20),
+        ("Battle of Boyacá", "fixed", 8, 7), IMMACULATE_CONCEPTION, CHRISTMAS,
+    ],
+    "Croatia": [
+        NEW_YEAR, ("Epiphany", "fixed", 1, 6), EASTER_SUNDAY, EASTER_MONDAY, LABOUR_DAY,
+        ("Statehood Day", "fixed", 5, 30), CORPUS_CHRISTI, ("Anti-Fascist Struggle Day", "fixed", 6, 22),
+        ("Victory Day", "fixed", 8, 5), ASSUMPTION, ALL_SAINTS, ("Remembrance Day", "fixed", 11, 18),
+        CHRISTMAS, BOXING_DAY,
+    ],
+    "Cuba": [
+        ("Liberation Day", "fixed", 1, 1), ("Victory Day", "fixed", 1, 2), GOOD_FRIDAY, LABOUR_DAY,
+        ("National Rebellion Day", "fixed", 7, 25), ("National Rebellion Day", "fixed", 7, 26),
+        ("National Rebellion Day", "fixed", 7, 27), ("Independence Day", "fixed", 10, 10), CHRISTMAS,
+    ],
+    "Czech Republic": [
+        NEW_YEAR, GOOD_FRIDAY, EASTER_MONDAY, LABOUR_DAY, ("Liberation Day", "fixed", 5, 8),
+        ("Saints Cyril and Methodius Day", "fixed", 7, 5), ("Jan Hus Day", "fixed", 7, 6),
+        ("Statehood Day", "fixed", 9, 28), ("Independence Day", "fixed", 10, 28),
+        ("Freedom and Democracy Day", "fixed", 11, 17), CHRISTMAS_EVE, CHRISTMAS, BOXING_DAY,
+    ],
+    "Denmark": [
+        NEW_YEAR, MAUNDY_THURSDAY, GOOD_FRIDAY, EASTER_SUNDAY, EASTER_MONDAY, ASCENSION, WHIT_SUNDAY,
+        WHIT_MONDAY, CHRISTMAS, BOXING_DAY,
+    ],
+    "Egypt": [
+        ("Coptic Christmas", "fixed", 1, 7), ("Revolution Day", "fixed", 1, 25),
+        ("Sinai Liberation Day", "fixed", 4, 25), LABOUR_DAY, ("June 30 Revolution", "fixed", 6, 30),
+        ("Revolution Day", "fixed", 7, 23), ("Armed Forces Day", "fixed", 10, 6),
+    ],
+    "Estonia": [
+        NEW_YEAR, ("Independence Day", "fixed", 2, 24), GOOD_FRIDAY, EASTER_SUNDAY, LABOUR_DAY, WHIT_SUNDAY,
+        ("Victory Day", "fixed", 6, 23), ("Midsummer Day", "fixed", 6, 24),
+        ("Restoration of Independence", "fixed", 8, 20), CHRISTMAS_EVE, CHRISTMAS, BOXING_DAY,
+    ],
+    "Finland": [
+        NEW_YEAR, ("Epiphany", "fixed", 1, 6), GOOD_FRIDAY, EASTER_SUNDAY, EASTER_MONDAY, LABOUR_DAY,
+        ASCENSION, ("Midsummer Day", "weekday_before", 6, 26, 5), ("All Saints' Day", "weekday_before", 11, 6, 5),
+        ("Independence Day", "fixed", 12, 6), CHRISTMAS, BOXING_DAY,
+    ],
+    "France": [
+        NEW_YEAR, EASTER_MONDAY, LABOUR_DAY, ("Victory in Europe Day", "fixed", 5, 8), ASCENSION, WHIT_MONDAY,
+        ("Bastille Day", "fixed", 7, 14), ASSUMPTION, ALL_SAINTS, ("Armistice Day", "fixed", 11, 11), CHRISTMAS,
+    ],
+    "Germany": [
+        NEW_YEAR, GOOD_FRIDAY, EASTER_MONDAY, LABOUR_DAY, ASCENSION, WHIT_MONDAY,
+        ("German Unity Day", "fixed", 10, 3), CHRISTMAS, BOXING_DAY,
+    ],
+    "Greece": [
+        NEW_YEAR, ("Epiphany", "fixed", 1, 6), ("Clean Monday", "orthodox_easter", -48),
+        ("Independence Day", "fixed", 3, 25), ORTHODOX_GOOD_FRIDAY, ORTHODOX_EASTER_MONDAY, LABOUR_DAY,
+        ("Orthodox Whit Monday", "orthodox_easter", 50), ASSUMPTION, ("Ochi Day", "fixed", 10, 28),
+        CHRISTMAS, BOXING_DAY,
+    ],
+    "Hungary": [
+        NEW_YEAR, ("Revolution Day", "fixed", 3, 15), GOOD_FRIDAY, EASTER_MONDAY, LABOUR_DAY, WHIT_MONDAY,
+        ("St. Stephen's Day", "fixed", 8, 20), ("Republic Day", "fixed", 10, 23), ALL_SAINTS, CHRISTMAS,
+        BOXING_DAY,
+    ],
+    "Iceland": [
+        NEW_YEAR, MAUNDY_THURSDAY, GOOD_FRIDAY, EASTER_SUNDAY, EASTER_MONDAY,
+        ("First Day of Summer", "weekday_before", 4, 25, 3), LABOUR_DAY, ASCENSION, WHIT_SUNDAY, WHIT_MONDAY,
+        ("National Day", "fixed", 6, 17), ("Commerce Day", "nth_weekday", 8, 0, 1), CHRISTMAS, BOXING_DAY,
+    ],
+    "India": [
+        ("Republic Day", "fixed", 1, 26), ("Independence Day", "fixed", 8, 15), ("Gandhi Jayanti", "fixed", 10, 2),
+    ],
+    "Indonesia": [
+        NEW_YEAR, GOOD_FRIDAY, LABOUR_DAY, ASCENSION, ("Pancasila Day", "fixed", 6, 1),
+        ("Independence Day", "fixed", 8, 17), CHRISTMAS,
+    ],
+    "Ireland": [
+        NEW_YEAR, ("St. Brigid's Day", "nth_weekday", 2, 0, 1), ("St. Patrick's Day", "fixed", 3, 17),
+        EASTER_MONDAY, ("May Bank Holiday", "nth_weekday", 5, 0, 1), ("June Bank Holiday", "nth_weekday", 6, 0, 1),
+        ("August Bank Holiday", "nth_weekday", 8, 0, 1), ("October Bank Holiday", "nth_weekday", 10, 0, -1),
+        CHRISTMAS, ("St. Stephen's Day", "fixed", 12, 26),
+    ],
+    "Italy": [
+        NEW_YEAR, ("Epiphany", "fixed", 1, 6), EASTER_SUNDAY, EASTER_MONDAY, ("Liberation Day", "fixed", 4, 25),
+        LABOUR_DAY, ("Republic Day", "fixed", 6, 2), ASSUMPTION, ALL_SAINTS, IMMACULATE_CONCEPTION, CHRISTMAS,
+        ("St. Stephen's Day", "fixed", 12, 26),
+    ],
+    "Jamaica": [
+        NEW_YEAR, ("Ash Wednesday", "easter", -46), GOOD_FRIDAY, EASTER_MONDAY, ("Labour Day", "fixed", 5, 23),
+        ("Emancipation Day", "fixed", 8, 1), ("Independence Day", "fixed", 8, 6),
+        ("National Heroes Day", "nth_weekday", 10, 0, 3), CHRISTMAS, BOXING_DAY,
+    ],
+    "Japan": [
+        NEW_YEAR, ("Coming of Age Day", "nth_weekday", 1, 0, 2), ("National Foundation Day", "fixed", 2, 11),
+        ("Emperor's Birthday", "fixed", 2, 23), ("Showa Day", "fixed", 4, 29),
+        ("Constitution Memorial Day", "fixed", 5, 3), ("Greenery Day", "fixed", 5, 4),
+        ("Children's Day", "fixed", 5, 5), ("Marine Day", "nth_weekday", 7, 0, 3),
+        ("Mountain Day", "fixed", 8, 11), ("Respect for the Aged Day", "nth_weekday", 9, 0, 3),
+        ("Sports Day", "nth_weekday", 10, 0, 2), ("Culture Day", "fixed", 11, 3),
+        ("Labour Thanksgiving Day", "fixed", 11, 23),
+    ],
+    "Kenya": [
+        NEW_YEAR, GOOD_FRIDAY, EASTER_MONDAY, LABOUR_DAY, ("Madaraka Day", "fixed", 6, 1),
+        ("Utamaduni Day", "fixed", 10, 10), ("Mashujaa Day", "fixed", 10, 20), ("Jamhuri Day", "fixed", 12, 12),
+        CHRISTMAS, BOXING_DAY,
+    ],
+    "Korea (South)": [
+        NEW_YEAR, ("Independence Movement Day", "fixed", 3, 1), ("Children's Day", "fixed", 5, 5),
+        ("Memorial Day", "fixed", 6, 6), ("Liberation Day", "fixed", 8, 15),
+        ("National Foundation Day", "fixed", 10, 3), ("Hangul Day", "fixed", 10, 9), CHRISTMAS,
+    ],
+    "Latvia": [
+        NEW_YEAR, GOOD_FRIDAY, EASTER_MONDAY, LABOUR_DAY, ("Restoration of Independence", "fixed", 5, 4),
+        ("Midsummer Eve", "fixed", 6, 23), ("Midsummer Day", "fixed", 6, 24),
+        ("Proclamation Day", "fixed", 11, 18), CHRISTMAS_EVE, CHRISTMAS, BOXING_DAY,
+        ("New Year's Eve", "fixed", 12, 31),
+    ],
+    "Lithuania": [
+        NEW_YEAR, ("Restoration of the State", "fixed", 2, 16), ("Restoration of Independence", "fixed", 3, 11),
+        EASTER_SUNDAY, EASTER_MONDAY, LABOUR_DAY, ("St. John's Day", "fixed", 6, 24),
+        ("Statehood Day", "fixed", 7, 6), ASSUMPTION, ALL_SAINTS, ("All Souls' Day", "fixed", 11, 2),
+        CHRISTMAS_EVE, CHRISTMAS, BOXING_DAY,
+    ],
+    "Luxembourg": [
+        NEW_YEAR, EASTER_MONDAY, LABOUR_DAY, ("Europe Day", "fixed", 5, 9), ASCENSION, WHIT_MONDAY,
+        ("National Day", "fixed", 6, 23), ASSUMPTION, ALL_SAINTS, CHRISTMAS, BOXING_DAY,
+    ],
+    "Malaysia": [
+        LABOUR_DAY, ("King's Birthday", "nth_weekday", 6, 0, 1), ("National Day", "fixed", 8, 31),
+        ("Malaysia Day", "fixed", 9, 16), CHRISTMAS,
+    ],
+    "Mexico": [
+        NEW_YEAR, ("Constitution Day", "nth_weekday", 2, 0, 1), ("Benito Juárez Day", "nth_weekday", 3, 0, 3),
+        LABOUR_DAY, ("Independence Day", "fixed", 9, 16), ("Revolution Day", "nth_weekday", 11, 0, 3), CHRISTMAS,
+    ],
+    "Morocco": [
+        NEW_YEAR, ("Independence Manifesto Day", "fixed", 1, 11), ("Amazigh New Year", "fixed", 1, 14), LABOUR_DAY,
+        ("Throne Day", "fixed", 7, 30), ("Oued Ed-Dahab Day", "fixed", 8, 14),
+        ("Revolution of the King and the People", "fixed", 8, 20), ("Youth Day", "fixed", 8, 21),
+        ("Green March", "fixed", 11, 6), ("Independence Day", "fixed", 11, 18),
+    ],
+    "Netherlands": [
+        NEW_YEAR, EASTER_SUNDAY, EASTER_MONDAY, ("King's Day", "fixed", 4, 27), ("Liberation Day", "fixed", 5, 5),
+        ASCENSION, WHIT_SUNDAY, WHIT_MONDAY, CHRISTMAS, BOXING_DAY,
+    ],
+    "New Zealand": [
+        NEW_YEAR, ("Day after New Year's Day", "fixed", 1, 2), ("Waitangi Day", "fixed", 2, 6), GOOD_FRIDAY,
+        EASTER_MONDAY, ("Anzac Day", "fixed", 4, 25), ("King's Birthday", "nth_weekday", 6, 0, 1),
+        ("Labour Day", "nth_weekday", 10, 0, 4), CHRISTMAS, BOXING_DAY,
+    ],
+    "Nigeria": [
+        NEW_YEAR, GOOD_FRIDAY, EASTER_MONDAY, ("Workers' Day", "fixed", 5, 1), ("Democracy Day", "fixed", 6, 12),
+        ("Independence Day", "fixed", 10, 1), CHRISTMAS, BOXING_DAY,
+    ],
+    "Norway": [
+        NEW_YEAR, MAUNDY_THURSDAY, GOOD_FRIDAY, EASTER_SUNDAY, EASTER_MONDAY, LABOUR_DAY,
+        ("Constitution Day", "fixed", 5, 17), ASCENSION, WHIT_SUNDAY, WHIT_MONDAY, CHRISTMAS, BOXING_DAY,
+    ],
+    "Peru": [
+        NEW_YEAR, MAUNDY_THURSDAY, GOOD_FRIDAY, LABOUR_DAY, ("Saints Peter and Paul", "fixed", 6, 29),
+        ("Independence Day", "fixed", 7, 28), ("Independence Day", "fixed", 7, 29),
+        ("Battle of Junín", "fixed", 8, 6), ("Santa Rosa de Lima", "fixed", 8, 30),
+        ("Battle of Angamos", "fixed", 10, 8), ALL_SAINTS, IMMACULATE_CONCEPTION,
+        ("Battle of Ayacucho", "fixed", 12, 9), CHRISTMAS,
+    ],
+    "Philippines": [
+        NEW_YEAR, ("Day of Valor", "fixed", 4, 9), MAUNDY_THURSDAY, GOOD_FRIDAY, LABOUR_DAY,
+        ("Independence Day", "fixed", 6, 12), ("National Heroes Day", "nth_weekday", 8, 0, -1),
+        ("Bonifacio Day", "fixed", 11, 30), IMMACULATE_CONCEPTION, CHRISTMAS, ("Rizal Day", "fixed", 12, 30),
+        ("New Year's Eve", "fixed", 12, 31),
+    ],
+    "Poland": [
+        NEW_YEAR, ("Epiphany", "fixed", 1, 6), EASTER_SUNDAY, EASTER_MONDAY, LABOUR_DAY,
+        ("Constitution Day", "fixed", 5, 3), WHIT_SUNDAY, CORPUS_CHRISTI, ASSUMPTION, ALL_SAINTS,
+        ("Independence Day", "fixed", 11, 11), CHRISTMAS_EVE, CHRISTMAS, BOXING_DAY,
+    ],
+    "Portugal": [
+        NEW_YEAR, GOOD_FRIDAY, EASTER_SUNDAY, ("Freedom Day", "fixed", 4, 25), LABOUR_DAY, CORPUS_CHRISTI,
+        ("Portugal Day", "fixed", 6, 10), ASSUMPTION, ("Republic Day", "fixed", 10, 5), ALL_SAINTS,
+        ("Restoration of Independence", "fixed", 12, 1), IMMACULATE_CONCEPTION, CHRISTMAS,
+    ],
+    "Romania": [
+        NEW_YEAR, ("Day after New Year's Day", "fixed", 1, 2), ("Unification Day", "fixed", 1, 24),
+        ORTHODOX_GOOD_FRIDAY, ORTHODOX_EASTER_SUNDAY, ORTHODOX_EASTER_MONDAY, LABOUR_DAY,
+        ("Children's Day", "fixed", 6, 1), ("Orthodox Pentecost", "orthodox_easter", 49),
+        ("Orthodox Whit Monday", "orthodox_easter", 50), ASSUMPTION, ("St. Andrew's Day", "fixed", 11, 30),
+        ("National Day", "fixed", 12, 1), CHRISTMAS, BOXING_DAY,
+    ],
+    "Russia": [
+        NEW_YEAR, ("New Year Holiday", "fixed", 1, 2), ("New Year Holiday", "fixed", 1, 3),
+        ("New Year Holiday", "fixed", 1, 4), ("New Year Holiday", "fixed", 1, 5),
+        ("New Year Holiday", "fixed", 1, 6), ("Orthodox Christmas", "fixed", 1, 7),
+        ("New Year Holiday", "fixed", 1, 8), ("Defender of the Fatherland Day", "fixed", 2, 23),
+        ("International Women's Day", "fixed", 3, 8), ("Spring and Labour Day", "fixed", 5, 1),
+        ("Victory Day", "fixed", 5, 9), ("Russia Day", "fixed", 6, 12), ("Unity Day", "fixed", 11, 4),
+    ],
+    "Saudi Arabia": [
+        ("Founding Day", "fixed", 2, 22), ("National Day", "fixed", 9, 23),
+    ],
+    "Serbia": [
+        NEW_YEAR, ("Day after New Year's Day", "fixed", 1, 2), ("Orthodox Christmas", "fixed", 1, 7),
+        ("Statehood Day", "fixed", 2, 15), ("Statehood Day", "fixed", 2, 16), ORTHODOX_GOOD_FRIDAY,
+        ORTHODOX_EASTER_SUNDAY, ORTHODOX_EASTER_MONDAY, LABOUR_DAY, ("Labour Day", "fixed", 5, 2),
+        ("Armistice Day", "fixed", 11, 11),
+    ],
+    "Singapore": [
+        NEW_YEAR, GOOD_FRIDAY, LABOUR_DAY, ("National Day", "fixed", 8, 9), CHRISTMAS,
+    ],
+    "Slovakia": [
+        ("Republic Day", "fixed", 1, 1), ("Epiphany", "fixed", 1, 6), GOOD_FRIDAY, EASTER_MONDAY, LABOUR_DAY,
+        ("Victory over Fascism Day", "fixed", 5, 8), ("Saints Cyril and Methodius Day", "fixed", 7, 5),
+        ("Slovak National Uprising", "fixed", 8, 29), ("Constitution Day", "fixed", 9, 1),
+        ("Our Lady of Sorrows", "fixed", 9, 15), ALL_SAINTS, ("Freedom and Democracy Day", "fixed", 11, 17),
+        CHRISTMAS_EVE, CHRISTMAS, BOXING_DAY,
+    ],
+    "Slovenia": [
+        NEW_YEAR, ("New Year Holiday", "fixed", 1, 2), ("Prešeren Day", "fixed", 2, 8), EASTER_SUNDAY,
+        EASTER_MONDAY, ("Day of Uprising Against Occupation", "fixed", 4, 27), LABOUR_DAY,
+        ("Labour Day", "fixed", 5, 2), WHIT_SUNDAY, ("Statehood Day", "fixed", 6, 25), ASSUMPTION,
+        ("Reformation Day", "fixed", 10, 31), ALL_SAINTS, CHRISTMAS, ("Independence and Unity Day", "fixed", 12, 26),
+    ],
+    "South Africa": [
+        NEW_YEAR, ("Human Rights Day", "fixed", 3, 21), GOOD_FRIDAY, ("Family Day", "easter", 1),
+        ("Freedom Day", "fixed", 4, 27), ("Workers' Day", "fixed", 5, 1), ("Youth Day", "fixed", 6, 16),
+        ("National Women's Day", "fixed", 8, 9), ("Heritage Day", "fixed", 9, 24),
+        ("Day of Reconciliation", "fixed", 12, 16), CHRISTMAS, ("Day of Goodwill", "fixed", 12, 26),
+    ],
+    "Spain": [
+        NEW_YEAR, ("Epiphany", "fixed", 1, 6), GOOD_FRIDAY, LABOUR_DAY, ASSUMPTION,
+        ("National Day", "fixed", 10, 12), ALL_SAINTS, ("Constitution Day", "fixed", 12, 6),
+        IMMACULATE_CONCEPTION, CHRISTMAS,
+    ],
+    "Sweden": [
+        NEW_YEAR, ("Epiphany", "fixed", 1, 6), GOOD_FRIDAY, EASTER_SUNDAY, EASTER_MONDAY, LABOUR_DAY, ASCENSION,
+        WHIT_SUNDAY, ("National Day", "fixed", 6, 6), ("Midsummer Day", "weekday_before", 6, 26, 5),
+        ("All Saints' Day", "weekday_before", 11, 6, 5), CHRISTMAS, BOXING_DAY,
+    ],
+    "Switzerland": [
+        NEW_YEAR, GOOD_FRIDAY, EASTER_MONDAY, ASCENSION, WHIT_MONDAY, ("National Day", "fixed", 8, 1),
+        CHRISTMAS, ("St. Stephen's Day", "fixed", 12, 26),
+    ],
+    "Thailand": [
+        NEW_YEAR, ("Chakri Day", "fixed", 4, 6), ("Songkran", "fixed", 4, 13), ("Songkran", "fixed", 4, 14),
+        ("Songkran", "fixed", 4, 15), LABOUR_DAY, ("Queen Suthida's Birthday", "fixed", 6, 3),
+        ("King's Birthday", "fixed", 7, 28), ("Mother's Day", "fixed", 8, 12),
+        ("King Bhumibol Memorial Day", "fixed", 10, 13), ("Chulalongkorn Day", "fixed", 10, 23),
+        ("Father's Day", "fixed", 12, 5), ("Constitution Day", "fixed", 12, 10), ("New Year's Eve", "fixed", 12, 31),
+    ],
+    "Tunisia": [
+        NEW_YEAR, ("Independence Day", "fixed", 3, 20), ("Martyrs' Day", "fixed", 4, 9), LABOUR_DAY,
+        ("Republic Day", "fixed", 7, 25), ("Women's Day", "fixed", 8, 13), ("Revolution Day", "fixed", 12, 17),
+    ],
+    "Turkey": [
+        NEW_YEAR, ("National Sovereignty and Children's Day", "fixed", 4, 23), ("Labour Day", "fixed", 5, 1),
+        ("Youth and Sports Day", "fixed", 5, 19), ("Democracy and National Unity Day", "fixed", 7, 15),
+        ("Victory Day", "fixed", 8, 30), ("Republic Day", "fixed", 10, 29),
+    ],
+    "Ukraine": [
+        NEW_YEAR, ("International Women's Day", "fixed", 3, 8), ORTHODOX_EASTER_SUNDAY, LABOUR_DAY,
+        ("Victory Day", "fixed", 5, 8), ("Constitution Day", "fixed", 6, 28), ("Statehood Day", "fixed", 7, 15),
+        ("Independence Day", "fixed", 8, 24), ("Defenders Day", "fixed", 10, 1), CHRISTMAS,
+    ],
+    "United Arab Emirates": [
+        NEW_YEAR, ("National Day", "fixed", 12, 2), ("National Day", "fixed", 12, 3),
+    ],
+    "United Kingdom": [
+        NEW_YEAR, GOOD_FRIDAY, EASTER_MONDAY, ("Early May Bank Holiday", "nth_weekday", 5, 0, 1),
+        ("Spring Bank Holiday", "nth_weekday", 5, 0, -1), ("Summer Bank Holiday", "nth_weekday", 8, 0, -1),
+        CHRISTMAS, BOXING_DAY,
+    ],
+    "United States": [
+        NEW_YEAR, ("Martin Luther King Jr. Day", "nth_weekday", 1, 0, 3),
+        ("Presidents' Day", "nth_weekday", 2, 0, 3), ("Memorial Day", "nth_weekday", 5, 0, -1),
+        ("Juneteenth", "fixed", 6, 19), ("Independence Day", "fixed", 7, 4),
+        ("Labor Day", "nth_weekday", 9, 0, 1), ("Columbus Day", "nth_weekday", 10, 0, 2),
+        ("Veterans Day", "fixed", 11, 11), ("Thanksgiving", "nth_weekday", 11, 3, 4), CHRISTMAS,
+    ],
+    "Vietnam": [
+        NEW_YEAR, ("Reunification Day", "fixed", 4, 30), LABOUR_DAY, ("National Day", "fixed", 9, 2),
+    ],
+}
+
+# Names used by COUNTRY_TO_ISO for countries that IsoCountry spells differently
+HOLIDAY_RULE_ALIASES = {
+    "Czechia": "Czech Republic",
+    "South Korea": "Korea (South)",
+    "Alaska (US)": "United States",
+    "Democratic Republic of the Congo": "Congo (Democratic Republic)",
+}
+
+# Countries with a table whose public holidays also follow lunar or astronomical calendars
+# (Eid, Lunar New Year, Diwali, equinoxes...), so the table alone is incomplete
+LUNAR_HOLIDAY_COUNTRIES = frozenset({
+    "China", "Egypt", "India", "Indonesia", "Japan", "Kenya", "Korea (South)", "Malaysia", "Morocco",
+    "Nigeria", "Philippines", "Saudi Arabia", "Singapore", "Thailand", "Tunisia", "Turkey",
+    "United Arab Emirates", "Vietnam",
+})
@@ -3,4 +3,9 @@ MAJOR_TOURIST_DESTINATION = "Major tourist destination"
 STRONG_TOURIST_DESTINATION = "Strong tourist destination"
 MODERATE_TOURIST_DESTINATION = "Moderate tourist destination"
 LOW_TOURIST_DESTINATION = "Low tourist destination"
-NO_DATA = "No data"
\ No newline at end of file
+NO_DATA = "No data"
+# Ascending order; a country's class is the band its arrivals fall into
+TOURISM_CLASSES = (LOW_TOURIST_DESTINATION, MODERATE_TOURIST_DESTINATION, STRONG_TOURIST_DESTINATION, MAJOR_TOURIST_DESTINATION)
+# Percentiles of the arrivals of every country with data that separate the classes above
+TOURISM_PERCENTILE_BANDS = (40, 70, 85)
+TOURIST_HOTSPOT_CLASSES = (STRONG_TOURIST_DESTINATION, MAJOR_TOURIST_DESTINATION)
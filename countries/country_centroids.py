@@ -0,0 +1,208 @@
+# country_centroids.py
+# Mapping: ISO 3166-1 alpha-2 code → (latitude, longitude) of the country centroid
+# Same reference points restcountries.com returns in its "latlng" field, bundled so
+# distance lookups never need the network.
+
+COUNTRY_CENTROIDS = {
+    "AF": (33.0, 65.0),  # Afghanistan
+    "AL": (41.0, 20.0),  # Albania
+    "DZ": (28.0, 3.0),  # Algeria
+    "AD": (42.5, 1.5),  # Andorra
+    "AO": (-12.5, 18.5),  # Angola
+    "AG": (17.05, -61.8),  # Antigua and Barbuda
+    "AR": (-34.0, -64.0),  # Argentina
+    "AM": (40.0, 45.0),  # Armenia
+    "AU": (-27.0, 133.0),  # Australia
+    "AT": (47.33333333, 13.33333333),  # Austria
+    "AZ": (40.5, 47.5),  # Azerbaijan
+    "BS": (24.25, -76.0),  # Bahamas
+    "BH": (26.0, 50.55),  # Bahrain
+    "BD": (24.0, 90.0),  # Bangladesh
+    "BB": (13.16666666, -59.53333333),  # Barbados
+    "BY": (53.0, 28.0),  # Belarus
+    "BE": (50.83333333, 4.0),  # Belgium
+    "BZ": (17.25, -88.75),  # Belize
+    "BJ": (9.5, 2.25),  # Benin
+    "BT": (27.5, 90.5),  # Bhutan
+    "BO": (-17.0, -65.0),  # Bolivia
+    "BA": (44.0, 18.0),  # Bosnia and Herzegovina
+    "BW": (-22.0, 24.0),  # Botswana
+    "BR": (-10.0, -55.0),  # Brazil
+    "BN": (4.5, 114.66666666),  # Brunei
+    "BG": (43.0, 25.0),  # Bulgaria
+    "BF": (13.0, -2.0),  # Burkina Faso
+    "BI": (-3.5, 30.0),  # Burundi
+    "KH": (13.0, 105.0),  # Cambodia
+    "CM": (6.0, 12.0),  # Cameroon
+    "CA": (60.0, -95.0),  # Canada
+    "CV": (16.0, -24.0),  # Cape Verde
+    "CF": (7.0, 21.0),  # Central African Republic
+    "TD": (15.0, 19.0),  # Chad
+    "CL": (-30.0, -71.0),  # Chile
+    "CN": (35.0, 105.0),  # China
+    "CO": (4.0, -72.0),  # Colombia
+    "KM": (-12.16666666, 44.25),  # Comoros
+    "CD": (0.0, 25.0),  # Congo (Democratic Republic)
+    "CG": (-1.0, 15.0),  # Congo (Republic)
+    "CR": (10.0, -84.0),  # Costa Rica
+    "HR": (45.16666666, 15.5),  # Croatia
+    "CU": (21.5, -80.0),  # Cuba
+    "CY": (35.0, 33.0),  # Cyprus
+    "CZ": (49.75, 15.5),  # Czech Republic
+    "DK": (56.0, 10.0),  # Denmark
+    "DJ": (11.5, 43.0),  # Djibouti
+    "DM": (15.41666666, -61.33333333),  # Dominica
+    "DO": (19.0, -70.66666666),  # Dominican Republic
+    "EC": (-2.0, -77.5),  # Ecuador
+    "EG": (27.0, 30.0),  # Egypt
+    "SV": (13.83333333, -88.91666666),  # El Salvador
+    "GQ": (2.0, 10.0),  # Equatorial Guinea
+    "ER": (15.0, 39.0),  # Eritrea
+    "EE": (59.0, 26.0),  # Estonia
+    "SZ": (-26.5, 31.5),  # Eswatini
+    "ET": (8.0, 38.0),  # Ethiopia
+    "FJ": (-18.0, 175.0),  # Fiji
+    "FI": (64.0, 26.0),  # Finland
+    "FR": (46.0, 2.0),  # France
+    "GA": (-1.0, 11.75),  # Gabon
+    "GM": (13.46666666, -16.56666666),  # Gambia
+    "GE": (42.0, 43.5),  # Georgia
+    "DE": (51.0, 9.0),  # Germany
+    "GH": (8.0, -2.0),  # Ghana
+    "GR": (39.0, 22.0),  # Greece
+    "GL": (72.0, -40.0),  # Greenland
+    "GD": (12.11666666, -61.66666666),  # Grenada
+    "GT": (15.5, -90.25),  # Guatemala
+    "GN": (11.0, -10.0),  # Guinea
+    "GW": (12.0, -15.0),  # Guinea-Bissau
+    "GY": (5.0, -59.0),  # Guyana
+    "HT": (19.0, -72.41666666),  # Haiti
+    "HN": (15.0, -86.5),  # Honduras
+    "HU": (47.0, 20.0),  # Hungary
+    "IS": (65.0, -18.0),  # Iceland
+    "IN": (20.0, 77.0),  # India
+    "ID": (-5.0, 120.0),  # Indonesia
+    "IR": (32.0, 53.0),  # Iran
+    "IQ": (33.0, 44.0),  # Iraq
+    "IE": (53.0, -8.0),  # Ireland
+    "IL": (31.5, 34.75),  # Israel
+    "IT": (42.83333333, 12.83333333),  # Italy
+    "JM": (17.971389, -76.793056),  # Jamaica
+    "JP": (36.0, 138.0),  # Japan
+    "JO": (31.0, 36.0),  # Jordan
+    "KZ": (48.0, 68.0),  # Kazakhstan
+    "KE": (1.0, 38.0),  # Kenya
+    "KI": (1.41666666, 173.0),  # Kiribati
+    "KP": (40.0, 127.0),  # Korea (North)
+    "KR": (37.0, 127.5),  # Korea (South)
+    "KW": (29.5, 45.75),  # Kuwait
+    "KG": (41.0, 75.0),  # Kyrgyzstan
+    "LA": (18.0, 105.0),  # Laos
+    "LV": (57.0, 25.0),  # Latvia
+    "LB": (33.83333333, 35.83333333),  # Lebanon
+    "LS": (-29.5, 28.5),  # Lesotho
+    "LR": (6.5, -9.5),  # Liberia
+    "LY": (25.0, 17.0),  # Libya
+    "LI": (47.26666666, 9.53333333),  # Liechtenstein
+    "LT": (56.0, 24.0),  # Lithuania
+    "LU": (49.75, 6.16666666),  # Luxembourg
+    "MG": (-20.0, 47.0),  # Madagascar
+    "MW": (-13.5, 34.0),  # Malawi
+    "MY": (2.5, 112.5),  # Malaysia
+    "MV": (3.25, 73.0),  # Maldives
+    "ML": (17.0, -4.0),  # Mali
+    "MT": (35.83333333, 14.58333333),  # Malta
+    "MH": (9.0, 168.0),  # Marshall Islands
+    "MR": (20.0, -12.0),  # Mauritania
+    "MU": (-20.28333333, 57.55),  # Mauritius
+    "MX": (23.0, -102.0),  # Mexico
+    "FM": (6.91666666, 158.25),  # Micronesia
+    "MD": (47.0, 29.0),  # Moldova
+    "MC": (43.73333333, 7.4),  # Monaco
+    "MN": (46.0, 105.0),  # Mongolia
+    "ME": (42.7044223, 19.3957785),  # Montenegro
+    "MA": (32.0, -5.0),  # Morocco
+    "MZ": (-18.25, 35.0),  # Mozambique
+    "MM": (19.75, 96.1),  # Myanmar
+    "NA": (-22.0, 17.0),  # Namibia
+    "NR": (-0.53333333, 166.91666666),  # Nauru
+    "NP": (28.0, 84.0),  # Nepal
+    "NL": (52.5, 5.75),  # Netherlands
+    "NZ": (-41.0, 174.0),  # New Zealand
+    "NI": (13.0, -85.0),  # Nicaragua
+    "NE": (16.0, 8.0),  # Niger
+    "NG": (10.0, 8.0),  # Nigeria
+    "MK": (41.83333333, 22.0),  # North Macedonia
+    "NO": (62.0, 10.0),  # Norway
+    "OM": (21.0, 57.0),  # Oman
+    "PK": (30.0, 70.0),  # Pakistan
+    "PW": (7.5, 134.5),  # Palau
+    "PS": (31.9, 35.2),  # Palestine
+    "PA": (9.0, -80.0),  # Panama
+    "PG": (-6.0, 147.0),  # Papua New Guinea
+    "PY": (-23.0, -58.0),  # Paraguay
+    "PE": (-10.0, -76.0),  # Peru
+    "PH": (13.0, 122.0),  # Philippines
+    "PL": (52.0, 20.0),  # Poland
+    "PT": (39.5, -8.0),  # Portugal
+    "QA": (25.5, 51.25),  # Qatar
+    "RO": (46.0, 25.0),  # Romania
+    "RU": (60.0, 100.0),  # Russia
+    "RW": (-2.0, 30.0),  # Rwanda
+    "KN": (17.33333333, -62.75),  # Saint Kitts and Nevis
+    "LC": (13.88333333, -60.96666666),  # Saint Lucia
+    "VC": (13.25, -61.2),  # Saint Vincent and the Grenadines
+    "WS": (-13.58333333, -172.33333333),  # Samoa
+    "SM": (43.76666666, 12.41666666),  # San Marino
+    "ST": (1.0, 7.0),  # Sao Tome and Principe
+    "SA": (25.0, 45.0),  # Saudi Arabia
+    "SN": (14.0, -14.0),  # Senegal
+    "RS": (44.016521, 21.005859),  # Serbia
+    "SC": (-4.58333333, 55.66666666),  # Seychelles
+    "SL": (8.5, -11.5),  # Sierra Leone
+    "SG": (1.36666666, 103.8),  # Singapore
+    "SK": (48.66666666, 19.5),  # Slovakia
+    "SI": (46.11666666, 14.81666666),  # Slovenia
+    "SB": (-8.0, 159.0),  # Solomon Islands
+    "SO": (10.0, 49.0),  # Somalia
+    "ZA": (-29.0, 24.0),  # South Africa
+    "SS": (7.0, 30.0),  # South Sudan
+    "ES": (40.0, -4.0),  # Spain
+    "LK": (7.0, 81.0),  # Sri Lanka
+    "SD": (15.0, 30.0),  # Sudan
+    "SR": (4.0, -56.0),  # Suriname
+    "SE": (62.0, 15.0),  # Sweden
+    "CH": (47.0, 8.0),  # Switzerland
+    "SY": (35.0, 38.0),  # Syria
+    "TW": (23.5, 121.0),  # Taiwan
+    "TJ": (39.0, 71.0),  # Tajikistan
+    "TZ": (-6.0, 35.0),  # Tanzania
+    "TH": (15.0, 100.0),  # Thailand
+    "TL": (-8.83333333, 125.91666666),  # Timor-Leste
+    "TG": (8.0, 1.16666666),  # Togo
+    "TO": (-20.0, -175.0),  # Tonga
+    "TT": (11.0, -61.0),  # Trinidad and Tobago
+    "TN": (34.0, 9.0),  # Tunisia
+    "TR": (39.0, 35.0),  # Turkey
+    "TM": (40.0, 60.0),  # Turkmenistan
+    "TV": (-8.0, 178.0),  # Tuvalu
+    "UG": (1.0, 32.0),  # Uganda
+    "UA": (49.0, 32.0),  # Ukraine
+    "AE": (24.0, 54.0),  # United Arab Emirates
+    "GB": (54.0, -2.0),  # United Kingdom
+    "US": (38.0, -97.0),  # United States
+    "UY": (-33.0, -56.0),  # Uruguay
+    "UZ": (41.0, 64.0),  # Uzbekistan
+    "VU": (-16.0, 167.0),  # Vanuatu
+    "VA": (41.90244, 12.45389),  # Vatican City
+    "VE": (8.0, -66.0),  # Venezuela
+    "VN": (16.16666666, 107.83333333),  # Vietnam
+    "YE": (15.0, 48.0),  # Yemen
+    "ZM": (-15.0, 30.0),  # Zambia
+    "ZW": (-20.0, 30.0),  # Zimbabwe
+}
+
+# Regions that share an ISO code with their country but sit far from its centroid
+REGION_CENTROIDS = {
+    "Alaska (US)": (64.0, -150.0),
+}